@@ -0,0 +1 @@
+"""Shared helpers for the Cultural Canvas India Streamlit pages."""
@@ -0,0 +1,102 @@
+"""ASI visitor statistics, bundled with the app as versioned Parquet files.
+
+The two Archaeological Survey of India tables shown on the Cultural Hotspots
+Map (Table 4.2.1, visitors to centrally protected ticketed monuments per year,
+and Table 4.2.2, the top monuments by visitors) are parsed into typed columns
+once, offline: visitor counts as nullable integers ('N.A' -> <NA>), growth
+rates as floats ('-' -> <NA>) and year labels such as '2016-17*' into a
+numeric ``Start Year``. The pages read the Parquet files as-is.
+
+The files carry the latest fiscal year they cover in their name
+(ASI_DATASET_VERSION). To refresh them from the ASI_VISITOR_TRENDS and
+ASI_TOP_MONUMENTS Snowflake tables, bump the version and run from the repo
+root:
+
+    python -m cultural_canvas.asi_stats
+"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+# --- Configuration ---
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASI_DATASET_VERSION = "2023-24"  # latest fiscal year in the bundled files
+VISITOR_TRENDS_PATH = os.path.join(REPO_ROOT, "data", f"asi_visitor_trends_{ASI_DATASET_VERSION}.parquet")
+TOP_MONUMENTS_PATH = os.path.join(REPO_ROOT, "data", f"asi_top_monuments_{ASI_DATASET_VERSION}.parquet")
+
+VISITOR_COUNT_COLUMNS = ["No. of Centrally Protected Ticketed ASI Monuments", "Domestic Visitors", "Foreign Visitors", "Total Visitors"]
+GROWTH_RATE_COLUMNS = ["Domestic Growth Rate (%)", "Foreign Growth Rate (%)", "Total Growth Rate (%)"]
+VISITOR_TRENDS_COLUMNS = ["Year", "Start Year", *VISITOR_COUNT_COLUMNS, *GROWTH_RATE_COLUMNS]
+TOP_MONUMENTS_COLUMNS = ["Audience", "Rank", "Monument", "Visitors", "% Share", "Summary Row"]
+AUDIENCES = ("Domestic", "Foreign")
+SUMMARY_RANKS = ("Others", "Total")  # rows after the top 10
+
+
+# --- Parsing (offline build step) ---
+def _text(values):
+    return pd.Series(values).reset_index(drop=True).astype(str).str.strip()
+
+def _numbers(values):
+    """Floats from ASI cells ('N.A', '-' and other placeholders -> NaN, thousands separators removed)."""
+    return pd.to_numeric(_text(values).str.replace(",", "", regex=False), errors="coerce")
+
+def parse_visitor_trends(raw):
+    """Typed Table 4.2.1: one row per year label, ordered by its numeric start year."""
+    years = _text(raw["Year"])
+    df = pd.DataFrame({
+        "Year": years.astype("string"),
+        "Start Year": years.str.extract(r"(\d{4})", expand=False).astype("Int64"),  # '2016-17*' -> 2016
+    })
+    for col in VISITOR_COUNT_COLUMNS:
+        df[col] = _numbers(raw[col]).round().astype("Int64")
+    for col in GROWTH_RATE_COLUMNS:
+        df[col] = _numbers(raw[col]).astype("Float64")
+    return df.sort_values("Start Year", kind="stable", ignore_index=True)[VISITOR_TRENDS_COLUMNS]
+
+def parse_top_monuments(raw):
+    """Typed Table 4.2.2 in long form: Audience, Rank label, Monument, Visitors, % Share and a Summary Row flag."""
+    ranks = _text(raw["Rank"])
+    return pd.DataFrame({
+        "Audience": _text(raw["Audience"]).astype("string"),
+        "Rank": ranks.astype("string"),
+        "Monument": _text(raw["Monument"]).astype("string"),
+        "Visitors": _numbers(raw["Visitors"]).round().astype("Int64"),
+        "% Share": _numbers(raw["% Share"]).astype("Float64"),
+        "Summary Row": ranks.isin(SUMMARY_RANKS),
+    }, columns=TOP_MONUMENTS_COLUMNS)
+
+def write_asi_dataset(visitor_trends, top_monuments):
+    """Write both typed tables to their versioned Parquet paths."""
+    os.makedirs(os.path.dirname(VISITOR_TRENDS_PATH), exist_ok=True)
+    visitor_trends.to_parquet(VISITOR_TRENDS_PATH, index=False)
+    top_monuments.to_parquet(TOP_MONUMENTS_PATH, index=False)
+
+def build_asi_dataset():
+    """Parse the ASI tables from Snowflake and rewrite the bundled Parquet files."""
+    from cultural_canvas.data import run_query
+
+    write_asi_dataset(parse_visitor_trends(run_query("asi_visitor_trends")), parse_top_monuments(run_query("asi_top_monuments")))
+
+
+# --- Runtime Loaders ---
+@st.cache_data(show_spinner=False)
+def load_visitor_trends(path=VISITOR_TRENDS_PATH):
+    """Typed visitor trends, oldest year first (empty if the file is missing)."""
+    try:
+        return pd.read_parquet(path)
+    except FileNotFoundError:
+        return pd.DataFrame(columns=VISITOR_TRENDS_COLUMNS)
+
+@st.cache_data(show_spinner=False)
+def load_top_monuments(path=TOP_MONUMENTS_PATH):
+    """{audience: top monuments frame in rank order, summary rows last} (empty frames if the file is missing)."""
+    try:
+        df = pd.read_parquet(path)
+    except FileNotFoundError:
+        df = pd.DataFrame(columns=TOP_MONUMENTS_COLUMNS)
+    return {audience: df[df["Audience"] == audience].reset_index(drop=True) for audience in AUDIENCES}
+
+if __name__ == "__main__":
+    build_asi_dataset()
+    print(f"Wrote {VISITOR_TRENDS_PATH} and {TOP_MONUMENTS_PATH}")
@@ -0,0 +1,161 @@
+"""Read-only home page catalog shared by every session in the process.
+
+The slideshow, top-state, GI art form and festival records used to be rebuilt
+as lists of dicts on every rerun. They are now frozen, slotted records built
+once per catalog version and handed out by reference via st.cache_resource,
+so callers must treat them as immutable (the dataclasses enforce it).
+
+The catalog version comes from the LAST_ALTERED timestamps of the backing
+Snowflake tables: when one of them changes, the next rerun builds a fresh
+catalog. Call invalidate_catalog() to force a rebuild by hand.
+"""
+from dataclasses import dataclass
+
+import streamlit as st
+
+from cultural_canvas.data import UNKNOWN_TABLE_VERSION, table_version
+
+# --- Configuration ---
+HOME_CATALOG_TABLES = ("FESTIVALS_FINAL", "TOURISM_TRENDS")
+CATALOG_VERSION_TTL = 300  # seconds between LAST_ALTERED checks
+STATIC_CATALOG_VERSION = UNKNOWN_TABLE_VERSION  # used when Snowflake can't be reached
+
+
+# --- Records ---
+@dataclass(frozen=True, slots=True)
+class Slide:
+    img_src: str
+    title: str
+    description: str
+    cta_button_text: str
+    cta_link: str
+
+@dataclass(frozen=True, slots=True)
+class CulturalState:
+    state: str
+    visitors: str
+    image: str
+    description: str
+    explore_url: str
+
+@dataclass(frozen=True, slots=True)
+class ArtForm:
+    name: str
+    region: str
+    image: str
+    description: str
+    learn_more_url: str
+
+@dataclass(frozen=True, slots=True)
+class FestivalTemplate:
+    name: str
+    month: int
+    day: int
+    location: str
+    image: str
+    description: str
+
+@dataclass(frozen=True, slots=True)
+class HomeCatalog:
+    version: str
+    slides: tuple
+    top_states: tuple
+    gi_art_forms: tuple
+    festivals: tuple
+
+
+# --- Simulated Database Functions ---
+def get_slideshow_data():
+    """Fetch slideshow data from database (simulated)"""
+    return (
+        Slide(
+            img_src="https://raw.githubusercontent.com/yashgupta17402/hero/main/kathakali.PNG",
+            title="Vibrant Traditions: A Tapestry of Art",
+            description="India's artistic heritage is a kaleidoscope of color, skill, and ancient wisdom. From intricate paintings to mesmerizing dance forms, discover the soul of a nation expressed through its art.",
+            cta_button_text="Explore Art Forms",
+            cta_link="pages/1_≡🌍🎨 Art Forms Explorer.py"
+        ),
+        Slide(
+            img_src="https://raw.githubusercontent.com/yashgupta17402/hero/main/AGRA_FORT.PNG",
+            title="Journey Through Time: Uncover Cultural Hotspots",
+            description="Explore majestic forts, ancient temples, and bustling cultural hubs. Find popular destinations and unearth hidden gems waiting to share their stories.",
+            cta_button_text="Discover Destinations",
+            cta_link="pages/2_≡🎯🗺️🕌 Cultural Hotspots Map.py"
+        ),
+        Slide(
+            img_src="https://raw.githubusercontent.com/yashgupta17402/hero/main/handloom.PNG",
+            title="Travel with Purpose: Embrace Responsible Tourism",
+            description="Be a part of preserving India's cultural treasures. Learn how your travels can support local communities, protect heritage, and ensure these traditions thrive for generations.",
+            cta_button_text="Learn About Responsible Travel",
+            cta_link="pages/4_≡🌍♻️ Responsible Tourism Guide.py"
+        ),
+    )
+
+def get_top_cultural_states():
+    """Fetch top 3 most visited cultural states (simulated) based on 2023 data"""
+    return (
+        CulturalState(
+            state="Uttar Pradesh", visitors="478.5M", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/up.PNG",
+            description="Featuring iconic monuments like the Taj Mahal, the spiritual city of Varanasi, and a rich historical tapestry.", explore_url="https://www.uptourism.gov.in/"
+        ),
+        CulturalState(
+            state="Tamil Nadu", visitors="286.0M", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/tamilnadu.PNG",
+            description="Home to magnificent ancient temples, classical dance forms, vibrant festivals, and rich Dravidian culture.", explore_url="https://www.tamilnadutourism.tn.gov.in/"
+        ),
+        CulturalState(
+            state="Karnataka", visitors="284.1M", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/karnataka.PNG",
+            description="A blend of ancient heritage with stunning palaces like Mysore, vibrant IT hubs, and rich traditions.", explore_url="https://www.karnatakatourism.org/"
+        ),
+    )
+
+def get_all_gi_art_forms():
+    """Fetch all GI-tagged art forms (simulated)"""
+    return (
+        ArtForm(
+            name="Madhubani Painting", region="Bihar", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/madhubani.PNG",
+            description="Characterized by geometric patterns and nature motifs, this ancient art form has been practiced for centuries.", learn_more_url="https://en.wikipedia.org/wiki/Madhubani_art"
+        ),
+        ArtForm(
+            name="Kani Shawls", region="Kashmir", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/kani.PNG",
+            description="It is one of the oldest handicrafts of Kashmir. This craft has been a part of the valley since the time of the Mughals. The shawls are woven from pashmina yarn.", learn_more_url="https://en.wikipedia.org/wiki/Kani_shawl"
+        ),
+        ArtForm(
+            name="Banarasi Silk", region="Uttar Pradesh", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/banaras_1.PNG",
+            description=" Finest traditional sarees in India, renowned for their opulent embroidery and luxurious silk. These sarees are distinguished by their intricate brocade work, often featuring gold (zari) and silver (brocade) threads, woven into elaborate designs", learn_more_url="https://en.wikipedia.org/wiki/Banarasi_sari"
+        ),
+    )
+
+def get_festival_templates():
+    """Fetch major festivals (simulated); month/day is only used for solar-calendar festivals"""
+    return (
+        FestivalTemplate(name="Diwali", month=11, day=1, location="Nationwide", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/diwali.PNG", description="The festival of lights celebrates the victory of light over darkness with lamps, fireworks, and family gatherings."),
+        FestivalTemplate(name="Holi", month=3, day=25, location="Nationwide", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/holi.jpg", description="The colorful spring festival where people throw colored powders and water at each other in joyful celebration."),
+        FestivalTemplate(name="Pongal", month=1, day=14, location="Tamil Nadu", image="https://raw.githubusercontent.com/yashgupta17402/hero/main/pongal.jpg", description="A harvest festival dedicated to the Sun God, featuring elaborate kolam designs and special rice dishes."),
+    )
+
+
+# --- Versioning & Cache ---
+@st.cache_data(ttl=CATALOG_VERSION_TTL, show_spinner=False)
+def catalog_version(tables=HOME_CATALOG_TABLES):
+    """Version token built from the backing tables' LAST_ALTERED timestamps."""
+    return table_version(tables)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_home_catalog(version):
+    """Build the immutable home catalog once per version; shared by reference across sessions."""
+    return HomeCatalog(
+        version=version,
+        slides=get_slideshow_data(),
+        top_states=get_top_cultural_states(),
+        gi_art_forms=get_all_gi_art_forms(),
+        festivals=get_festival_templates(),
+    )
+
+def get_home_catalog():
+    """Current home catalog (rebuilt automatically when the backing tables change)."""
+    return load_home_catalog(catalog_version())
+
+def invalidate_catalog():
+    """Drop the cached version token and catalog so the next call rebuilds both."""
+    catalog_version.clear()
+    load_home_catalog.clear()
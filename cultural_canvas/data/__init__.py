@@ -0,0 +1,29 @@
+"""Snowflake data access: the shared connection, the named-query registry, prefetching and fallbacks."""
+from cultural_canvas.data.client import (
+    UNKNOWN_TABLE_VERSION,
+    bind_list,
+    fetch_arrow,
+    get_connection,
+    load_or_fallback,
+    prefetch_all,
+    run_query,
+    table_version,
+    warm_query_caches,
+)
+from cultural_canvas.data.queries import QUERIES, Query, get_query, register_query
+
+__all__ = [
+    "QUERIES",
+    "Query",
+    "UNKNOWN_TABLE_VERSION",
+    "bind_list",
+    "fetch_arrow",
+    "get_connection",
+    "get_query",
+    "load_or_fallback",
+    "prefetch_all",
+    "register_query",
+    "run_query",
+    "table_version",
+    "warm_query_caches",
+]
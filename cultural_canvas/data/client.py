@@ -0,0 +1,198 @@
+"""Snowflake access shared by every page.
+
+st.connection() caches the connection as a process-wide resource, so all
+sessions and pages reuse one Snowflake connection (the connector is
+thread-safe at the connection level). There is no pool: queries from
+concurrent sessions share that one connection. Query results are cached by
+Streamlit per (sql, params, ttl), which is what prefetch_all() warms.
+
+Queries registered with source tables or max_entries get their own
+ResultCache instead, an LRU of results that expire after the query's TTL.
+Results of table-backed queries are keyed on the tables' current version as
+well, so they are refetched as soon as a table changes. Every table_version()
+is derived from one cached snapshot of LAST_ALTERED, so a page that takes
+the version before loading rows never gets rows older than that version.
+
+Loaders of per-version resources raise instead of caching degraded data and
+are called through load_or_fallback(), which serves their fallback for
+FALLBACK_RETRY_INTERVAL after a failure before trying Snowflake again.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+
+from cultural_canvas.data.queries import QUERIES, VERSIONED_CACHE_ENTRIES, get_query
+
+# --- Configuration ---
+CONNECTION_NAME = "snowflake"
+UNKNOWN_TABLE_VERSION = "static"  # used when Snowflake can't be reached
+WARMUP_RETRY_INTERVAL = 300  # seconds before a warm-up with failed queries is tried again
+FALLBACK_RETRY_INTERVAL = 300  # seconds a failed load is served its fallback before it is tried again
+
+
+# --- Connection ---
+def get_connection():
+    """The process-wide Snowflake connection (created on first use)."""
+    return st.connection(CONNECTION_NAME)
+
+
+# --- Queries ---
+class ResultCache:
+    """Thread-safe LRU cache of query results, bounded to `max_entries` and expiring after `ttl` seconds."""
+    __slots__ = ("max_entries", "ttl", "_entries", "_lock")
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (stored at, frame), least recently used first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_fetch(self, key, fetch):
+        """A copy of the cached result for `key`, calling fetch() on a miss (errors are not cached)."""
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and time.monotonic() - hit[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return hit[1].copy()  # callers may modify the frame, as with st.cache_data
+        df = fetch()  # outside the lock: a slow query doesn't block other keys
+        with self._lock:
+            self._entries[key] = (time.monotonic(), df)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return df.copy()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+_result_caches = {}
+_result_caches_lock = threading.Lock()
+
+def _fetch_pandas(sql, params):
+    cursor = get_connection().cursor()
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetch_pandas_all()
+    finally:
+        cursor.close()
+
+def result_cache(query):
+    """The process-wide ResultCache of a query registered with tables or max_entries."""
+    with _result_caches_lock:
+        if query.name not in _result_caches:
+            _result_caches[query.name] = ResultCache(query.max_entries or VERSIONED_CACHE_ENTRIES, query.ttl)
+        return _result_caches[query.name]
+
+def bind_list(values, prefix="v"):
+    """(placeholders, params) binding each of `values` as its own parameter, for an IN ({placeholders}) list."""
+    params = {f"{prefix}{i}": value for i, value in enumerate(values)}
+    return ", ".join(f"%({key})s" for key in params), params
+
+def run_query(name, params=None, ttl=None, placeholders=None):
+    """Run the registered query `name` and return a DataFrame (cached for the query's TTL, and per table version).
+
+    `placeholders` fills the query's ``{placeholders}`` slot (see bind_list()).
+    Queries with tables or max_entries always use their registered TTL.
+    """
+    query = get_query(name)
+    if query.arrow:
+        raise ValueError(f"Query '{name}' is fetched as Arrow; use fetch_arrow()")
+    sql = query.sql if placeholders is None else query.sql.format(placeholders=placeholders)
+    if query.tables or query.max_entries is not None:
+        version = table_version(query.tables) if query.tables else None
+        key = (version, sql, tuple(sorted((params or {}).items())))
+        return result_cache(query).get_or_fetch(key, lambda: _fetch_pandas(sql, params))
+    return get_connection().query(sql, params=params, ttl=query.ttl if ttl is None else ttl, show_spinner=False)
+
+def fetch_arrow(name, params=None):
+    """Run the registered query `name` and return its result as a pyarrow Table (uncached; None if no rows)."""
+    query = get_query(name)
+    cursor = get_connection().cursor()
+    try:
+        cursor.execute(query.sql, params)
+        return cursor.fetch_arrow_all()
+    finally:
+        cursor.close()
+
+def table_version(tables):
+    """Version token built from the tables' LAST_ALTERED timestamps (UNKNOWN_TABLE_VERSION if none are found)."""
+    try:
+        df = run_query("table_versions")  # every table at once, cached for TABLE_VERSION_TTL
+    except Exception:
+        return UNKNOWN_TABLE_VERSION
+    df = df[df["TABLE_NAME"].isin(tables)]
+    if df.empty:
+        return UNKNOWN_TABLE_VERSION
+    return "|".join(f"{row.TABLE_NAME}@{row.LAST_ALTERED}" for row in df.itertuples(index=False))
+
+
+# --- Fallbacks ---
+_fallback_lock = threading.Lock()
+_failed_loads = {}  # name -> (failed at, error)
+
+def load_or_fallback(name, load, fallback, errors=(Exception,)):
+    """(result, error): load(), or fallback() with the error it raised.
+
+    load() is expected to cache its own result (e.g. a st.cache_resource keyed on
+    table version) and to raise rather than cache a degraded one. After a failure,
+    calls within FALLBACK_RETRY_INTERVAL seconds go straight to fallback(), so
+    reruns during an outage don't wait on Snowflake again.
+    """
+    with _fallback_lock:
+        failure = _failed_loads.get(name)
+    if failure is not None and time.monotonic() - failure[0] < FALLBACK_RETRY_INTERVAL:
+        return fallback(), failure[1]
+    try:
+        result = load()
+    except errors as e:
+        with _fallback_lock:
+            _failed_loads[name] = (time.monotonic(), e)
+        return fallback(), e
+    with _fallback_lock:
+        _failed_loads.pop(name, None)
+    return result, None
+
+
+# --- Prefetch ---
+def prefetch_all():
+    """Run every registered query marked for prefetch; returns {name: row count or error message}."""
+    results = {}
+    for name, query in QUERIES.items():
+        if not query.prefetch:
+            continue
+        try:
+            results[name] = len(run_query(name))
+        except Exception as e:
+            results[name] = f"error: {e}"
+    return results
+
+_warmup_lock = threading.Lock()
+_warmup_state = {"complete": False, "last_attempt": None, "results": {}}
+
+def warm_query_caches():
+    """prefetch_all() once per process, called at the end of every page so later visitors hit warm caches.
+
+    Returns the last {name: row count or error message}. A warm-up with failed
+    queries is retried on a later call, at most every WARMUP_RETRY_INTERVAL
+    seconds; calls made while another session is warming up return at once.
+    """
+    now = time.monotonic()
+    if _warmup_state["complete"] or (
+        _warmup_state["last_attempt"] is not None and now - _warmup_state["last_attempt"] < WARMUP_RETRY_INTERVAL
+    ):
+        return _warmup_state["results"]
+    if not _warmup_lock.acquire(blocking=False):
+        return _warmup_state["results"]
+    try:
+        _warmup_state["last_attempt"] = now
+        results = prefetch_all()
+        _warmup_state.update(results=results, complete=all(isinstance(result, int) for result in results.values()))
+        return results
+    finally:
+        _warmup_lock.release()
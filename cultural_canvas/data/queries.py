@@ -0,0 +1,212 @@
+"""Registry of the named Snowflake queries used by the app.
+
+Every page fetches through a name from QUERIES instead of carrying its own
+SQL string, so TTLs live in one place and prefetch_all() knows which tables
+to warm. Parameters use the connector's pyformat style (``%(name)s``);
+queries taking a variable-length list have a ``{placeholders}`` slot that
+run_query() fills from bind_list().
+
+Queries that name their source ``tables`` are cached per table version (see
+table_version()): a change to a table is picked up as soon as its version
+changes, rather than when the query's TTL runs out, so resources that pages
+build once per version never start from rows older than that version.
+"""
+from dataclasses import dataclass
+
+# --- Configuration ---
+DEFAULT_TTL = 3600  # seconds
+TABLE_VERSION_TTL = 300
+VERSIONED_CACHE_ENTRIES = 2  # results kept per table-versioned query: the current version and the one before
+FESTIVAL_CARDS_CACHE_ENTRIES = 256
+
+
+@dataclass(frozen=True, slots=True)
+class Query:
+    name: str
+    sql: str
+    ttl: int = DEFAULT_TTL
+    prefetch: bool = True  # warmed by prefetch_all() at startup
+    arrow: bool = False  # fetched as Arrow batches via fetch_arrow()
+    max_entries: int | None = None  # LRU bound on cached parameter sets (None: unbounded, st.connection's cache)
+    tables: tuple = ()  # source tables; results are cached per their table version
+
+
+QUERIES = {}
+
+def register_query(name, sql, ttl=DEFAULT_TTL, prefetch=True, arrow=False, max_entries=None, tables=()):
+    """Add a named query to the registry (re-registering a name replaces it)."""
+    QUERIES[name] = Query(name=name, sql=sql, ttl=ttl, prefetch=prefetch, arrow=arrow, max_entries=max_entries, tables=tuple(tables))
+    return QUERIES[name]
+
+def get_query(name):
+    try:
+        return QUERIES[name]
+    except KeyError:
+        raise KeyError(f"Unknown query '{name}'. Registered queries: {', '.join(sorted(QUERIES))}") from None
+
+
+# --- Home ---
+register_query("tourism_trends", """
+    SELECT
+        YEAR::NUMBER(38, 0) AS YEAR,
+        DOMESTIC_TOURIST_VISITS::NUMBER(38, 0) AS DOMESTIC_TOURIST_VISITS,
+        FOREIGN_TOURIST_VISITS::NUMBER(38, 0) AS FOREIGN_TOURIST_VISITS,
+        ANNUAL_GROWTH_RATE_DOMESTIC::FLOAT AS ANNUAL_GROWTH_RATE_DOMESTIC,
+        ANNUAL_GROWTH_RATE_FOREIGN::FLOAT AS ANNUAL_GROWTH_RATE_FOREIGN
+    FROM CULTURE_HERITAGE.PUBLIC.TOURISM_TRENDS
+    ORDER BY YEAR ASC;
+""", prefetch=False, arrow=True)  # loaded by home.py itself on the same first visit
+
+# --- Art Forms Explorer ---
+register_query("crafts", """
+    SELECT
+        "CRAFT" AS CRAFT_NAME_SF,
+        "DESCRIPTION" AS CRAFT_DESCRIPTION_SF,
+        "STATE" AS CRAFT_STATE_SF,
+        "DISTRICT" AS CRAFT_DISTRICT_SF,
+        "SUB_DISTRICT" AS CRAFT_VILLAGE_SF,
+        "IMAGE_URL" AS CRAFT_IMAGE_URL_SF
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."CRAFT_IMAGE";
+""", tables=("CRAFT_IMAGE",))
+
+register_query("craft_places", """
+    SELECT DISTINCT "STATE", "DISTRICT", "SUB_DISTRICT"
+    FROM "CULTURE_HERITAGE"."PUBLIC"."CRAFT_IMAGE";
+""", prefetch=False, tables=("CRAFT_IMAGE",))  # only used by the offline coordinate store build (cultural_canvas.geo)
+
+register_query("dances", """
+    SELECT
+        "DANCE" AS DANCE_NAME_SF,
+        "REGION_STATE" AS DANCE_REGION_STATE,
+        "DESCRIPTION" AS DANCE_DESC,
+        "IMAGE_URL" AS DANCE_IMAGE_URL_SF
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."DANCE_FINAL"
+    WHERE "DANCE" <> 'Dance';  -- excludes the header row that was loaded as data
+""", tables=("DANCE_FINAL",))
+
+# --- Cultural Hotspots Map ---
+register_query("unesco_sites", """
+    SELECT
+        NAME AS "Name",
+        CITY AS "City",
+        DISTRICT AS "District",
+        STATE_UT AS "State/UT",
+        DESCRIPTION AS "Short Description",
+        LATITUDE AS "Latitude",
+        LONGITUDE AS "Longitude"
+    FROM UNESCO_INDIA_SITES;
+""", tables=("UNESCO_INDIA_SITES",))
+
+register_query("asi_visitor_trends", """
+    SELECT
+        "YEAR" AS "Year",
+        "TICKETED_MONUMENTS" AS "No. of Centrally Protected Ticketed ASI Monuments",
+        "DOMESTIC_VISITORS" AS "Domestic Visitors",
+        "FOREIGN_VISITORS" AS "Foreign Visitors",
+        "TOTAL_VISITORS" AS "Total Visitors",
+        "DOMESTIC_GROWTH_RATE" AS "Domestic Growth Rate (%)",
+        "FOREIGN_GROWTH_RATE" AS "Foreign Growth Rate (%)",
+        "TOTAL_GROWTH_RATE" AS "Total Growth Rate (%)"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."ASI_VISITOR_TRENDS";
+""", prefetch=False)  # only used by the offline ASI dataset build (cultural_canvas.asi_stats)
+
+register_query("asi_top_monuments", """
+    SELECT
+        "AUDIENCE" AS "Audience",  -- 'Domestic' or 'Foreign'
+        "RANK" AS "Rank",          -- '1'..'10', 'Others', 'Total'
+        "MONUMENT" AS "Monument",
+        "VISITORS" AS "Visitors",
+        "SHARE_PCT" AS "% Share"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."ASI_TOP_MONUMENTS"
+    ORDER BY "AUDIENCE", "ROW_ORDER";
+""", prefetch=False)  # only used by the offline ASI dataset build (cultural_canvas.asi_stats)
+
+# --- Discover Festivals & home upcoming festivals ---
+register_query("festivals", """
+    SELECT
+        "STATE",
+        "FESTIVAL_NAME",
+        "TIME_OF_YEAR",
+        "SHORT_DESCRIPTION",
+        "IMAGE_URL"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."FESTIVALS_FINAL"
+    WHERE "FESTIVAL_NAME" IS NOT NULL;
+""", tables=("FESTIVALS_FINAL",))
+
+# --- Discover Festivals ---
+# The page filters and searches a slim catalog, then fetches descriptions and
+# images only for the cards on screen.
+register_query("festival_catalog", """
+    SELECT
+        "STATE",
+        "FESTIVAL_NAME",
+        "TIME_OF_YEAR"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."FESTIVALS_FINAL"
+    WHERE "FESTIVAL_NAME" IS NOT NULL;
+""", tables=("FESTIVALS_FINAL",))
+
+register_query("festival_cards", """
+    SELECT
+        "STATE",
+        "FESTIVAL_NAME",
+        "SHORT_DESCRIPTION",
+        "IMAGE_URL"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."FESTIVALS_FINAL"
+    WHERE "FESTIVAL_NAME" IN ({placeholders});
+""", prefetch=False, max_entries=FESTIVAL_CARDS_CACHE_ENTRIES, tables=("FESTIVALS_FINAL",))  # one entry per (filters, page) visited
+
+# --- Government Impact Dashboard ---
+# Loaded once per table version by the page; it falls back to seeded simulated
+# figures while these tables don't exist (cultural_canvas.government_impact).
+register_query("government_funding", """
+    SELECT
+        "STATE" AS "state",
+        "SCHEME" AS "scheme",
+        "OBJECTIVE" AS "objective",  -- comma-separated, e.g. 'Preservation, Research'
+        "YEAR"::NUMBER(38, 0) AS "year",
+        "FUNDING_LAKHS"::NUMBER(38, 0) AS "funding_lakhs",
+        "UTILIZATION_PERCENTAGE"::NUMBER(38, 0) AS "utilization_percentage",
+        "BENEFICIARIES"::NUMBER(38, 0) AS "beneficiaries"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."GOVERNMENT_FUNDING";
+""", prefetch=False, tables=("GOVERNMENT_FUNDING",))
+
+register_query("artisan_registrations", """
+    SELECT
+        "STATE" AS "state",
+        "YEAR"::NUMBER(38, 0) AS "year",
+        "REGISTERED_ARTISANS"::NUMBER(38, 0) AS "registered_artisans",
+        "WOMEN_PERCENTAGE"::NUMBER(38, 0) AS "women_percentage",
+        "DIGITAL_PERCENTAGE"::NUMBER(38, 0) AS "digital_percentage"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."ARTISAN_REGISTRATIONS";
+""", prefetch=False, tables=("ARTISAN_REGISTRATIONS",))
+
+register_query("tourism_impact", """
+    SELECT
+        "STATE" AS "state",
+        "YEAR"::NUMBER(38, 0) AS "year",
+        "TOURISM_REVENUE_CRORES"::NUMBER(38, 0) AS "tourism_revenue_crores",
+        "TOURISM_EMPLOYMENT"::NUMBER(38, 0) AS "tourism_employment",
+        "TOURIST_ARRIVALS"::NUMBER(38, 0) AS "tourist_arrivals",
+        "CULTURAL_TOURISM_PERCENTAGE"::NUMBER(38, 0) AS "cultural_tourism_percentage"
+    FROM
+        "CULTURE_HERITAGE"."PUBLIC"."TOURISM_IMPACT";
+""", prefetch=False, tables=("TOURISM_IMPACT",))
+
+# --- Change tracking ---
+# One snapshot of every table, so the versions of different table sets taken
+# within TABLE_VERSION_TTL agree with each other.
+register_query("table_versions", """
+    SELECT TABLE_NAME, LAST_ALTERED
+    FROM CULTURE_HERITAGE.INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_SCHEMA = 'PUBLIC'
+    ORDER BY TABLE_NAME;
+""", ttl=TABLE_VERSION_TTL, prefetch=False)
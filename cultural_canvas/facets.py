@@ -0,0 +1,73 @@
+"""Facet index: one boolean row mask per (column, value), built once per catalog.
+
+Filtering by several facets is an AND of precomputed masks, and the count
+for every value of a facet under the other selections is a single matrix
+reduction, so the selectors can show live counts without scanning the frame.
+"""
+import numpy as np
+import pandas as pd
+
+# --- Configuration ---
+MISSING_FACET_VALUES = frozenset({"", "N/A", "None", "nan"})  # not offered as filter options
+
+
+class FacetIndex:
+    """Per-column value lists, a (values x rows) boolean matrix and row positions per value."""
+    __slots__ = ("_size", "_values", "_masks", "_positions")
+
+    def __init__(self, df, columns):
+        self._size = len(df)
+        self._values = {}
+        self._masks = {}
+        self._positions = {}
+        for col in columns:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col].astype(str).str.strip())
+            code_of = {str(u): code for code, u in enumerate(uniques)}
+            values = sorted(u for u in code_of if u not in MISSING_FACET_VALUES)
+            row_for_code = np.full(len(uniques) + 1, -1, dtype=np.int64)  # last slot: NaN codes (-1)
+            for row, value in enumerate(values):
+                row_for_code[code_of[value]] = row
+            matrix = np.zeros((len(values), self._size), dtype=bool)
+            value_rows = row_for_code[codes]
+            keep = value_rows >= 0
+            matrix[value_rows[keep], np.flatnonzero(keep)] = True
+            self._values[col] = values
+            self._masks[col] = matrix
+            self._positions[col] = {value: np.flatnonzero(row) for value, row in zip(values, matrix)}
+
+    def __len__(self):
+        return self._size
+
+    def values(self, col):
+        """Sorted filterable values of `col`."""
+        return self._values.get(col, [])
+
+    def mask(self, col, value):
+        """Rows where `col` == `value` (all rows when `value` is None or not a known value)."""
+        values = self._values.get(col, [])
+        if value is None or value not in values:
+            return np.ones(self._size, dtype=bool)
+        return self._masks[col][values.index(value)]
+
+    def positions(self, col, value):
+        """Row positions (ascending) where `col` == `value`; empty for an unknown value."""
+        return self._positions.get(col, {}).get(value, np.empty(0, dtype=np.int64))
+
+    def select(self, selections, within=None):
+        """AND of the masks for {col: value} (None values are ignored), optionally within another mask."""
+        result = np.ones(self._size, dtype=bool) if within is None else within.copy()
+        for col, value in selections.items():
+            if value is not None:
+                result &= self.mask(col, value)
+        return result
+
+    def counts(self, col, within=None):
+        """{value: matching rows} for every value of `col`, restricted to the `within` mask."""
+        values = self._values.get(col, [])
+        if not values:
+            return {}
+        matrix = self._masks[col]
+        totals = matrix.sum(axis=1) if within is None else (matrix & within).sum(axis=1)
+        return dict(zip(values, totals.tolist()))
@@ -0,0 +1,358 @@
+"""Upcoming-festival index over FESTIVALS_FINAL, festivals.csv and the home catalog.
+
+Every festival is resolved to concrete Gregorian dates for a window of years
+(lunar festivals from LUNAR_FESTIVAL_DATES, fixed-date festivals from their
+month/day, everything else, and lunar festivals in years missing from the
+table, from the month named in TIME_OF_YEAR). The
+occurrences are kept sorted by date, overall and per state, so "next N
+festivals after D (in state S)" is a bisect plus a short forward scan.
+
+TIME_OF_YEAR is parsed once, when the rows are loaded, into typed month
+columns (START_MONTH, END_MONTH, a 12-bit MONTH_MASK of the months covered,
+and LUNAR_MONTHS when the text names Hindu lunar months). FestivalMonthIndex
+turns the masks into a (month x row) matrix with per-state rows, so "in March
+in Rajasthan" and the month/state heatmap are mask lookups.
+"""
+import bisect
+import calendar
+import os
+import re
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cultural_canvas.data import load_or_fallback, run_query
+from cultural_canvas.facets import FacetIndex
+
+# --- Configuration ---
+FESTIVALS_CSV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pages", "festivals.csv")
+NATIONWIDE = "Nationwide"
+FESTIVAL_TABLES = ("FESTIVALS_FINAL",)
+FESTIVAL_INDEX_YEARS = 3  # the upcoming-festival index covers this year and the next two
+UNKNOWN_STATE = ""  # only listed when no state filter is applied
+
+# Gregorian dates of lunisolar festivals (main day), from the published panchang.
+# Extend as new years are published: FESTIVAL_INDEX_YEARS ahead of the current
+# year must be covered (tests/test_festival_calendar.py checks it). A year that
+# is missing falls back to the festival's month, shown as approximate.
+LUNAR_FESTIVAL_DATES = {
+    "Holi": {2025: (3, 14), 2026: (3, 4), 2027: (3, 22), 2028: (3, 11), 2029: (3, 1), 2030: (3, 20)},
+    "Diwali": {2025: (10, 20), 2026: (11, 8), 2027: (10, 29), 2028: (10, 17), 2029: (11, 5), 2030: (10, 26)},
+    "Dussehra": {2025: (10, 2), 2026: (10, 20), 2027: (10, 9), 2028: (9, 27), 2029: (10, 16), 2030: (10, 6)},
+    "Ganesh Chaturthi": {2025: (8, 27), 2026: (9, 14), 2027: (9, 4), 2028: (8, 23), 2029: (9, 11), 2030: (9, 1)},
+    "Maha Shivratri": {2025: (2, 26), 2026: (2, 15), 2027: (3, 6), 2028: (2, 23), 2029: (2, 11), 2030: (3, 2)},
+    "Basant Panchami": {2025: (2, 2), 2026: (1, 23), 2027: (2, 11), 2028: (1, 31), 2029: (1, 19), 2030: (2, 7)},
+    "Rath Yatra": {2025: (6, 27), 2026: (7, 16), 2027: (7, 5), 2028: (6, 24), 2029: (7, 13), 2030: (7, 2)},
+    "Dev Deepawali": {2025: (11, 5), 2026: (11, 24), 2027: (11, 13), 2028: (11, 1), 2029: (11, 20), 2030: (11, 9)},
+}
+# FESTIVALS_FINAL names that fall on one of the lunar festivals above
+LUNAR_FESTIVAL_ALIASES = {
+    "Braj Holi": "Holi",
+    "Bastar Dussehra": "Dussehra",
+    "Mandi Shivratri": "Maha Shivratri",
+    "Rath Yatra of Baripada": "Rath Yatra",
+}
+
+MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+MONTHS.update({abbr.lower(): i for i, abbr in enumerate(calendar.month_abbr) if abbr})
+MONTHS["sept"] = 9
+# Hindu lunar months mapped to the Gregorian month they mostly start in
+LUNAR_MONTHS = {
+    "chaitra": 3, "vaishakh": 4, "baisakh": 4, "jyeshtha": 5, "jeth": 5, "ashadh": 6, "asadh": 6,
+    "shravan": 7, "sawan": 7, "bhadrapad": 8, "bhadon": 8, "ashvin": 9, "ashwin": 9, "kartik": 10,
+    "margashirsha": 11, "agrahayan": 11, "paush": 12, "pausha": 12, "poush": 12, "magh": 1, "phalgun": 2,
+}
+# Seasons as (first month, last month); ranges may wrap around the year end
+SEASON_MONTHS = {
+    "spring": (2, 3), "summer": (4, 6), "monsoon": (7, 9), "autumn": (10, 11), "winter": (12, 2),
+}
+RANGE_CONNECTORS = frozenset({"-", "–", "—", "/", "to", "till", "until", "through"})
+# Month names that are also common English words ('it may fall in March'); read as
+# a month only when capitalised or next to a range connector ('april-may')
+AMBIGUOUS_MONTH_WORDS = frozenset({"may"})
+MONTH_COLUMNS = ["START_MONTH", "END_MONTH", "MONTH_MASK", "LUNAR_MONTHS"]
+_TIME_OF_YEAR_TOKEN = re.compile(r"[a-z]+|[-–—/]", re.IGNORECASE)
+
+
+# --- Records ---
+@dataclass(frozen=True, slots=True)
+class FestivalOccurrence:
+    date: date
+    name: str
+    state: str
+    description: str
+    image: str
+    approximate: bool  # True when only the month is known
+
+    @property
+    def location(self):
+        return self.state or "India"
+
+    @property
+    def date_label(self):
+        return self.date.strftime("%B %Y") if self.approximate else self.date.strftime("%B %d, %Y")
+
+
+class FestivalCalendarIndex:
+    """Date-sorted festival occurrences with per-state views for O(log n) lookups."""
+    __slots__ = ("_ordinals", "_occurrences", "_by_state")
+
+    def __init__(self, occurrences):
+        occurrences = sorted(occurrences, key=lambda o: (o.date, o.approximate, o.name))
+        self._occurrences = tuple(occurrences)
+        self._ordinals = [o.date.toordinal() for o in occurrences]
+        by_state = {}
+        for occ in occurrences:
+            by_state.setdefault(occ.state, []).append(occ)
+        nationwide = by_state.get(NATIONWIDE, [])
+        self._by_state = {}
+        for state, state_occurrences in by_state.items():
+            merged = state_occurrences if state in (NATIONWIDE, UNKNOWN_STATE) else sorted(state_occurrences + nationwide, key=lambda o: (o.date, o.approximate, o.name))
+            self._by_state[state] = ([o.date.toordinal() for o in merged], tuple(merged))
+
+    def __len__(self):
+        return len(self._occurrences)
+
+    @property
+    def states(self):
+        return sorted(s for s in self._by_state if s not in (NATIONWIDE, UNKNOWN_STATE))
+
+    def upcoming(self, after, n=5, state=None):
+        """Next `n` distinct festivals on or after `after` (optionally in `state`, nationwide ones included)."""
+        if state:
+            ordinals, occurrences = self._by_state.get(state, self._by_state.get(NATIONWIDE, ([], ())))
+        else:
+            ordinals, occurrences = self._ordinals, self._occurrences
+        start = bisect.bisect_left(ordinals, after.toordinal())
+        results, seen = [], set()
+        for occ in occurrences[start:]:
+            if occ.name in seen:
+                continue
+            seen.add(occ.name)
+            results.append(occ)
+            if len(results) >= n:
+                break
+        return results
+
+
+class FestivalMonthIndex:
+    """(12 x rows) month matrix and per-state row masks over festival rows with month columns."""
+    __slots__ = ("rows", "_months", "_states")
+
+    def __init__(self, festival_rows):
+        self.rows = festival_rows.reset_index(drop=True)
+        masks = self.rows["MONTH_MASK"].fillna(0).astype(np.int64).to_numpy()
+        self._months = ((masks[None, :] >> np.arange(12)[:, None]) & 1).astype(bool)
+        self._states = FacetIndex(self.rows, ["STATE"])
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def states(self):
+        return [s for s in self._states.values("STATE") if s != NATIONWIDE]
+
+    def mask(self, month=None, state=None):
+        """Rows held in `month` (1-12) and in `state` (nationwide festivals included); None means any."""
+        result = np.ones(len(self.rows), dtype=bool)
+        if month is not None:
+            result &= self._months[month - 1]
+        if state is not None:
+            in_state = np.zeros(len(self.rows), dtype=bool)
+            in_state[self._states.positions("STATE", state)] = True
+            in_state[self._states.positions("STATE", NATIONWIDE)] = True
+            result &= in_state
+        return result
+
+    def positions(self, month=None, state=None):
+        """Row positions (ascending) for mask(month, state)."""
+        return np.flatnonzero(self.mask(month, state))
+
+    def month_totals(self, state=None, within=None):
+        """[festivals in Jan..Dec] in `state` (None: any), optionally within a row mask; for live selector counts."""
+        rows = self.mask(state=state) if within is None else self.mask(state=state) & within
+        return self._months[:, rows].sum(axis=1).tolist()
+
+    def state_totals(self, month=None, within=None):
+        """{state: festivals held there in `month` (None: any), nationwide ones included}, optionally within a row mask."""
+        rows = self.mask(month=month) if within is None else self.mask(month=month) & within
+        nationwide = int(rows[self._states.positions("STATE", NATIONWIDE)].sum())
+        return {state: int(rows[self._states.positions("STATE", state)].sum()) + nationwide for state in self.states}
+
+    def month_counts(self, within=None):
+        """{state: [festivals in Jan..Dec]} for every state (and Nationwide), optionally within a row mask."""
+        counts = {}
+        for state in self._states.values("STATE"):
+            state_rows = self._states.positions("STATE", state)
+            if within is not None:
+                state_rows = state_rows[within[state_rows]]
+            counts[state] = self._months[:, state_rows].sum(axis=1).tolist()
+        return counts
+
+
+# --- TIME_OF_YEAR Parsing ---
+def _month_of_word(word):
+    """(month, lunar) for a Gregorian or Hindu lunar month name, or None."""
+    if word in MONTHS:
+        return MONTHS[word], False
+    for lunar_name, month in LUNAR_MONTHS.items():
+        if word.startswith(lunar_name):
+            return month, True
+    return None
+
+def _reads_as_month(tokens, i):
+    """Whether the ambiguous word tokens[i] names a month rather than being ordinary English."""
+    neighbours = {tokens[j].lower() for j in (i - 1, i + 1) if 0 <= j < len(tokens)}
+    return not tokens[i].islower() or bool(neighbours & RANGE_CONNECTORS)
+
+def _months_between(first, last):
+    """Months first..last inclusive, wrapping past December."""
+    return [(first - 1 + i) % 12 + 1 for i in range((last - first) % 12 + 1)]
+
+def parse_time_of_year(text):
+    """(start month, end month, month mask, lunar) for a TIME_OF_YEAR string; months are 1-12.
+
+    'June-July' and 'Chaitra to Vaishakh' are ranges, 'January and April' two
+    separate months, seasons ('winter') their usual months; a lowercase 'may' in
+    running text is not read as May. Bit m-1 of the mask is set for every month m
+    covered. (None, None, 0, False) when no month is named.
+    """
+    if not isinstance(text, str):
+        return None, None, 0, False
+    months, lunar, pending_range = [], False, False
+    tokens = _TIME_OF_YEAR_TOKEN.findall(text)
+    for i, token in enumerate(tokens):
+        token = token.lower()
+        if token in AMBIGUOUS_MONTH_WORDS and not _reads_as_month(tokens, i):
+            continue
+        if token in RANGE_CONNECTORS:
+            pending_range = bool(months)
+            continue
+        if token in SEASON_MONTHS:
+            months.extend(_months_between(*SEASON_MONTHS[token]))
+        elif (match := _month_of_word(token)) is not None:
+            month, is_lunar = match
+            lunar = lunar or is_lunar
+            months.extend(_months_between(months[-1], month)[1:] if pending_range else [month])
+        else:
+            continue  # other words ('mid', 'late') keep a pending range open
+        pending_range = False
+    if not months:
+        return None, None, 0, False
+    return months[0], months[-1], sum(1 << (month - 1) for month in set(months)), lunar
+
+def with_month_columns(festival_rows):
+    """Copy of `festival_rows` with the typed month columns parsed from TIME_OF_YEAR (each distinct text parsed once)."""
+    texts = festival_rows["TIME_OF_YEAR"]
+    parsed = {text: parse_time_of_year(text) for text in texts.dropna().unique()}
+    columns = list(zip(*(parsed.get(text, (None, None, 0, False)) if pd.notna(text) else (None, None, 0, False) for text in texts))) or [[], [], [], []]
+    df = festival_rows.copy()
+    df["START_MONTH"] = pd.array(columns[0], dtype="Int64")
+    df["END_MONTH"] = pd.array(columns[1], dtype="Int64")
+    df["MONTH_MASK"] = np.array(columns[2], dtype=np.int64)
+    df["LUNAR_MONTHS"] = np.array(columns[3], dtype=bool)
+    return df
+
+
+# --- Date Resolution ---
+def resolve_dates(name, years, month=None, day=None):
+    """[(date, approximate)] for `name` in each of `years` that can be resolved.
+
+    Lunar festivals use LUNAR_FESTIVAL_DATES; in a year the table doesn't cover
+    they fall back to `month` alone (approximate), since their `day` is not fixed.
+    """
+    lunar_dates = LUNAR_FESTIVAL_DATES.get(LUNAR_FESTIVAL_ALIASES.get(name, name))
+    if lunar_dates is not None:
+        day = None
+    resolved = []
+    for year in years:
+        if lunar_dates is not None and year in lunar_dates:
+            resolved.append((date(year, *lunar_dates[year]), False))
+            continue
+        if month is None:
+            continue
+        try:
+            resolved.append((date(year, month, day or 1), day is None))
+        except ValueError:
+            continue  # e.g. Feb 29 outside a leap year
+    return resolved
+
+
+# --- Data Loading ---
+@st.cache_data(ttl=3600, max_entries=2, show_spinner=False)
+def load_festival_rows(version):
+    """FESTIVALS_FINAL rows with month columns from Snowflake.
+
+    `version` is a table_version() covering FESTIVALS_FINAL, taken before the call,
+    so a cached frame never outlives the table version it was loaded under. Raises
+    when the query fails, so no fallback is ever cached under a real version.
+    """
+    return with_month_columns(run_query("festivals"))
+
+@st.cache_data(show_spinner=False)
+def load_bundled_festival_rows():
+    """The bundled festivals.csv name list (no states or months), used while FESTIVALS_FINAL can't be read."""
+    try:
+        names = pd.read_csv(FESTIVALS_CSV_PATH)["Festival Name"]
+    except (FileNotFoundError, KeyError):
+        return with_month_columns(pd.DataFrame(columns=["STATE", "FESTIVAL_NAME", "TIME_OF_YEAR", "SHORT_DESCRIPTION", "IMAGE_URL"]))
+    return with_month_columns(pd.DataFrame({"STATE": None, "FESTIVAL_NAME": names, "TIME_OF_YEAR": None, "SHORT_DESCRIPTION": None, "IMAGE_URL": None}))
+
+def build_festival_index(festival_rows, templates, years):
+    """Resolve every festival row and catalog template to dates in `years` and index them."""
+    occurrences = []
+    for template in templates:
+        for day, approximate in resolve_dates(template.name, years, template.month, template.day):
+            occurrences.append(FestivalOccurrence(day, template.name, template.location, template.description, template.image, approximate))
+    template_names = {t.name for t in templates}
+
+    for row in festival_rows.itertuples(index=False):
+        name = str(row.FESTIVAL_NAME).strip()
+        if not name or name in template_names:
+            continue
+        state = str(row.STATE).strip() if pd.notna(row.STATE) else UNKNOWN_STATE
+        description = row.SHORT_DESCRIPTION if pd.notna(row.SHORT_DESCRIPTION) else ""
+        image = row.IMAGE_URL if pd.notna(row.IMAGE_URL) else ""
+        month = None if pd.isna(row.START_MONTH) else int(row.START_MONTH)
+        for day, approximate in resolve_dates(name, years, month):
+            occurrences.append(FestivalOccurrence(day, name, state, description, image, approximate))
+    return FestivalCalendarIndex(occurrences)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_festival_index(catalog_version, start_year, _templates):
+    """Festival index for `start_year` and the following years (FESTIVAL_INDEX_YEARS in all), shared across sessions.
+
+    `catalog_version` must cover FESTIVALS_FINAL; the rows are loaded under it.
+    Raises when they can't be read (see get_festival_index()).
+    """
+    years = range(start_year, start_year + FESTIVAL_INDEX_YEARS)
+    return build_festival_index(load_festival_rows(catalog_version), _templates, years)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_bundled_festival_index(start_year, _templates):
+    """As load_festival_index(), over the bundled festival names."""
+    years = range(start_year, start_year + FESTIVAL_INDEX_YEARS)
+    return build_festival_index(load_bundled_festival_rows(), _templates, years)
+
+def get_festival_index(catalog_version, start_year, templates):
+    """load_festival_index(), or the bundled index while FESTIVALS_FINAL can't be read (retried every FALLBACK_RETRY_INTERVAL)."""
+    index, _ = load_or_fallback(
+        "festival_index",
+        lambda: load_festival_index(catalog_version, start_year, templates),
+        lambda: load_bundled_festival_index(start_year, templates),
+    )
+    return index
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_festival_month_index(version, _festival_rows):
+    """Month/state index over festival rows (month columns are added if missing), shared across sessions.
+
+    `version` must be a table_version() taken before `_festival_rows` were loaded,
+    so the index kept for a version is never built from rows older than it.
+    """
+    if not set(MONTH_COLUMNS).issubset(_festival_rows.columns):
+        _festival_rows = with_month_columns(_festival_rows)
+    return FestivalMonthIndex(_festival_rows)
@@ -0,0 +1,192 @@
+"""On-disk coordinate store for states, districts and sub-districts.
+
+``data/coordinates.sqlite`` holds one row per (state, district, sub_district)
+place with its latitude/longitude; missing levels are stored as ''. The
+store is seeded with state centroids (plus the multi-state regions used in
+DANCE_FINAL) and with the district headquarters listed in
+``data/district_gazetteer.csv``, so crafts land on their district instead of
+the state centre without any network access. It is extended offline by
+geocoding the CRAFT_IMAGE places the gazetteer doesn't cover (sub-districts,
+unusual spellings). Geocoding results, misses included, are cached in the
+store, so a rebuild only looks up new places. Rebuild from the repo root with:
+
+    python -m cultural_canvas.geo            # seed + geocode new CRAFT_IMAGE places
+    python -m cultural_canvas.geo --no-geocode   # seed centroids + gazetteer only
+
+At runtime the whole store is loaded once into a dict; each distinct place
+is resolved with O(1) lookups, most specific level first.
+"""
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+import urllib.parse
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# --- Configuration ---
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COORDINATES_DB_PATH = os.path.join(REPO_ROOT, "data", "coordinates.sqlite")
+DISTRICT_GAZETTEER_PATH = os.path.join(REPO_ROOT, "data", "district_gazetteer.csv")
+GEOCODER_URL = "https://nominatim.openstreetmap.org/search"
+GEOCODER_USER_AGENT = "cultural-canvas-india/1.0 (coordinate store build)"
+GEOCODER_DELAY = 1.1  # seconds between requests (Nominatim usage policy: max 1/s)
+MISSING_PLACE_VALUES = ("", "n/a", "na", "none", "nan", "null")
+
+# Approximate state centroids and the multi-state regions that appear in DANCE_FINAL
+STATE_CENTROIDS = {
+    'Andhra Pradesh': (16.5, 80.6), 'Arunachal Pradesh': (27.1004, 93.6167), 'Assam': (26.2006, 92.9376),
+    'Bihar': (25.4, 85.4), 'Chhattisgarh': (21.3, 81.6), 'Goa': (15.2993, 74.1240),
+    'Gujarat': (22.3, 72.6), 'Haryana': (29.0588, 76.0856),
+    'Himachal Pradesh': (31.1048, 77.1734), 'Jharkhand': (23.6102, 85.2799),
+    'Jammu & Kashmir': (34.1, 74.8), 'Karnataka': (15.3, 75.7), 'Kerala': (10.8, 76.3),
+    'Madhya Pradesh': (23.2, 77.4), 'Maharashtra': (19.2, 73.2), 'Manipur': (24.6637, 93.9063),
+    'Meghalaya': (25.4670, 91.3662), 'Mizoram': (23.1645, 92.9376), 'Nagaland': (26.1584, 94.5624),
+    'Odisha': (20.3, 85.8), 'Punjab': (31.1, 75.3), 'Rajasthan': (27.0, 74.2),
+    'Sikkim': (27.5330, 88.5122), 'Tamil Nadu': (11.1, 78.7), 'Telangana': (18.1124, 79.0193),
+    'Tripura': (23.9408, 91.9882), 'Uttar Pradesh': (26.8, 80.9), 'Uttarakhand': (30.0668, 79.0193),
+    'West Bengal': (22.6, 88.4),
+    'Odisha, West Bengal': (21.5, 87.0), 'Odisha, Jharkhand, West Bengal': (22.5, 87.0),
+    'Gujarat, Madhya Pradesh': (22.8, 73.0), 'Rajasthan, Himachal Pradesh': (29.0, 76.0),
+    'Andhra Pradesh, Telangana': (17.0, 79.5),
+}
+# Spellings seen in the source tables, mapped to the stored (normalized) name
+PLACE_ALIASES = {
+    "jammu and kashmir": "jammu & kashmir",
+    "orissa": "odisha",
+    "uttaranchal": "uttarakhand",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS places (
+    state TEXT NOT NULL,
+    district TEXT NOT NULL DEFAULT '',
+    sub_district TEXT NOT NULL DEFAULT '',
+    latitude REAL,          -- NULL: geocoding found nothing (cached so it isn't retried)
+    longitude REAL,
+    source TEXT NOT NULL,   -- 'centroid', 'gazetteer' or 'geocoder'
+    PRIMARY KEY (state, district, sub_district)
+);
+"""
+
+
+def normalize_place(value):
+    """Lower-cased, trimmed place name with known aliases applied ('' for missing values)."""
+    if not isinstance(value, str):
+        return ""
+    value = " ".join(value.split()).casefold()
+    if value in MISSING_PLACE_VALUES:
+        return ""
+    return PLACE_ALIASES.get(value, value)
+
+
+# --- Offline Build Step ---
+def _geocode(state, district, sub_district):
+    """(lat, lon) from the Nominatim geocoder, or (None, None)."""
+    query = ", ".join(part for part in (sub_district, district, state, "India") if part)
+    url = f"{GEOCODER_URL}?{urllib.parse.urlencode({'q': query, 'format': 'json', 'limit': 1, 'countrycodes': 'in'})}"
+    request = urllib.request.Request(url, headers={"User-Agent": GEOCODER_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        results = json.load(response)
+    if not results:
+        return None, None
+    return float(results[0]["lat"]), float(results[0]["lon"])
+
+def _gazetteer_districts(path=DISTRICT_GAZETTEER_PATH):
+    """(state, district, lat, lon) rows of the bundled district gazetteer, normalized."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            (normalize_place(row["state"]), normalize_place(row["district"]), float(row["latitude"]), float(row["longitude"]))
+            for row in csv.DictReader(f)
+        ]
+
+def _craft_places():
+    """Distinct (state, district, sub_district) of CRAFT_IMAGE, normalized."""
+    from cultural_canvas.data import run_query
+
+    df = run_query("craft_places")
+    places = set()
+    for state, district, sub_district in df.itertuples(index=False):
+        state, district, sub_district = normalize_place(state), normalize_place(district), normalize_place(sub_district)
+        if state and district:
+            places.add((state, district, ""))
+            if sub_district:
+                places.add((state, district, sub_district))
+    return sorted(places)
+
+def build_coordinate_store(db_path=COORDINATES_DB_PATH, geocode=True):
+    """Seed state centroids and gazetteer districts, then geocode the CRAFT_IMAGE places not in the store yet."""
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    with sqlite3.connect(db_path) as db:
+        db.executescript(SCHEMA)
+        db.executemany(
+            "INSERT OR REPLACE INTO places VALUES (?, '', '', ?, ?, 'centroid')",
+            [(normalize_place(state), lat, lon) for state, (lat, lon) in STATE_CENTROIDS.items()],
+        )
+        # Gazetteer rows never overwrite a successful geocoder lookup of the same district
+        db.executemany(
+            """INSERT INTO places VALUES (?, ?, '', ?, ?, 'gazetteer')
+               ON CONFLICT (state, district, sub_district) DO UPDATE
+               SET latitude = excluded.latitude, longitude = excluded.longitude, source = excluded.source
+               WHERE places.source != 'geocoder' OR places.latitude IS NULL""",
+            _gazetteer_districts(),
+        )
+        if not geocode:
+            return db.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+        known = {tuple(row) for row in db.execute("SELECT state, district, sub_district FROM places")}
+        pending = [place for place in _craft_places() if place not in known]
+        for i, place in enumerate(pending, 1):
+            lat, lon = _geocode(*place)
+            db.execute("INSERT OR REPLACE INTO places VALUES (?, ?, ?, ?, ?, 'geocoder')", (*place, lat, lon))
+            db.commit()  # keep progress if the run is interrupted
+            print(f"[{i}/{len(pending)}] {', '.join(p for p in place if p)}: {lat}, {lon}")
+            time.sleep(GEOCODER_DELAY)
+        return db.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+
+# --- Runtime Resolver ---
+@st.cache_resource
+def load_coordinates(db_path=COORDINATES_DB_PATH):
+    """{'state|district|sub_district': (lat, lon)} from the store, loaded once per process."""
+    try:
+        with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as db:
+            rows = db.execute("SELECT state, district, sub_district, latitude, longitude FROM places WHERE latitude IS NOT NULL").fetchall()
+    except sqlite3.Error:
+        rows = [(normalize_place(state), "", "", lat, lon) for state, (lat, lon) in STATE_CENTROIDS.items()]
+    return {f"{state}|{district}|{sub_district}": (lat, lon) for state, district, sub_district, lat, lon in rows}
+
+def resolve_place(state, district="", sub_district=""):
+    """(lat, lon) of the most specific known level of a place, or (nan, nan)."""
+    coordinates = load_coordinates()
+    state, district, sub_district = normalize_place(state), normalize_place(district), normalize_place(sub_district)
+    if not state:
+        return (float("nan"), float("nan"))
+    for key in (f"{state}|{district}|{sub_district}", f"{state}|{district}|", f"{state}||"):
+        if key in coordinates:
+            return coordinates[key]
+    return (float("nan"), float("nan"))
+
+def resolve_coordinates(states, districts=None, sub_districts=None):
+    """(latitude, longitude) Series for place columns; each distinct place is resolved once."""
+    places = pd.DataFrame({
+        "state": states,
+        "district": "" if districts is None else districts,
+        "sub_district": "" if sub_districts is None else sub_districts,
+    }, index=states.index).astype(object)
+    # ngroup(sort=False) numbers places in order of first appearance, like drop_duplicates()
+    place_codes = places.groupby(list(places.columns), sort=False, dropna=False).ngroup().to_numpy()
+    resolved = np.array([resolve_place(*place) for place in places.drop_duplicates().itertuples(index=False)], dtype=float).reshape(-1, 2)
+    return (
+        pd.Series(resolved[place_codes, 0], index=states.index),
+        pd.Series(resolved[place_codes, 1], index=states.index),
+    )
+
+if __name__ == "__main__":
+    count = build_coordinate_store(geocode="--no-geocode" not in sys.argv[1:])
+    print(f"{count} places in {COORDINATES_DB_PATH}")
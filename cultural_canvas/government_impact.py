@@ -0,0 +1,154 @@
+"""Data behind the Government Impact Dashboard.
+
+Each table is read from Snowflake when it exists there (GOVERNMENT_FUNDING,
+ARTISAN_REGISTRATIONS, TOURISM_IMPACT); otherwise it is generated from a
+fixed seed, so the simulated figures are the same on every run, in every
+session and process. The page builds the tables once per table version and
+its filters only slice them. Connection errors and schema mismatches are
+raised rather than simulated, so that per-version cache never keeps a
+fallback caused by an outage or a changed table.
+"""
+import random
+
+import pandas as pd
+
+# --- Configuration ---
+IMPACT_SEED = 2023  # simulated figures are reproducible for a given seed
+IMPACT_TABLES = {
+    "government_funding": "GOVERNMENT_FUNDING",
+    "artisan_registrations": "ARTISAN_REGISTRATIONS",
+    "tourism_impact": "TOURISM_IMPACT",
+}
+
+STATES = [
+    'Andhra Pradesh', 'Assam', 'Bihar', 'Chhattisgarh', 'Gujarat',
+    'Haryana', 'Himachal Pradesh', 'Jharkhand', 'Karnataka', 'Kerala',
+    'Madhya Pradesh', 'Maharashtra', 'Odisha', 'Punjab', 'Rajasthan',
+    'Tamil Nadu', 'Telangana', 'Uttar Pradesh', 'Uttarakhand', 'West Bengal'
+]
+SCHEMES = [
+    'Swadesh Darshan Scheme',
+    'PRASAD (Pilgrimage Rejuvenation and Spiritual Augmentation Drive)',
+    'Museum Grant Scheme',
+    'Cultural Function Grant Scheme',
+    'National Mission on Cultural Mapping',
+    'Tribal Art Development Scheme',
+    'Heritage City Development and Augmentation Yojana (HRIDAY)',
+    'National Handicraft Development Program',
+    'Preservation and Development of Cultural Heritage of Himalayas',
+    'Scheme for Safeguarding the Intangible Cultural Heritage'
+]
+OBJECTIVES = [
+    'Preservation', 'Promotion', 'Infrastructure', 'Education',
+    'Documentation', 'Digitization', 'Skill Development', 'Research'
+]
+YEARS = list(range(2018, 2024))
+MISSING_TABLE_ERRNO = 2003  # Snowflake: object does not exist or not authorized
+
+FUNDING_COLUMNS = ['state', 'scheme', 'objective', 'year', 'funding_lakhs', 'utilization_percentage', 'beneficiaries']
+ARTISAN_COLUMNS = ['state', 'year', 'registered_artisans', 'women_percentage', 'digital_percentage']
+TOURISM_COLUMNS = ['state', 'year', 'tourism_revenue_crores', 'tourism_employment', 'tourist_arrivals', 'cultural_tourism_percentage']
+OBJECTIVE_FUNDING_COLUMNS = ['state', 'scheme', 'year', 'objective', 'funding_lakhs']
+
+
+# --- Simulated Tables ---
+def _rng(table, seed):
+    """Generator for one table, so each table's figures don't depend on the others."""
+    return random.Random(f"{seed}:{table}")
+
+def simulated_government_funding(seed=IMPACT_SEED):
+    """3-5 schemes per state, each with 1-3 objectives and one row per year."""
+    rng = _rng("government_funding", seed)
+    data = []
+    for state in STATES:
+        for scheme in rng.sample(SCHEMES, rng.randint(3, 5)):
+            scheme_objectives = ', '.join(rng.sample(OBJECTIVES, rng.randint(1, 3)))
+            for year in YEARS:
+                data.append((
+                    state, scheme, scheme_objectives, year,
+                    rng.randint(50, 1000),  # funding in lakhs
+                    rng.randint(60, 100),  # utilization percentage
+                    rng.randint(500, 10000),  # beneficiaries
+                ))
+    return pd.DataFrame(data, columns=FUNDING_COLUMNS)
+
+def simulated_artisan_registrations(seed=IMPACT_SEED):
+    """Registered artisans per state and year, growing 5% a year."""
+    rng = _rng("artisan_registrations", seed)
+    data = []
+    for state in STATES:
+        base_artisans = rng.randint(1000, 5000)
+        for year in YEARS:
+            growth_factor = 1 + (year - 2018) * 0.05
+            data.append((
+                state, year,
+                int(base_artisans * growth_factor * rng.uniform(0.9, 1.1)),
+                rng.randint(30, 60),  # women artisans (%)
+                min(80, 20 + (year - 2018) * 10),  # digital presence rises every year
+            ))
+    return pd.DataFrame(data, columns=ARTISAN_COLUMNS)
+
+def simulated_tourism_impact(seed=IMPACT_SEED):
+    """Tourism revenue, employment and arrivals per state and year, with a COVID dip in 2020-21."""
+    rng = _rng("tourism_impact", seed)
+    data = []
+    for state in STATES:
+        base_revenue = rng.randint(500, 5000)  # in crores
+        base_employment = rng.randint(10000, 100000)
+        base_tourists = rng.randint(500000, 5000000)
+        for year in YEARS:
+            growth_factor = 0.6 if year in (2020, 2021) else 1 + (year - 2018) * 0.08
+            data.append((
+                state, year,
+                int(base_revenue * growth_factor * rng.uniform(0.9, 1.1)),
+                int(base_employment * growth_factor * rng.uniform(0.9, 1.1)),
+                int(base_tourists * growth_factor * rng.uniform(0.9, 1.1)),
+                rng.randint(30, 70),  # cultural share of tourism (%)
+            ))
+    return pd.DataFrame(data, columns=TOURISM_COLUMNS)
+
+SIMULATED_TABLES = {
+    "government_funding": (simulated_government_funding, FUNDING_COLUMNS),
+    "artisan_registrations": (simulated_artisan_registrations, ARTISAN_COLUMNS),
+    "tourism_impact": (simulated_tourism_impact, TOURISM_COLUMNS),
+}
+
+
+# --- Loading ---
+def load_impact_table(name, seed=IMPACT_SEED):
+    """(frame, simulated) for one dashboard table: the Snowflake query `name` if it returns rows, else the seeded simulation.
+
+    Only a missing or empty table is simulated. Other Snowflake errors propagate, and a
+    table without the expected columns raises ValueError.
+    """
+    from snowflake.connector.errors import ProgrammingError
+
+    from cultural_canvas.data import run_query
+
+    simulate, columns = SIMULATED_TABLES[name]
+    try:
+        df = run_query(name)
+    except ProgrammingError as e:
+        if e.errno != MISSING_TABLE_ERRNO:
+            raise
+        return simulate(seed), True
+    if df.empty:
+        return simulate(seed), True
+    missing = [column for column in columns if column not in df.columns]
+    if missing:
+        raise ValueError(f"{IMPACT_TABLES[name]} is missing columns: {', '.join(missing)}")
+    return df[columns].reset_index(drop=True), False
+
+def simulated_impact_tables(seed=IMPACT_SEED):
+    """{name: frame} with every dashboard table simulated."""
+    return {name: simulate(seed) for name, (simulate, _) in SIMULATED_TABLES.items()}
+
+def objective_funding(funding_df):
+    """Funding split equally across each row's comma-separated objectives, one row per (row, objective)."""
+    objectives = funding_df['objective'].str.split(', ')
+    long_df = funding_df.assign(
+        objective=objectives,
+        funding_lakhs=funding_df['funding_lakhs'] / objectives.str.len(),
+    ).explode('objective', ignore_index=True)
+    long_df['objective'] = long_df['objective'].str.strip()
+    return long_df[OBJECTIVE_FUNDING_COLUMNS]
@@ -0,0 +1,159 @@
+"""Responsive image derivatives for the app's hero and card images.
+
+The PNGs committed at the repo root are 0.5-1.8 MB each but are shown in
+200 px card slots. The offline build step writes resized WebP (and AVIF,
+when Pillow supports it) copies with content-hashed names to ``static/img``
+together with a ``manifest.json``. Streamlit serves that folder at
+``app/static/`` (``server.enableStaticServing`` in ``.streamlit/config.toml``).
+
+Rebuild after adding or changing an image (run from the repo root):
+
+    python -m cultural_canvas.images
+
+At runtime the helpers below look a repo image (a REPO_IMAGE_URL_PREFIX URL
+or a repo-relative file name) up in the manifest and fall back to the
+original URL for anything else, such as Snowflake-hosted craft images.
+"""
+import hashlib
+import json
+import os
+
+import streamlit as st
+
+# --- Configuration ---
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DERIVATIVE_DIR = os.path.join(REPO_ROOT, "static", "img")
+MANIFEST_PATH = os.path.join(DERIVATIVE_DIR, "manifest.json")
+STATIC_URL_PREFIX = "app/static/img/"
+# Images referenced by URL in the pages are the ones committed to the GitHub repo
+REPO_IMAGE_URL_PREFIX = "https://raw.githubusercontent.com/yashgupta17402/hero/main/"
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Target widths (px) per display role and the matching `sizes` hint
+ROLE_WIDTHS = {"card": 480, "slide": 960, "detail": 1280}
+ROLE_SIZES = {
+    "card": "(min-width: 768px) 33vw, 100vw",
+    "slide": "(min-width: 768px) 50vw, 100vw",
+    "detail": "100vw",
+}
+WEBP_QUALITY = 80
+AVIF_QUALITY = 60
+
+
+# --- Offline Build Step ---
+def _content_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:10]
+
+def _avif_supported():
+    from PIL import features
+    return bool(features.check("avif"))
+
+def build_derivatives(source_dir=REPO_ROOT, output_dir=DERIVATIVE_DIR):
+    """Resize every source image into per-role WebP/AVIF files and write the manifest."""
+    from PIL import Image
+
+    os.makedirs(output_dir, exist_ok=True)
+    formats = ["webp"] + (["avif"] if _avif_supported() else [])
+    manifest = {}
+    written = set()
+
+    for file_name in sorted(os.listdir(source_dir)):
+        if not file_name.lower().endswith(SOURCE_EXTENSIONS):
+            continue
+        source_path = os.path.join(source_dir, file_name)
+        digest = _content_hash(source_path)
+        stem = os.path.splitext(file_name)[0]
+
+        with Image.open(source_path) as img:
+            img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+            entry = {"width": img.width, "height": img.height, "hash": digest, "roles": {}}
+            for fmt in formats:
+                entry[fmt] = {}
+            for role, target_width in ROLE_WIDTHS.items():
+                width = min(target_width, img.width)
+                entry["roles"][role] = width
+                if str(width) in entry["webp"]:
+                    continue
+                height = round(img.height * width / img.width)
+                resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+                for fmt in formats:
+                    out_name = f"{stem}.{digest}.{width}w.{fmt}"
+                    out_path = os.path.join(output_dir, out_name)
+                    if not os.path.exists(out_path):
+                        quality = WEBP_QUALITY if fmt == "webp" else AVIF_QUALITY
+                        resized.save(out_path, fmt.upper(), quality=quality)
+                    entry[fmt][str(width)] = out_name
+                    written.add(out_name)
+        manifest[file_name] = entry
+
+    # Drop derivatives of images that changed or were removed
+    for file_name in os.listdir(output_dir):
+        if file_name != os.path.basename(MANIFEST_PATH) and file_name not in written:
+            os.remove(os.path.join(output_dir, file_name))
+
+    with open(os.path.join(output_dir, os.path.basename(MANIFEST_PATH)), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+# --- Runtime Resolver ---
+@st.cache_resource
+def load_manifest():
+    """Load the derivative manifest once per process (empty if the build step has not run)."""
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _manifest_entry(url):
+    """Manifest entry for a repo image URL or repo-relative file name; None for anything else (e.g. Snowflake-hosted images)."""
+    if not url or not isinstance(url, str):
+        return None
+    if url.startswith(REPO_IMAGE_URL_PREFIX):
+        file_name = url[len(REPO_IMAGE_URL_PREFIX):]
+    elif "://" in url or url.startswith("/"):
+        return None  # another host, or an absolute path, only shares a file name by coincidence
+    else:
+        file_name = url
+    return load_manifest().get(file_name)  # keys are the file names at the repo root
+
+def _srcset(entry, fmt):
+    return ", ".join(f"{STATIC_URL_PREFIX}{name} {width}w" for width, name in sorted(entry[fmt].items(), key=lambda kv: int(kv[0])))
+
+def image_src(url, role="card"):
+    """URL of the WebP derivative sized for `role`, or the original URL."""
+    entry = _manifest_entry(url)
+    if not entry:
+        return url
+    return STATIC_URL_PREFIX + entry["webp"][str(entry["roles"][role])]
+
+def image_file(url, role="detail"):
+    """Local derivative path for st.image (served from the media cache), or the original URL."""
+    entry = _manifest_entry(url)
+    if not entry:
+        return url
+    return os.path.join(DERIVATIVE_DIR, entry["webp"][str(entry["roles"][role])])
+
+def responsive_img(url, alt="", role="card", css_class=""):
+    """<img> HTML with srcset/sizes and lazy loading; <picture> with an AVIF source when available."""
+    class_attr = f' class="{css_class}"' if css_class else ""
+    entry = _manifest_entry(url)
+    if not entry:
+        return f'<img src="{url}" alt="{alt}"{class_attr} loading="lazy" decoding="async">'
+    sizes = ROLE_SIZES[role]
+    img_html = (
+        f'<img src="{image_src(url, role)}" srcset="{_srcset(entry, "webp")}" sizes="{sizes}" '
+        f'alt="{alt}"{class_attr} loading="{"eager" if role == "slide" else "lazy"}" decoding="async">'
+    )
+    if "avif" not in entry:
+        return img_html
+    # display: contents keeps the <img> laid out as if it were the direct child
+    return f'<picture style="display: contents;"><source type="image/avif" srcset="{_srcset(entry, "avif")}" sizes="{sizes}">{img_html}</picture>'
+
+
+if __name__ == "__main__":
+    built = build_derivatives()
+    print(f"Wrote derivatives for {len(built)} images to {DERIVATIVE_DIR}")
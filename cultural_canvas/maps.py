@@ -0,0 +1,89 @@
+"""Shared Folium map helpers.
+
+location_preview() draws a pin on one cached base map instead of building a
+new folium.Map per call. The base map renders to the same Leaflet script on
+every run, so streamlit-folium keeps the mounted map in the browser and only
+swaps the marker layer and re-centers, rather than reloading a full Leaflet
+document with its CDN assets.
+
+clustered_marker_layer() turns a precomputed [lat, lon, popup_html, tooltip]
+payload into a FastMarkerCluster, whose markers are created in the browser
+from one JSON array; pages build the payload (and the map holding it) once
+per data version.
+"""
+import json
+import threading
+
+import folium
+import streamlit as st
+from folium.plugins import FastMarkerCluster
+from streamlit_folium import st_folium
+
+# --- Configuration ---
+INDIA_CENTER = (22.0, 79.0)
+INDIA_ZOOM = 5
+PREVIEW_ZOOM = 7
+PREVIEW_RADIUS_M = 50000
+PREVIEW_COLOR = "#FF6347"
+
+SITE_DOT_HTML = """<div style="background-color: #3498db; width: 12px; height: 12px; border-radius: 50%; border: 2px solid white; box-shadow: 0 0 4px rgba(0,0,0,0.3); position: relative;"><div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); width: 4px; height: 4px; background-color: white; border-radius: 50%;"></div></div>"""
+POPUP_MAX_WIDTH = 300
+
+# st_folium renders (and briefly mutates) the map object, and cached maps are
+# shared by every session, so renders are serialized.
+_shared_map_lock = threading.Lock()
+
+
+def render_shared_map(fig, **kwargs):
+    """st_folium for a map object cached with st.cache_resource (renders one at a time)."""
+    with _shared_map_lock:
+        return st_folium(fig, **kwargs)
+
+def marker_payload(latitudes, longitudes, popups, tooltips):
+    """[[lat, lon, popup_html, tooltip], ...] rows for clustered_marker_layer(), skipping missing coordinates."""
+    return [
+        [float(lat), float(lon), popup, tooltip]
+        for lat, lon, popup, tooltip in zip(latitudes, longitudes, popups, tooltips)
+        if lat == lat and lon == lon  # NaN check
+    ]
+
+def clustered_marker_layer(payload, name=None, icon_html=SITE_DOT_HTML):
+    """FastMarkerCluster that builds a dot marker with popup and tooltip per payload row in the browser."""
+    callback = f"""function (row) {{
+        var icon = L.divIcon({{html: {json.dumps(icon_html)}, className: "", iconSize: [12, 12], iconAnchor: [6, 6]}});
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {{icon: icon}});
+        marker.bindPopup(row[2], {{maxWidth: {POPUP_MAX_WIDTH}}});
+        marker.bindTooltip(row[3]);
+        return marker;
+    }}"""
+    return FastMarkerCluster(payload, callback=callback, name=name)
+
+
+@st.cache_resource
+def india_base_map():
+    """Bare map of India shared by all location previews."""
+    return folium.Map(location=INDIA_CENTER, zoom_start=INDIA_ZOOM, tiles="OpenStreetMap")
+
+def location_preview(lat, lon, tooltip="", popup_html="", icon="palette", key="location_preview", zoom=PREVIEW_ZOOM, height=450):
+    """Show a pin and a highlight circle at (lat, lon) on the shared base map."""
+    marker_layer = folium.FeatureGroup(name="Location")
+    folium.Marker(
+        [lat, lon],
+        popup=popup_html or None,
+        tooltip=tooltip or None,
+        icon=folium.Icon(color="red", icon=icon, prefix="fa")
+    ).add_to(marker_layer)
+    folium.Circle(
+        [lat, lon], radius=PREVIEW_RADIUS_M, color=PREVIEW_COLOR,
+        fill=True, fill_color=PREVIEW_COLOR, fill_opacity=0.2
+    ).add_to(marker_layer)
+    render_shared_map(
+        india_base_map(),
+        key=key,
+        center=(lat, lon),
+        zoom=zoom,
+        feature_group_to_add=marker_layer,
+        returned_objects=[],  # display only: interactions never rerun the page
+        height=height,
+        use_container_width=True,
+    )
@@ -0,0 +1,185 @@
+"""In-memory inverted index for the catalog search boxes.
+
+Text fields are tokenized once (lower-cased word tokens) into postings of
+row positions with a per-row score (the sum of the weights of the fields
+the token occurs in). The vocabulary is kept sorted, so every token that
+starts with a query term is one bisect range away. A query is the AND of
+its terms; rows are ranked by the summed weights, with prefix-only matches
+counting half.
+
+TrigramIndex covers short, typo-prone fields (place and site names): each
+value is broken into character trigrams, pg_trgm style, and candidates are
+ranked by how many trigrams they share with the query, so misspellings and
+partial names still find the right row.
+"""
+import bisect
+import re
+
+import numpy as np
+
+# --- Configuration ---
+TOKEN_PATTERN = re.compile(r"\w+")
+PREFIX_MATCH_FACTOR = 0.5  # a prefix-only match is worth half an exact token match
+MIN_TRIGRAM_SCORE = 0.3  # weaker fuzzy candidates are not returned
+
+
+def tokenize(text):
+    """Lower-cased word tokens of `text` (empty for missing values)."""
+    if not isinstance(text, str):
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """Token -> (row positions, scores) postings over weighted text fields.
+
+    Postings are stored CSR-style in vocabulary order: the rows of token i are
+    ``rows[offsets[i]:offsets[i + 1]]``, so all tokens sharing a prefix are one
+    contiguous slice.
+    """
+    __slots__ = ("_size", "_vocab", "_offsets", "_rows", "_weights")
+
+    def __init__(self, df, field_weights):
+        self._size = len(df)
+        postings = {}
+        for field, weight in field_weights.items():
+            if field not in df.columns:
+                continue
+            for pos, text in enumerate(df[field].tolist()):
+                for token in set(tokenize(text)):
+                    rows = postings.setdefault(token, {})
+                    rows[pos] = rows.get(pos, 0.0) + weight
+        self._vocab = sorted(postings)
+        counts = np.fromiter((len(postings[token]) for token in self._vocab), dtype=np.int64, count=len(self._vocab))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+        total = int(self._offsets[-1])
+        self._rows = np.fromiter((pos for token in self._vocab for pos in postings[token]), dtype=np.int32, count=total)
+        self._weights = np.fromiter((w for token in self._vocab for w in postings[token].values()), dtype=np.float32, count=total)
+
+    def __len__(self):
+        return self._size
+
+    def _term_scores(self, term):
+        """Score of every row for one query term (0 where it doesn't match)."""
+        start = bisect.bisect_left(self._vocab, term)
+        end = bisect.bisect_left(self._vocab, term + "\U0010ffff")  # past the last token with this prefix
+        scores = np.zeros(self._size, dtype=np.float32)
+        if start == end:
+            return scores
+        exact = self._vocab[start] == term  # the exact token sorts first and scores in full
+        prefix_start = start + 1 if exact else start
+        if prefix_start < end:
+            lo, hi = self._offsets[prefix_start], self._offsets[end]
+            np.maximum.at(scores, self._rows[lo:hi], self._weights[lo:hi] * PREFIX_MATCH_FACTOR)
+        if exact:
+            lo, hi = self._offsets[start], self._offsets[start + 1]
+            rows = self._rows[lo:hi]  # unique within one token, so fancy indexing is safe
+            scores[rows] = np.maximum(scores[rows], self._weights[lo:hi])
+        return scores
+
+    def search(self, query, limit=None):
+        """Row positions matching every term of `query` (prefix match), best first."""
+        terms = tokenize(query)
+        if not terms:
+            return np.arange(self._size)
+        total = None
+        for term in dict.fromkeys(terms):
+            scores = self._term_scores(term)
+            total = scores if total is None else np.where((total > 0) & (scores > 0), total + scores, 0)
+        matches = np.flatnonzero(total)
+        order = np.argsort(-total[matches], kind="stable")  # ties keep catalog order
+        ranked = matches[order]
+        return ranked if limit is None else ranked[:limit]
+
+    @staticmethod
+    def match_spans(query, text):
+        """(start, end) offsets in `text` of tokens starting with a term of `query`, for highlighting."""
+        terms = tuple(dict.fromkeys(tokenize(query)))
+        if not terms or not isinstance(text, str):
+            return []
+        return [m.span() for m in TOKEN_PATTERN.finditer(text) if m.group().lower().startswith(terms)]
+
+
+def trigrams(text):
+    """Set of character trigrams of the lower-cased words of `text` (words padded like pg_trgm)."""
+    return {f"  {word} "[i:i + 3] for word in tokenize(text) for i in range(len(word) + 1)}
+
+
+class TrigramIndex:
+    """Trigram -> row positions postings per weighted field, for fuzzy name lookups.
+
+    A field value scores by the share of the query's trigrams it contains
+    (so partial and misspelled names match), blended 2:1 with the trigram
+    similarity of the two strings (so the closest full name ranks first); a
+    row scores by its best weighted field.
+    """
+    __slots__ = ("_size", "_weights", "_postings", "_lengths")
+
+    def __init__(self, df, field_weights):
+        self._size = len(df)
+        self._weights = {}
+        self._postings = {}
+        self._lengths = {}
+        for field, weight in field_weights.items():
+            if field not in df.columns:
+                continue
+            postings = {}
+            lengths = np.zeros(self._size, dtype=np.int32)
+            for pos, text in enumerate(df[field].tolist()):
+                grams = trigrams(text)
+                lengths[pos] = len(grams)
+                for gram in grams:
+                    postings.setdefault(gram, []).append(pos)
+            self._weights[field] = weight
+            self._postings[field] = {gram: np.array(rows, dtype=np.int32) for gram, rows in postings.items()}
+            self._lengths[field] = lengths
+
+    def __len__(self):
+        return self._size
+
+    def scores(self, query, similarity_only=False):
+        """Score in [0, max weight] of every row for `query` (pure trigram similarity with `similarity_only`)."""
+        query_grams = trigrams(query)
+        total = np.zeros(self._size, dtype=np.float32)
+        if not query_grams:
+            return total
+        for field, postings in self._postings.items():
+            shared = np.zeros(self._size, dtype=np.float32)
+            for gram in query_grams:
+                rows = postings.get(gram)
+                if rows is not None:
+                    shared[rows] += 1  # rows are unique per trigram
+            similarity = shared / (len(query_grams) + self._lengths[field] - shared)
+            score = similarity if similarity_only else (2 * shared / len(query_grams) + similarity) / 3
+            np.maximum(total, self._weights[field] * score, out=total)
+        return total
+
+    def search(self, query, limit=None, min_score=MIN_TRIGRAM_SCORE):
+        """(row positions, scores) of the rows scoring at least `min_score`, best first."""
+        scores = self.scores(query)
+        matches = np.flatnonzero(scores >= min_score)
+        order = np.argsort(-scores[matches], kind="stable")  # ties keep row order
+        if limit is not None:
+            order = order[:limit]
+        return matches[order], scores[matches[order]]
+
+    def best_match(self, text, min_similarity):
+        """Position of the row most similar to `text` (whole-string trigram similarity), or None below `min_similarity`."""
+        scores = self.scores(text, similarity_only=True)
+        if not len(scores):
+            return None
+        best = int(np.argmax(scores))
+        return best if scores[best] >= min_similarity else None
+
+
+def highlight(text, spans, tag="mark"):
+    """Wrap each (start, end) span of `text` in <tag>...</tag>."""
+    if not spans:
+        return text
+    parts, last = [], 0
+    for start, end in spans:
+        parts.append(text[last:start])
+        parts.append(f"<{tag}>{text[start:end]}</{tag}>")
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
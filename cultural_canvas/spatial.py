@@ -0,0 +1,88 @@
+"""Grid index over latitude/longitude points for radius queries.
+
+Points are bucketed into fixed-size degree cells and stored sorted by cell id,
+so the points of one cell are a contiguous slice found with a binary search.
+A query visits only the cells overlapping its bounding box (one searchsorted
+per row of cells) and computes exact haversine distances for those candidates,
+instead of measuring the distance to every point.
+"""
+import numpy as np
+import pandas as pd
+
+# --- Configuration ---
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.195  # EARTH_RADIUS_KM * pi / 180
+GRID_CELL_DEG = 0.5  # ~55 km cells: a 50 km radius touches at most 3x3 of them
+GRID_COLUMNS = int(360 / GRID_CELL_DEG)
+
+HERITAGE_POINT_COLUMNS = ["kind", "name", "state", "latitude", "longitude"]
+
+
+def haversine_km(lat, lon, latitudes, longitudes):
+    """Great-circle distance in km from (lat, lon) to each point of the arrays."""
+    lat, lon = np.radians(lat), np.radians(lon)
+    latitudes, longitudes = np.radians(latitudes), np.radians(longitudes)
+    a = np.sin((latitudes - lat) / 2) ** 2 + np.cos(lat) * np.cos(latitudes) * np.sin((longitudes - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _cell_rows(latitudes):
+    return np.floor((np.clip(latitudes, -90.0, 90.0) + 90.0) / GRID_CELL_DEG).astype(np.int64)
+
+def _cell_columns(longitudes):
+    return np.floor((np.clip(longitudes, -180.0, 180.0) + 180.0) / GRID_CELL_DEG).astype(np.int64).clip(0, GRID_COLUMNS - 1)
+
+
+class SpatialIndex:
+    """Row positions of points bucketed by grid cell; points with missing coordinates are left out."""
+    __slots__ = ("_size", "_cells", "_positions", "_latitudes", "_longitudes")
+
+    def __init__(self, latitudes, longitudes):
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        self._size = len(latitudes)
+        positions = np.flatnonzero(~(np.isnan(latitudes) | np.isnan(longitudes)))
+        cells = _cell_rows(latitudes[positions]) * GRID_COLUMNS + _cell_columns(longitudes[positions])
+        order = np.argsort(cells, kind="stable")
+        self._cells = cells[order]
+        self._positions = positions[order]
+        self._latitudes = latitudes[self._positions]
+        self._longitudes = longitudes[self._positions]
+
+    def __len__(self):
+        return self._size
+
+    def _candidates(self, south, west, north, east):
+        """Indexes (into the sorted arrays) of the points in the cells overlapping the box."""
+        col_lo, col_hi = _cell_columns(np.array([west, east]))
+        slices = []
+        for row in range(_cell_rows(np.array([south]))[0], _cell_rows(np.array([north]))[0] + 1):
+            lo = np.searchsorted(self._cells, row * GRID_COLUMNS + col_lo, side="left")
+            hi = np.searchsorted(self._cells, row * GRID_COLUMNS + col_hi, side="right")
+            if lo < hi:
+                slices.append(np.arange(lo, hi))
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def within_radius(self, lat, lon, radius_km, limit=None):
+        """(row positions, distances in km) of the points within `radius_km`, nearest first."""
+        lat_span = radius_km / KM_PER_DEGREE_LAT
+        lon_span = min(180.0, radius_km / (KM_PER_DEGREE_LAT * max(np.cos(np.radians(lat)), 1e-6)))
+        candidates = self._candidates(lat - lat_span, lon - lon_span, lat + lat_span, lon + lon_span)
+        distances = haversine_km(lat, lon, self._latitudes[candidates], self._longitudes[candidates])
+        keep = distances <= radius_km
+        candidates, distances = candidates[keep], distances[keep]
+        order = np.argsort(distances, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return self._positions[candidates[order]], distances[order]
+
+
+def heritage_points(kind, names, states, latitudes, longitudes):
+    """Frame of one kind of point in the HERITAGE_POINT_COLUMNS layout."""
+    return pd.DataFrame({
+        "kind": kind,
+        "name": pd.Series(names).astype(str).str.strip().to_numpy(),
+        "state": pd.Series(states).fillna("").astype(str).str.strip().to_numpy(),
+        "latitude": pd.to_numeric(pd.Series(latitudes), errors="coerce").to_numpy(),
+        "longitude": pd.to_numeric(pd.Series(longitudes), errors="coerce").to_numpy(),
+    }, columns=HERITAGE_POINT_COLUMNS)
@@ -1,11 +1,18 @@
 import streamlit as st
 import time
 import pandas as pd
+import pyarrow as pa
 # import random # Not used, can be removed if you wish
-from datetime import datetime
+from datetime import date
+from cultural_canvas.catalog import get_home_catalog
+from cultural_canvas.data import fetch_arrow, warm_query_caches
+from cultural_canvas.festival_calendar import get_festival_index
+from cultural_canvas.images import image_file, responsive_img
 
 # --- Global Configuration ---
 AUTOPLAY_INTERVAL = 5 # seconds
+AUTOPLAY_TIMER_SLACK = 0.5 # seconds; the fragment timer can fire slightly early
+UPCOMING_FESTIVALS_COUNT = 5
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -15,120 +22,30 @@ st.set_page_config(
     page_icon="🎨"
 )
 
-# --- Simulated Database Functions & Snowflake Data Loading ---
-def get_slideshow_data():
-    """Fetch slideshow data from database (simulated)"""
-    return [
-        {
-            "imgSrc": "https://raw.githubusercontent.com/yashgupta17402/hero/main/kathakali.PNG",
-            "title": "Vibrant Traditions: A Tapestry of Art",
-            "description": "India's artistic heritage is a kaleidoscope of color, skill, and ancient wisdom. From intricate paintings to mesmerizing dance forms, discover the soul of a nation expressed through its art.",
-            "cta_button_text": "Explore Art Forms",
-            "cta_link": "pages/1_≡🌍🎨 Art Forms Explorer.py"  # Changed to file path
-        },
-        {
-            "imgSrc": "https://raw.githubusercontent.com/yashgupta17402/hero/main/AGRA_FORT.PNG",
-            "title": "Journey Through Time: Uncover Cultural Hotspots",
-            "description": "Explore majestic forts, ancient temples, and bustling cultural hubs. Find popular destinations and unearth hidden gems waiting to share their stories.",
-            "cta_button_text": "Discover Destinations",
-            "cta_link": "pages/2_≡🎯🗺️🕌 Cultural Hotspots Map.py"  # Changed to file path
-        },
-        {
-            "imgSrc": "https://raw.githubusercontent.com/yashgupta17402/hero/main/handloom.PNG",
-            "title": "Travel with Purpose: Embrace Responsible Tourism",
-            "description": "Be a part of preserving India's cultural treasures. Learn how your travels can support local communities, protect heritage, and ensure these traditions thrive for generations.",
-            "cta_button_text": "Learn About Responsible Travel",
-            "cta_link": "pages/4_≡🌍♻️ Responsible Tourism Guide.py"  # Changed to file path
-        }
-    ]
-
-def get_top_cultural_states():
-    """Fetch top 3 most visited cultural states (simulated) based on 2023 data"""
-    return [
-        {
-            "state": "Uttar Pradesh", "visitors": "478.5M", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/up.PNG",
-            "description": "Featuring iconic monuments like the Taj Mahal, the spiritual city of Varanasi, and a rich historical tapestry.", "explore_url": "https://www.uptourism.gov.in/"
-        },
-        {
-            "state": "Tamil Nadu", "visitors": "286.0M", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/tamilnadu.PNG",
-            "description": "Home to magnificent ancient temples, classical dance forms, vibrant festivals, and rich Dravidian culture.", "explore_url": "https://www.tamilnadutourism.tn.gov.in/"
-        },
-        {
-            "state": "Karnataka", "visitors": "284.1M", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/karnataka.PNG",
-            "description": "A blend of ancient heritage with stunning palaces like Mysore, vibrant IT hubs, and rich traditions.", "explore_url": "https://www.karnatakatourism.org/"
-        }
-    ]
-
-def get_all_gi_art_forms():
-    """Fetch all GI-tagged art forms (simulated)"""
-    gi_art_forms = [
-        {
-            "name": "Madhubani Painting", "region": "Bihar", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/madhubani.PNG",
-            "description": "Characterized by geometric patterns and nature motifs, this ancient art form has been practiced for centuries.", "learn_more_url": "https://en.wikipedia.org/wiki/Madhubani_art"
-        },
-        {
-            "name": "Kani Shawls", "region": "Kashmir", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/kani.PNG",
-            "description": "It is one of the oldest handicrafts of Kashmir. This craft has been a part of the valley since the time of the Mughals. The shawls are woven from pashmina yarn.", "learn_more_url": "https://en.wikipedia.org/wiki/Kani_shawl"
-        },
-        {
-            "name": "Banarasi Silk", "region": "Uttar Pradesh", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/banaras_1.PNG",
-            "description": " Finest traditional sarees in India, renowned for their opulent embroidery and luxurious silk. These sarees are distinguished by their intricate brocade work, often featuring gold (zari) and silver (brocade) threads, woven into elaborate designs", "learn_more_url": "https://en.wikipedia.org/wiki/Banarasi_sari"
-        }
-    ]
-    return gi_art_forms
-
-def get_upcoming_festival():
-    """Fetch a major upcoming festival (simulated)"""
-    year = datetime.now().year
-    festivals_data = [
-        {"name": "Diwali", "month": 11, "day": 1, "location": "Nationwide", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/diwali.PNG", "description": "The festival of lights celebrates the victory of light over darkness with lamps, fireworks, and family gatherings."},
-        {"name": "Holi", "month": 3, "day": 25, "location": "Nationwide", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/holi.jpg", "description": "The colorful spring festival where people throw colored powders and water at each other in joyful celebration."},
-        {"name": "Pongal", "month": 1, "day": 14, "location": "Tamil Nadu", "image": "https://raw.githubusercontent.com/yashgupta17402/hero/main/pongal.jpg", "description": "A harvest festival dedicated to the Sun God, featuring elaborate kolam designs and special rice dishes."}
-    ]
-    now = datetime.now()
-    upcoming_festivals = []
-    for fest_template in festivals_data:
-        try:
-            fest_date_current_year = datetime(year, fest_template["month"], fest_template["day"])
-            if fest_date_current_year >= now:
-                upcoming_festivals.append({**fest_template, "date_obj": fest_date_current_year, "date": fest_date_current_year.strftime("%B %d, %Y")})
-            else:
-                fest_date_next_year = datetime(year + 1, fest_template["month"], fest_template["day"])
-                upcoming_festivals.append({**fest_template, "date_obj": fest_date_next_year, "date": fest_date_next_year.strftime("%B %d, %Y")})
-        except ValueError:
-            try:
-                fest_date_next_year = datetime(year + 1, fest_template["month"], fest_template["day"])
-                if fest_date_next_year >= now: upcoming_festivals.append({**fest_template, "date_obj": fest_date_next_year, "date": fest_date_next_year.strftime("%B %d, %Y")})
-                else: upcoming_festivals.append({**fest_template, "date_obj": datetime(year + 2, fest_template["month"], fest_template["day"]), "date": datetime(year + 2, fest_template["month"], fest_template["day"]).strftime("%B %d, %Y")})
-            except ValueError: st.warning(f"Warning: Could not parse date for {fest_template['name']}") # Changed to st.warning
-    if upcoming_festivals:
-        upcoming_festivals.sort(key=lambda x: x["date_obj"])
-        return upcoming_festivals[0]
-    return {"name": "No Upcoming Festivals Found", "date": "", "location": "", "image": "", "description": ""}
-
-@st.cache_data(ttl=3600)
+# --- Snowflake Data Loading ---
+# Declared TOURISM_TRENDS schema: the Arrow batches are cast to it once, so no per-column coercion passes
+TOURISM_TRENDS_SCHEMA = pa.schema([
+    ("YEAR", pa.int64()),
+    ("DOMESTIC_TOURIST_VISITS", pa.int64()),
+    ("FOREIGN_TOURIST_VISITS", pa.int64()),
+    ("ANNUAL_GROWTH_RATE_DOMESTIC", pa.float64()),
+    ("ANNUAL_GROWTH_RATE_FOREIGN", pa.float64()),
+])
+
+@st.cache_resource(ttl=3600)
 def load_tourism_trends_data():
+    """Typed TOURISM_TRENDS frame indexed by year, with the chart columns precomputed (shared, read-only)."""
     try:
-        conn = st.connection("snowflake")
-        query = """
-            SELECT
-                YEAR,
-                DOMESTIC_TOURIST_VISITS,
-                FOREIGN_TOURIST_VISITS,
-                ANNUAL_GROWTH_RATE_DOMESTIC,
-                ANNUAL_GROWTH_RATE_FOREIGN
-            FROM CULTURE_HERITAGE.PUBLIC.TOURISM_TRENDS
-            ORDER BY YEAR ASC;
-        """
-        df = conn.query(query)
-        if not df.empty:
-            df['YEAR_NUM'] = df['YEAR']
-            df['YEAR'] = pd.to_datetime(df['YEAR'].astype(str), format='%Y')
-            for col in ['DOMESTIC_TOURIST_VISITS', 'FOREIGN_TOURIST_VISITS']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            for col in ['ANNUAL_GROWTH_RATE_DOMESTIC', 'ANNUAL_GROWTH_RATE_FOREIGN']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        return df
+        table = fetch_arrow("tourism_trends")
+        if table is None: # no rows
+            return pd.DataFrame()
+        table = table.cast(TOURISM_TRENDS_SCHEMA)
+        df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+        df['YEAR_NUM'] = df['YEAR']
+        df['YEAR'] = pd.to_datetime(pd.DataFrame({'year': df['YEAR_NUM'], 'month': 1, 'day': 1}))
+        df['DOMESTIC_TOURIST_VISITS_MILLIONS'] = df['DOMESTIC_TOURIST_VISITS'] / 1000000
+        df['FOREIGN_TOURIST_VISITS_MILLIONS'] = df['FOREIGN_TOURIST_VISITS'] / 1000000
+        return df.set_index('YEAR')
     except Exception as e:
         st.error(f"Error loading tourism trends data from Snowflake: {e}")
         return pd.DataFrame()
@@ -209,7 +126,7 @@ div[data-testid="stButton-prev_side_btn"] > button:active, div[data-testid="stBu
 if 'slide_index' not in st.session_state:
     st.session_state.slide_index = 0
 if 'last_user_action_time' not in st.session_state:
-    st.session_state.last_user_action_time = time.time() - AUTOPLAY_INTERVAL
+    st.session_state.last_user_action_time = time.time()
 
 # --- App Welcome ---
 st.markdown("""
@@ -228,10 +145,12 @@ try:
 except FileNotFoundError:
     st.warning("Intro video (intro.mp4) not found. Please ensure it is in the same directory as home.py.")
 
-slides_data = get_slideshow_data()
-top_states = get_top_cultural_states()
-all_gi_art_forms = get_all_gi_art_forms()
-upcoming_festival = get_upcoming_festival()
+# Shared, read-only catalog: records are frozen and handed out by reference, never copied
+home_catalog = get_home_catalog()
+slides_data = home_catalog.slides
+top_states = home_catalog.top_states
+all_gi_art_forms = home_catalog.gi_art_forms
+festival_index = get_festival_index(home_catalog.version, date.today().year, home_catalog.festivals)
 tourism_trends_df = load_tourism_trends_data()
 
 def next_slide_action():
@@ -244,14 +163,14 @@ def prev_slide_action():
         st.session_state.slide_index = (st.session_state.slide_index - 1 + len(slides_data)) % len(slides_data)
     st.session_state.last_user_action_time = time.time()
 
-featured_art_form = None
-if all_gi_art_forms and len(all_gi_art_forms) > 0 :
-    current_gi_art_index = st.session_state.slide_index % len(all_gi_art_forms)
-    featured_art_form = all_gi_art_forms[current_gi_art_index]
-else:
-    featured_art_form = {"name": "No Art Form Data", "region": "", "image": "https://via.placeholder.com/300x200.png?text=No+Image", "description": "Please check data source.", "learn_more_url": "#"}
+def autoplay_slide_action():
+    """Advance the slideshow once AUTOPLAY_INTERVAL has passed since the last slide change."""
+    elapsed = time.time() - st.session_state.last_user_action_time
+    if elapsed >= AUTOPLAY_INTERVAL - AUTOPLAY_TIMER_SLACK:
+        next_slide_action()
 
-if slides_data:
+# --- Slideshow ---
+def render_slideshow():
     if st.session_state.slide_index >= len(slides_data):
         st.session_state.slide_index = 0
     current_slide_data = slides_data[st.session_state.slide_index]
@@ -263,18 +182,18 @@ if slides_data:
     with col_content:
         # --- MODIFIED SLIDESHOW RENDERING ---
         st.markdown(f"""
-        <div class="slide-display-container" key="html_div_key_slide_wrapper_{st.session_state.slide_index}"> 
+        <div class="slide-display-container" key="html_div_key_slide_wrapper_{st.session_state.slide_index}">
             <div class="slide-image-wrapper">
-                <img src="{current_slide_data['imgSrc']}" alt="{current_slide_data['title']}" class="slide-image">
+                {responsive_img(current_slide_data.img_src, current_slide_data.title, role="slide", css_class="slide-image")}
             </div>
             <div class="slide-text-content">
-                <h3>{current_slide_data['title']}</h3>
-                <p>{current_slide_data['description']}</p>
+                <h3>{current_slide_data.title}</h3>
+                <p>{current_slide_data.description}</p>
         """, unsafe_allow_html=True) # First part of HTML, divs not closed
 
         # Streamlit button for navigation
-        if st.button(current_slide_data['cta_button_text'], key=f"slide_cta_btn_{st.session_state.slide_index}"):
-            st.switch_page(current_slide_data['cta_link']) # cta_link is now the file path
+        if st.button(current_slide_data.cta_button_text, key=f"slide_cta_btn_{st.session_state.slide_index}"):
+            st.switch_page(current_slide_data.cta_link) # cta_link is now the file path
 
         # Close the HTML divs
         st.markdown("""
@@ -283,79 +202,97 @@ if slides_data:
 
     with col_next:
         st.button("▶︎", on_click=next_slide_action, key="next_side_btn", help="Next slide", use_container_width=True)
-else:
-    st.warning("Slideshow data is currently unavailable.")
 
-st.markdown("<div class='part2-content-wrapper'>", unsafe_allow_html=True)
-
-st.subheader("Most Visited Cultural States")
-st.markdown("Based on latest domestic tourism data analysis")
-if top_states:
-    state_cols = st.columns(len(top_states))
-    for i, state_data in enumerate(top_states):
-        with state_cols[i]:
+def render_top_states():
+    st.subheader("Most Visited Cultural States")
+    st.markdown("Based on latest domestic tourism data analysis")
+    if top_states:
+        state_cols = st.columns(len(top_states))
+        for i, state_data in enumerate(top_states):
+            with state_cols[i]:
+                st.markdown(f"""
+                <div class="feature-card">
+                    {responsive_img(state_data.image, state_data.state, role="card")}<h3>{state_data.state}</h3>
+                    <div class="stat">{state_data.visitors} visitors (2023)</div><p>{state_data.description}</p>
+                    <form action="{state_data.explore_url}" target="_blank"><button type="submit">Explore {state_data.state}</button></form>
+                </div>""", unsafe_allow_html=True)
+    else: st.info("Top cultural states data is currently unavailable.")
+
+# --- Featured Art Form (rotates in step with the slideshow) ---
+def render_featured_art_form():
+    st.subheader("Featured GI-Tagged Art Form")
+    st.markdown("Geographical Indication protected traditional crafts")
+    if all_gi_art_forms:
+        featured_art_form = all_gi_art_forms[st.session_state.slide_index % len(all_gi_art_forms)]
+        art_cols = st.columns([2, 3])
+        with art_cols[0]: st.image(image_file(featured_art_form.image, role="slide"), caption=featured_art_form.name, use_container_width=True)
+        with art_cols[1]:
             st.markdown(f"""
-            <div class="feature-card">
-                <img src="{state_data['image']}" alt="{state_data['state']}"><h3>{state_data['state']}</h3>
-                <div class="stat">{state_data['visitors']} visitors (2023)</div><p>{state_data['description']}</p>
-                <form action="{state_data['explore_url']}" target="_blank"><button type="submit">Explore {state_data['state']}</button></form>
+            <div class="data-card">
+                <h4>{featured_art_form.name}</h4><p class="stat">Region: {featured_art_form.region}</p>
+                <p class="description">{featured_art_form.description}</p>
+                <form action="{featured_art_form.learn_more_url}" target="_blank"><button type="submit">Learn More</button></form>
             </div>""", unsafe_allow_html=True)
-else: st.info("Top cultural states data is currently unavailable.")
-
-st.subheader("Featured GI-Tagged Art Form")
-st.markdown("Geographical Indication protected traditional crafts")
-if featured_art_form and featured_art_form.get("name") != "No Art Form Data":
-    art_cols = st.columns([2, 3])
-    with art_cols[0]: st.image(featured_art_form['image'], caption=featured_art_form['name'], use_container_width=True)
-    with art_cols[1]:
-        st.markdown(f"""
-        <div class="data-card">
-            <h4>{featured_art_form['name']}</h4><p class="stat">Region: {featured_art_form['region']}</p>
-            <p class="description">{featured_art_form['description']}</p>
-            <form action="{featured_art_form['learn_more_url']}" target="_blank"><button type="submit">Learn More</button></form>
-        </div>""", unsafe_allow_html=True)
-else: st.info("Featured art form data is currently unavailable or no art forms found.")
-
-st.subheader("Upcoming Cultural Festival")
-st.markdown("Plan your cultural immersion")
-if upcoming_festival and upcoming_festival.get('name') != "No Upcoming Festivals Found":
-    festival_cols = st.columns([3, 2])
-    with festival_cols[0]:
-        st.markdown(f"""
-        <div class="data-card"><h4>{upcoming_festival['name']}</h4><p class="stat">{upcoming_festival['date']}</p>
-            <p><strong>Location:</strong> {upcoming_festival['location']}</p><p class="description">{upcoming_festival['description']}</p>
-        </div>""", unsafe_allow_html=True)
-    with festival_cols[1]:
-        if upcoming_festival.get('image'): st.image(upcoming_festival['image'], caption=upcoming_festival['name'], use_container_width=True)
-        else: st.markdown("<p style='text-align:center;'>Image not available.</p>", unsafe_allow_html=True)
-else: st.info("Upcoming festival data is currently unavailable or no festivals are found.")
+    else: st.info("Featured art form data is currently unavailable or no art forms found.")
+
+# --- Rotating Sections (fragment: the autoplay timer and the slide buttons rerun only this region) ---
+# The slideshow and the featured art form share one fragment, so both read the
+# same slide_index whether it was advanced by the timer or by prev/next.
+@st.fragment(run_every=AUTOPLAY_INTERVAL)
+def render_rotating_sections():
+    autoplay_slide_action()
+    if slides_data:
+        render_slideshow()
+    else:
+        st.warning("Slideshow data is currently unavailable.")
+
+    st.markdown("<div class='part2-content-wrapper'>", unsafe_allow_html=True)
+    render_top_states()
+    render_featured_art_form()
+
+render_rotating_sections()
+
+# --- Upcoming Festivals (fragment: the state filter reruns only this section) ---
+@st.fragment
+def render_upcoming_festivals():
+    st.subheader("Upcoming Cultural Festivals")
+    st.markdown("Plan your cultural immersion")
+    selected_festival_state = st.selectbox("Filter by State", ["All States"] + festival_index.states, key="upcoming_festival_state_select")
+    upcoming_festivals = festival_index.upcoming(
+        date.today(), n=UPCOMING_FESTIVALS_COUNT,
+        state=None if selected_festival_state == "All States" else selected_festival_state
+    )
+    if upcoming_festivals:
+        upcoming_festival = upcoming_festivals[0]
+        festival_cols = st.columns([3, 2])
+        with festival_cols[0]:
+            st.markdown(f"""
+            <div class="data-card"><h4>{upcoming_festival.name}</h4><p class="stat">{upcoming_festival.date_label}</p>
+                <p><strong>Location:</strong> {upcoming_festival.location}</p><p class="description">{upcoming_festival.description}</p>
+            </div>""", unsafe_allow_html=True)
+        with festival_cols[1]:
+            if upcoming_festival.image: st.image(image_file(upcoming_festival.image, role="slide"), caption=upcoming_festival.name, use_container_width=True)
+            else: st.markdown("<p style='text-align:center;'>Image not available.</p>", unsafe_allow_html=True)
+        if len(upcoming_festivals) > 1:
+            st.markdown("##### Coming up next")
+            st.markdown("\n".join(f"- **{fest.name}** — {fest.date_label} · {fest.location}" for fest in upcoming_festivals[1:]))
+    else: st.info("Upcoming festival data is currently unavailable or no festivals are found.")
+
+render_upcoming_festivals()
 
 st.subheader("Tourism Trends in India")
 if not tourism_trends_df.empty:
     st.markdown("Historical data illustrating trends in domestic and foreign tourist visits, and their annual growth rates. Source: `CULTURE_HERITAGE.PUBLIC.TOURISM_TRENDS`")
     st.markdown("#### Annual Tourist Visits (in Millions)")
-    visits_chart_df = tourism_trends_df.copy()
-    if 'DOMESTIC_TOURIST_VISITS' in visits_chart_df.columns:
-        visits_chart_df['DOMESTIC_TOURIST_VISITS_MILLIONS'] = visits_chart_df['DOMESTIC_TOURIST_VISITS'] / 1000000
-    if 'FOREIGN_TOURIST_VISITS' in visits_chart_df.columns:
-        visits_chart_df['FOREIGN_TOURIST_VISITS_MILLIONS'] = visits_chart_df['FOREIGN_TOURIST_VISITS'] / 1000000
-    cols_to_plot_visits = [col for col in ['DOMESTIC_TOURIST_VISITS_MILLIONS', 'FOREIGN_TOURIST_VISITS_MILLIONS'] if col in visits_chart_df.columns]
-    if cols_to_plot_visits:
-        visits_to_plot = visits_chart_df.set_index('YEAR')[cols_to_plot_visits]
-        st.line_chart(visits_to_plot)
-        st.markdown("Note: Visits are displayed in millions.")
-    else: st.caption("Visit data columns not found for plotting.")
+    st.line_chart(tourism_trends_df[['DOMESTIC_TOURIST_VISITS_MILLIONS', 'FOREIGN_TOURIST_VISITS_MILLIONS']])
+    st.markdown("Note: Visits are displayed in millions.")
     with st.expander("View Raw Visits Data (from Snowflake)"):
-        st.dataframe(tourism_trends_df[['YEAR_NUM', 'DOMESTIC_TOURIST_VISITS', 'FOREIGN_TOURIST_VISITS']].rename(columns={'YEAR_NUM': 'Year'}))
+        st.dataframe(tourism_trends_df[['YEAR_NUM', 'DOMESTIC_TOURIST_VISITS', 'FOREIGN_TOURIST_VISITS']].rename(columns={'YEAR_NUM': 'Year'}), hide_index=True)
 
     st.markdown("#### Annual Growth Rates (%)")
-    cols_to_plot_growth = [col for col in ['ANNUAL_GROWTH_RATE_DOMESTIC', 'ANNUAL_GROWTH_RATE_FOREIGN'] if col in tourism_trends_df.columns]
-    if cols_to_plot_growth:
-        growth_to_plot = tourism_trends_df.set_index('YEAR')[cols_to_plot_growth]
-        st.line_chart(growth_to_plot)
-    else: st.caption("Growth rate data columns not found for plotting.")
+    st.line_chart(tourism_trends_df[['ANNUAL_GROWTH_RATE_DOMESTIC', 'ANNUAL_GROWTH_RATE_FOREIGN']])
     with st.expander("View Raw Growth Rate Data (from Snowflake)"):
-        st.dataframe(tourism_trends_df[['YEAR_NUM', 'ANNUAL_GROWTH_RATE_DOMESTIC', 'ANNUAL_GROWTH_RATE_FOREIGN']].rename(columns={'YEAR_NUM': 'Year'}))
+        st.dataframe(tourism_trends_df[['YEAR_NUM', 'ANNUAL_GROWTH_RATE_DOMESTIC', 'ANNUAL_GROWTH_RATE_FOREIGN']].rename(columns={'YEAR_NUM': 'Year'}), hide_index=True)
 else:
     st.warning("Tourism trends data could not be loaded. Please check Snowflake connection and table `CULTURE_HERITAGE.PUBLIC.TOURISM_TRENDS`.")
 
@@ -395,21 +332,6 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# --- Autoplay Logic ---
-if slides_data and len(slides_data) > 0:
-    next_autoplay_event_time = st.session_state.last_user_action_time + AUTOPLAY_INTERVAL
-    current_time = time.time()
-    time_to_wait = next_autoplay_event_time - current_time
-
-    if time_to_wait <= 0:
-        st.session_state.slide_index = (st.session_state.slide_index + 1) % len(slides_data)
-        st.session_state.last_user_action_time = time.time()
-        st.rerun()
-    else:
-        time.sleep(0.1)
-        st.rerun()
-else:
-    if 'initial_load_done' not in st.session_state:
-        st.session_state.initial_load_done = True
-        if not slides_data:
-            st.rerun()
\ No newline at end of file
+# --- Prefetch ---
+# Warm the other pages' Snowflake queries once per process, after this page has rendered
+warm_query_caches()
@@ -1,7 +1,14 @@
 import streamlit as st
 import pandas as pd
-import folium
-from streamlit_folium import folium_static
+import numpy as np
+import hashlib
+from dataclasses import dataclass
+from cultural_canvas.data import load_or_fallback, run_query, table_version, warm_query_caches
+from cultural_canvas.facets import FacetIndex
+from cultural_canvas.geo import resolve_coordinates
+from cultural_canvas.images import image_file, responsive_img
+from cultural_canvas.maps import location_preview
+from cultural_canvas.search import SearchIndex, highlight
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -11,9 +18,17 @@ st.set_page_config(
     page_icon="🎨"
 )
 
-# --- Snowflake Connection ---
-def get_snowflake_connection():
-    return st.connection("snowflake")
+# --- Cache Configuration ---
+ART_FORMS_TABLES = ("DANCE_FINAL", "CRAFT_IMAGE")  # a change to either rebuilds the shared frame
+ART_FORMS_CACHE_TTL = 3600 # seconds
+# Low-cardinality text columns stored as categoricals to keep the shared frame small
+ART_FORMS_CATEGORY_COLUMNS = ['type', 'state', 'govt_scheme', 'allocation_amount', 'artisan_cooperative', 'district', 'village_equivalent']
+ART_FORMS_COLUMNS = ['name', 'type', 'state', 'gi_tag', 'description', 'image_url', 'latitude', 'longitude', 'govt_scheme', 'allocation_amount', 'artisan_cooperative', 'district', 'village_equivalent']
+ART_FORMS_PAGE_SIZE = 12 # cards rendered per page (four rows of three)
+ART_FORMS_FACET_COLUMNS = ['state', 'type'] # columns with a filter selector
+ART_FORMS_RELATED_COUNT = 3
+# Fields covered by the search box and how much a match in each counts towards the ranking
+ART_FORMS_SEARCH_WEIGHTS = {'name': 4.0, 'state': 2.0, 'district': 1.5, 'village_equivalent': 1.5, 'description': 1.0}
 
 # --- Image Overrides ---
 ART_FORM_IMAGE_OVERRIDES = {
@@ -24,25 +39,8 @@ ART_FORM_IMAGE_OVERRIDES = {
 # --- Data Fetching Functions ---
 
 def get_crafts_from_snowflake():
-    """Fetch crafts data directly from Snowflake CRAFT_IMAGE table."""
-    try:
-        conn = get_snowflake_connection()
-        query = """
-        SELECT
-            "CRAFT" AS CRAFT_NAME_SF,
-            "DESCRIPTION" AS CRAFT_DESCRIPTION_SF,
-            "STATE" AS CRAFT_STATE_SF,
-            "DISTRICT" AS CRAFT_DISTRICT_SF,
-            "SUB_DISTRICT" AS CRAFT_VILLAGE_SF,
-            "IMAGE_URL" AS CRAFT_IMAGE_URL_SF
-        FROM
-            "CULTURE_HERITAGE"."PUBLIC"."CRAFT_IMAGE";
-        """
-        df = conn.query(query, ttl=3600)
-        return df
-    except Exception as e:
-        st.error(f"Error fetching crafts from Snowflake (CRAFT_IMAGE table): {e}")
-        return pd.DataFrame()
+    """Fetch crafts data directly from Snowflake CRAFT_IMAGE table (errors propagate to load_art_forms())."""
+    return run_query("crafts")
 
 # def get_paintings_from_snowflake():
 #     """Fetch painting data from Snowflake PAINTING table."""
@@ -57,31 +55,14 @@ def get_crafts_from_snowflake():
 #         return pd.DataFrame()
 
 def get_dances_from_snowflake():
-    """Fetch dance data from Snowflake DANCE_FINAL table."""
-    try:
-        conn = get_snowflake_connection()
-        query = """
-        SELECT
-            "DANCE" AS DANCE_NAME_SF,
-            "REGION_STATE" AS DANCE_REGION_STATE,
-            "DESCRIPTION" AS DANCE_DESC,
-            "IMAGE_URL" AS DANCE_IMAGE_URL_SF
-        FROM
-            "CULTURE_HERITAGE"."PUBLIC"."DANCE_FINAL"
-        WHERE "DANCE" <> 'Dance';  -- Added this line to exclude rows where DANCE is 'Dance'
-        """
-        df = conn.query(query, ttl=3600)
-        return df
-    except Exception as e:
-        st.error(f"Error fetching dances from Snowflake (DANCE_FINAL table): {e}")
-        return pd.DataFrame()
+    """Fetch dance data from Snowflake DANCE_FINAL table (errors propagate to load_art_forms())."""
+    return run_query("dances")
 
 def get_art_forms_combined():
     """
     Fetch art forms data, combining hardcoded data with data from Snowflake.
     """
     all_data_frames = []
-    state_coords_dict = get_state_coordinates()
 
     # # 1. Get hardcoded art forms -- COMMENTED OUT
     # hardcoded_art_forms_df = pd.DataFrame({
@@ -124,14 +105,13 @@ def get_art_forms_combined():
     # if not hardcoded_art_forms_df.empty:
     #     all_data_frames.append(hardcoded_art_forms_df)
 
-    # Helper function for image URL
-    def get_image_url(name, default_text, sf_image_url_value=None):
-        if sf_image_url_value and pd.notna(sf_image_url_value) and str(sf_image_url_value).strip():
-            return str(sf_image_url_value).strip()
-        if name in ART_FORM_IMAGE_OVERRIDES:
-            return ART_FORM_IMAGE_OVERRIDES[name]
-        image_text = name.replace(" ", "+").replace("/", "_") if pd.notna(name) else default_text
-        return f'https://via.placeholder.com/300x200.png?text={image_text}'
+    # Column-wise helpers: one pass per column instead of a Python call per row
+    def get_image_urls(names, sf_image_urls, default_text):
+        """Snowflake image URL where present, else the override, else a placeholder."""
+        sf_urls = sf_image_urls.astype("string").str.strip().fillna("")
+        image_text = names.astype("string").str.replace(" ", "+", regex=False).str.replace("/", "_", regex=False).fillna(default_text)
+        fallback = names.map(ART_FORM_IMAGE_OVERRIDES).fillna("https://via.placeholder.com/300x200.png?text=" + image_text)
+        return sf_urls.where(sf_urls != "", fallback)
 
     # # 2. Get PAINTINGS from Snowflake -- COMMENTED OUT
     # paintings_sf_df_raw = get_paintings_from_snowflake()
@@ -156,57 +136,49 @@ def get_art_forms_combined():
     # 3. Get DANCES from Snowflake (using DANCE_FINAL)
     dances_sf_df_raw = get_dances_from_snowflake()
     if not dances_sf_df_raw.empty:
-        transformed_dances_list = []
-        for _, row in dances_sf_df_raw.iterrows():
-            state = row.get('DANCE_REGION_STATE', None)
-            name = row.get('DANCE_NAME_SF', 'Unknown Dance')
-            desc = row.get('DANCE_DESC', f'Traditional dance form from {state if state else "India"}.')
-            sf_image_url = row.get('DANCE_IMAGE_URL_SF', None)
-            image_to_use = get_image_url(name, "Dance", sf_image_url)
-            lat, lon = (state_coords_dict.get(state, [None, None])) if state else (None, None)
-            transformed_dances_list.append({
-                'name': name, 'type': 'Dance', 'state': state, 'gi_tag': False,
-                'description': desc, 'image_url': image_to_use,
-                'latitude': lat, 'longitude': lon,
-                'govt_scheme': 'To be updated', 'allocation_amount': 'N/A', 'artisan_cooperative': 'To be updated',
-                'district': 'N/A', 'village_equivalent': 'N/A' # Dances typically don't have district/village level specifics here
-            })
-        all_data_frames.append(pd.DataFrame(transformed_dances_list))
+        states = dances_sf_df_raw['DANCE_REGION_STATE']
+        latitudes, longitudes = resolve_coordinates(states)
+        all_data_frames.append(pd.DataFrame({
+            'name': dances_sf_df_raw['DANCE_NAME_SF'], 'type': 'Dance', 'state': states, 'gi_tag': False,
+            'description': dances_sf_df_raw['DANCE_DESC'],
+            'image_url': get_image_urls(dances_sf_df_raw['DANCE_NAME_SF'], dances_sf_df_raw['DANCE_IMAGE_URL_SF'], "Dance"),
+            'latitude': latitudes, 'longitude': longitudes,
+            'govt_scheme': 'To be updated', 'allocation_amount': 'N/A', 'artisan_cooperative': 'To be updated',
+            'district': 'N/A', 'village_equivalent': 'N/A' # Dances typically don't have district/village level specifics here
+        }))
 
     # 4. Process CRAFTS data from CRAFT_IMAGE table
     crafts_sf_df_raw = get_crafts_from_snowflake()
     if not crafts_sf_df_raw.empty:
-        transformed_crafts_list = []
-        for _, row in crafts_sf_df_raw.iterrows():
-            name = row.get('CRAFT_NAME_SF', 'Unknown Craft')
-            description_from_sf = row.get('CRAFT_DESCRIPTION_SF', '')
-            state_from_sf = row.get('CRAFT_STATE_SF', 'N/A')
-            district_from_sf = row.get('CRAFT_DISTRICT_SF', 'N/A')
-            village_from_sf = row.get('CRAFT_VILLAGE_SF', 'N/A')
-            sf_image_url = row.get('CRAFT_IMAGE_URL_SF', None)
-
-            image_to_use = get_image_url(name, "Craft", sf_image_url)
-            lat, lon = (state_coords_dict.get(state_from_sf, [None, None])) if state_from_sf and pd.notna(state_from_sf) else (None, None)
-
-            final_description = description_from_sf
-            if not (pd.notna(description_from_sf) and description_from_sf.strip()):
-                loc_parts = []
-                if village_from_sf and village_from_sf != 'N/A': loc_parts.append(village_from_sf)
-                if district_from_sf and district_from_sf != 'N/A': loc_parts.append(district_from_sf)
-                if state_from_sf and state_from_sf != 'N/A': loc_parts.append(state_from_sf)
-                final_description = f"A traditional {name} from {', '.join(loc_parts)}." if loc_parts else f"A traditional {name} from India."
-
-            transformed_crafts_list.append({
-                'name': name, 'type': 'Craft', 'state': state_from_sf, 'gi_tag': False,
-                'description': final_description, 'image_url': image_to_use,
-                'latitude': lat, 'longitude': lon,
-                'govt_scheme': 'To be updated', 'allocation_amount': 'N/A', 'artisan_cooperative': 'To be updated',
-                'district': district_from_sf, 'village_equivalent': village_from_sf
-            })
-        all_data_frames.append(pd.DataFrame(transformed_crafts_list))
+        names = crafts_sf_df_raw['CRAFT_NAME_SF']
+        states = crafts_sf_df_raw['CRAFT_STATE_SF']
+        descriptions = crafts_sf_df_raw['CRAFT_DESCRIPTION_SF']
+        # District/sub-district coordinates where the store has them, else the state centroid
+        latitudes, longitudes = resolve_coordinates(states, crafts_sf_df_raw['CRAFT_DISTRICT_SF'], crafts_sf_df_raw['CRAFT_VILLAGE_SF'])
+
+        # Synthesize "A traditional X from village, district, state." where the description is blank
+        missing_desc = descriptions.astype("string").str.strip().fillna("") == ""
+        if missing_desc.any():
+            loc_parts = crafts_sf_df_raw.loc[missing_desc, ['CRAFT_VILLAGE_SF', 'CRAFT_DISTRICT_SF', 'CRAFT_STATE_SF']].astype("string")
+            loc_parts = loc_parts.where((loc_parts != 'N/A') & (loc_parts != ''))
+            location = loc_parts['CRAFT_VILLAGE_SF']
+            for col in ('CRAFT_DISTRICT_SF', 'CRAFT_STATE_SF'):
+                part = loc_parts[col]
+                location = location.where(part.isna(), location.str.cat(part, sep=", ").fillna(part))
+            synthesized = "A traditional " + names[missing_desc].astype("string") + " from " + location.fillna("India") + "."
+            descriptions = descriptions.astype(object).where(~missing_desc, synthesized.astype(object))
+
+        all_data_frames.append(pd.DataFrame({
+            'name': names, 'type': 'Craft', 'state': states, 'gi_tag': False,
+            'description': descriptions,
+            'image_url': get_image_urls(names, crafts_sf_df_raw['CRAFT_IMAGE_URL_SF'], "Craft"),
+            'latitude': latitudes, 'longitude': longitudes,
+            'govt_scheme': 'To be updated', 'allocation_amount': 'N/A', 'artisan_cooperative': 'To be updated',
+            'district': crafts_sf_df_raw['CRAFT_DISTRICT_SF'], 'village_equivalent': crafts_sf_df_raw['CRAFT_VILLAGE_SF']
+        }))
 
     if not all_data_frames: # If no data from any source
-        return pd.DataFrame(columns=['name', 'type', 'state', 'gi_tag', 'description', 'image_url', 'latitude', 'longitude', 'govt_scheme', 'allocation_amount', 'artisan_cooperative', 'district', 'village_equivalent'])
+        return pd.DataFrame(columns=ART_FORMS_COLUMNS)
 
     combined_df = pd.concat(all_data_frames, ignore_index=True)
     if not combined_df.empty and 'name' in combined_df.columns and 'state' in combined_df.columns:
@@ -214,24 +186,41 @@ def get_art_forms_combined():
         combined_df.drop_duplicates(subset=['name', 'state'], keep='first', inplace=True)
     return combined_df
 
-def get_state_coordinates():
-    """Get approximate coordinates for Indian states."""
-    return {
-        'Andhra Pradesh': [16.5, 80.6], 'Arunachal Pradesh': [27.1004, 93.6167], 'Assam': [26.2006, 92.9376],
-        'Bihar': [25.4, 85.4], 'Chhattisgarh': [21.3, 81.6], 'Goa': [15.2993, 74.1240],
-        'Gujarat': [22.3, 72.6], 'Haryana': [29.0588, 76.0856],
-        'Himachal Pradesh': [31.1048, 77.1734], 'Jharkhand': [23.6102, 85.2799],
-        'Jammu & Kashmir': [34.1, 74.8], 'Karnataka': [15.3, 75.7], 'Kerala': [10.8, 76.3],
-        'Madhya Pradesh': [23.2, 77.4], 'Maharashtra': [19.2, 73.2], 'Manipur': [24.6637, 93.9063],
-        'Meghalaya': [25.4670, 91.3662], 'Mizoram': [23.1645, 92.9376], 'Nagaland': [26.1584, 94.5624],
-        'Odisha': [20.3, 85.8], 'Punjab': [31.1, 75.3], 'Rajasthan': [27.0, 74.2],
-        'Sikkim': [27.5330, 88.5122], 'Tamil Nadu': [11.1, 78.7], 'Telangana': [18.1124, 79.0193],
-        'Tripura': [23.9408, 91.9882], 'Uttar Pradesh': [26.8, 80.9], 'Uttarakhand': [30.0668, 79.0193],
-        'West Bengal': [22.6, 88.4],
-        'Odisha, West Bengal': [21.5, 87.0], 'Odisha, Jharkhand, West Bengal': [22.5, 87.0],
-        'Gujarat, Madhya Pradesh': [22.8, 73.0], 'Rajasthan, Himachal Pradesh': [29.0, 76.0],
-        'Andhra Pradesh, Telangana': [17.0, 79.5]
-    }
+def art_form_id(name, state):
+    """Stable short ID for an art form; (name, state) is the key the combined frame is deduplicated on."""
+    return hashlib.sha1(f"{name}|{state}".encode("utf-8")).hexdigest()[:12]
+
+@dataclass(frozen=True, slots=True)
+class ArtFormsCatalog:
+    df: pd.DataFrame  # row labels == positions, which the indexes below store
+    search_index: SearchIndex
+    facets: FacetIndex
+    positions: dict  # art_id -> row position
+
+def build_art_forms_catalog(df):
+    """The art-forms frame with IDs and categorical columns, and the indexes over its rows."""
+    df = df.reset_index(drop=True)
+    df['art_id'] = [art_form_id(name, state) for name, state in zip(df['name'], df['state'])]
+    for col in ART_FORMS_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return ArtFormsCatalog(
+        df=df,
+        search_index=SearchIndex(df, ART_FORMS_SEARCH_WEIGHTS),
+        facets=FacetIndex(df, ART_FORMS_FACET_COLUMNS),
+        positions=dict(zip(df['art_id'], range(len(df)))),
+    )
+
+# One entry holds the frame and every index over it, so they expire and are replaced together
+# and an index never points into a different frame. max_entries=1 is the only memory bound:
+# one catalog per process, however many rows the tables hold; a new table version evicts the old one.
+@st.cache_resource(ttl=ART_FORMS_CACHE_TTL, max_entries=1, show_spinner="Loading art forms...")
+def load_art_forms(version):
+    """Art-forms catalog for one source-table version, shared read-only by all sessions.
+
+    Raises when either source query fails, so a partial catalog is never cached.
+    """
+    return build_art_forms_catalog(get_art_forms_combined())
 
 # --- CSS Styling ---
 st.markdown("""
@@ -276,59 +265,110 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# --- Load Data (with caching in session_state) ---
-if 'art_forms_df' not in st.session_state:
-    st.session_state.art_forms_df = get_art_forms_combined()
-art_forms_df = st.session_state.art_forms_df
+# --- Load Data (shared across sessions; treat as read-only) ---
+# While a source can't be read, an empty catalog is served and Snowflake is retried every FALLBACK_RETRY_INTERVAL
+art_forms, art_forms_error = load_or_fallback(
+    "art_forms",
+    lambda: load_art_forms(table_version(ART_FORMS_TABLES)),
+    lambda: build_art_forms_catalog(pd.DataFrame(columns=ART_FORMS_COLUMNS)),
+)
+if art_forms_error is not None:
+    st.error(f"Error loading art forms from Snowflake (DANCE_FINAL and CRAFT_IMAGE tables): {art_forms_error}")
+art_forms_df = art_forms.df
+art_search_index = art_forms.search_index
+art_facets = art_forms.facets
+art_positions = art_forms.positions
+
+# --- Selected Art Form & Deep Links ---
+# The open detail view is mirrored in the URL (?art=<art_id>) so it can be shared or bookmarked
+def open_art_form(art_id):
+    st.session_state.selected_art = art_id
+    st.query_params["art"] = art_id
+
+def close_art_form():
+    st.session_state.pop('selected_art', None)
+    st.query_params.pop("art", None)
+
+linked_art_id = st.query_params.get("art")
+if linked_art_id and linked_art_id != st.session_state.get('selected_art'):
+    st.session_state.selected_art = linked_art_id
 
 # --- Filters ---
+# Counts for each selector honour the other selector and the search box, whose values
+# are read from session state because those widgets render later in the script.
+search_term = st.session_state.get("search_art_forms_input_main", "")
+search_positions = art_search_index.search(search_term) if search_term else None # best match first
+search_mask = None
+if search_positions is not None:
+    search_mask = np.zeros(len(art_forms_df), dtype=bool)
+    search_mask[search_positions] = True
+
+def facet_selection(key, all_label):
+    value = st.session_state.get(key, all_label)
+    return None if value == all_label else value
+
 st.markdown('<div class="filter-section">', unsafe_allow_html=True)
 filter_cols = st.columns(3)
 with filter_cols[0]:
-    unique_states = []
-    if not art_forms_df.empty and 'state' in art_forms_df.columns:
-        valid_states = [s for s in art_forms_df['state'].dropna().unique() if s and str(s).strip() and str(s) != 'N/A']
-        unique_states = sorted(list(set(valid_states)))
-    selected_state = st.selectbox("Filter by State", ["All States"] + unique_states, key="state_filter_select_main")
+    state_counts = art_facets.counts('state', within=art_facets.select({'type': facet_selection("type_filter_select_main", "All Types")}, within=search_mask))
+    selected_state = st.selectbox(
+        "Filter by State", ["All States"] + art_facets.values('state'), key="state_filter_select_main",
+        format_func=lambda s: s if s == "All States" else f"{s} ({state_counts[s]:,})"
+    )
 
 with filter_cols[1]:
-    unique_types = []
-    if not art_forms_df.empty and 'type' in art_forms_df.columns:
-        valid_types = [t for t in art_forms_df['type'].dropna().unique() if t and str(t).strip()] # Ensure types are valid strings
-        unique_types = sorted(list(set(valid_types)))
-    selected_type = st.selectbox("Filter by Art Type", ["All Types"] + unique_types, key="type_filter_select_main")
+    type_counts = art_facets.counts('type', within=art_facets.select({'state': facet_selection("state_filter_select_main", "All States")}, within=search_mask))
+    selected_type = st.selectbox(
+        "Filter by Art Type", ["All Types"] + art_facets.values('type'), key="type_filter_select_main",
+        format_func=lambda t: t if t == "All Types" else f"{t} ({type_counts[t]:,})"
+    )
 
 with filter_cols[2]:
     search_term = st.text_input("Search Art Forms", key="search_art_forms_input_main")
 st.markdown('</div>', unsafe_allow_html=True)
 
 # --- Apply Filters ---
-filtered_df = art_forms_df.copy()
-if selected_state != "All States":
-    if not filtered_df.empty and 'state' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['state'].astype(str) == selected_state]
-if selected_type != "All Types":
-    if not filtered_df.empty and 'type' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['type'].astype(str) == selected_type]
-if search_term:
-    if not filtered_df.empty:
-        name_series = filtered_df['name'].astype(str) if 'name' in filtered_df.columns else pd.Series(dtype=str)
-        desc_series = filtered_df['description'].astype(str) if 'description' in filtered_df.columns else pd.Series(dtype=str)
-        
-        name_condition = name_series.str.contains(search_term, case=False, na=False)
-        desc_condition = desc_series.str.contains(search_term, case=False, na=False)
-        filtered_df = filtered_df[name_condition | desc_condition]
+# Facet masks are ANDed; rows keep catalog order, or search rank when there is a search term
+facet_mask = art_facets.select({
+    'state': None if selected_state == "All States" else selected_state,
+    'type': None if selected_type == "All Types" else selected_type,
+})
+if search_positions is not None:
+    filtered_positions = search_positions[facet_mask[search_positions]]
+else:
+    filtered_positions = np.flatnonzero(facet_mask)
+
+# --- Pagination ---
+# The cursor lives in session state and goes back to the first page whenever the filters change
+filter_signature = (selected_state, selected_type, search_term)
+if st.session_state.get('art_forms_filter_signature') != filter_signature:
+    st.session_state.art_forms_filter_signature = filter_signature
+    st.session_state.art_forms_page = 0
+
+total_art_forms = len(filtered_positions)
+num_pages = max(1, -(-total_art_forms // ART_FORMS_PAGE_SIZE))
+current_page = min(st.session_state.get('art_forms_page', 0), num_pages - 1)
+page_start = current_page * ART_FORMS_PAGE_SIZE
+# Only this page's rows are copied out of the shared frame, which is never modified
+page_df = art_forms_df.iloc[filtered_positions[page_start:page_start + ART_FORMS_PAGE_SIZE]]
+
+def prev_page_action():
+    st.session_state.art_forms_page = max(0, current_page - 1)
+
+def next_page_action():
+    st.session_state.art_forms_page = min(num_pages - 1, current_page + 1)
 
 # --- Display Art Forms Grid ---
-if filtered_df.empty:
+if not total_art_forms:
     st.info("No art forms match your filters. Try adjusting your criteria, or check if data is available from the sources.")
 else:
+    st.caption(f"Showing {page_start + 1:,}–{page_start + len(page_df):,} of {total_art_forms:,} art forms")
     num_columns = 3
-    for i in range(0, len(filtered_df), num_columns):
+    for i in range(0, len(page_df), num_columns):
         cols = st.columns(num_columns)
         for j in range(num_columns):
-            if i + j < len(filtered_df):
-                art = filtered_df.iloc[i + j]
+            if i + j < len(page_df):
+                art = page_df.iloc[i + j]
                 with cols[j]:
                     art_description_text = str(art.get('description', 'No description available.'))
                     if len(art_description_text) > 100:
@@ -336,39 +376,45 @@ else:
                     
                     art_image_url_val = art.get('image_url', 'https://via.placeholder.com/300x200.png?text=Image+Not+Available')
                     art_name_val = art.get('name', 'N/A')
-                    art_name_for_key_val = "".join(c if c.isalnum() else "_" for c in str(art_name_val))
+                    art_name_html = highlight(str(art_name_val), SearchIndex.match_spans(search_term, str(art_name_val)))
+                    art_description_html = highlight(art_description_text, SearchIndex.match_spans(search_term, art_description_text))
 
                     gi_tag_html = '<span class="gi-tag">GI Tagged</span>' if art.get('gi_tag', False) else '<span class="non-gi-tag">Non GI</span>'
 
                     st.markdown(f"""
                     <div class="art-card">
-                        <img src="{art_image_url_val}" class="art-card-image" alt="{art_name_val}">
+                        {responsive_img(art_image_url_val, art_name_val, role="card", css_class="art-card-image")}
                         <div class="art-card-content">
-                            <div class="art-card-title">{art_name_val}</div>
+                            <div class="art-card-title">{art_name_html}</div>
                             <div class="art-card-subtitle">{art.get('type', 'N/A')} • {art.get('state', 'N/A')}</div>
-                            <div class="art-card-description">{art_description_text}</div>
+                            <div class="art-card-description">{art_description_html}</div>
                             <div class="art-card-footer">{gi_tag_html}</div>
                         </div>
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    button_key = f"view_details_{art_name_for_key_val}_{i}_{j}"
-                    if st.button(f"View Details: {art_name_val}", key=button_key):
-                        st.session_state.selected_art = art_name_val
-                        st.rerun()
+                    button_key = f"view_details_{art['art_id']}" # stable across pages, reruns and reloads
+                    st.button(f"View Details: {art_name_val}", key=button_key, on_click=open_art_form, args=(art['art_id'],))
+
+    if num_pages > 1:
+        pager_cols = st.columns([1, 2, 1])
+        with pager_cols[0]:
+            st.button("← Previous", on_click=prev_page_action, disabled=current_page == 0, key="art_forms_prev_page", use_container_width=True)
+        with pager_cols[1]:
+            st.markdown(f"<div style='text-align: center;'>Page {current_page + 1} of {num_pages:,}</div>", unsafe_allow_html=True)
+        with pager_cols[2]:
+            st.button("Next →", on_click=next_page_action, disabled=current_page >= num_pages - 1, key="art_forms_next_page", use_container_width=True)
 
 # --- Detailed View ---
 if 'selected_art' in st.session_state and st.session_state.selected_art:
-    selected_art_name = st.session_state.selected_art
+    selected_art_id = st.session_state.selected_art
     if not art_forms_df.empty and 'name' in art_forms_df.columns:
-        art_series_list = art_forms_df[art_forms_df['name'] == selected_art_name]
-        if not art_series_list.empty:
-            art = art_series_list.iloc[0]
+        selected_position = art_positions.get(selected_art_id) # O(1) by ID instead of a scan by name
+        if selected_position is not None:
+            art = art_forms_df.iloc[selected_position]
 
             st.markdown('<div class="detail-container">', unsafe_allow_html=True)
-            if st.button("← Back to Art Forms", key="detail_view_back_button"):
-                del st.session_state.selected_art
-                st.rerun()
+            st.button("← Back to Art Forms", key="detail_view_back_button", on_click=close_art_form)
 
             gi_tag_detail_html = '<span class="gi-tag">GI Tagged</span>' if art.get('gi_tag', False) else '<span class="non-gi-tag">Non GI</span>'
             art_name_display = art.get('name', 'N/A')
@@ -379,7 +425,7 @@ if 'selected_art' in st.session_state and st.session_state.selected_art:
                 {gi_tag_detail_html}
             </div>""", unsafe_allow_html=True)
 
-            st.image(art.get('image_url', 'https://via.placeholder.com/300x200.png?text=Image+Not+Available'),
+            st.image(image_file(art.get('image_url', 'https://via.placeholder.com/300x200.png?text=Image+Not+Available'), role="detail"),
                      use_container_width=True, caption=f"{art_name_display} - {art.get('type', 'N/A')} from {art.get('state', 'N/A')}")
 
             st.markdown(f"### About {art_name_display}")
@@ -432,25 +478,40 @@ if 'selected_art' in st.session_state and st.session_state.selected_art:
                 try:
                     art_lat_float = float(art_lat)
                     art_lon_float = float(art_lon)
-                    m = folium.Map(location=[art_lat_float, art_lon_float], zoom_start=7)
-                    folium.Marker(
-                        [art_lat_float, art_lon_float],
-                        popup=f"{art_name_display}<br>{art.get('state', 'N/A')}",
+                    location_preview(
+                        art_lat_float, art_lon_float,
                         tooltip=art_name_display,
-                        icon=folium.Icon(color="red", icon="palette", prefix="fa")
-                    ).add_to(m)
-                    folium.Circle(
-                        [art_lat_float, art_lon_float], radius=50000, color="#FF6347",
-                        fill=True, fill_color="#FF6347", fill_opacity=0.2
-                    ).add_to(m)
-                    folium_static(m)
+                        popup_html=f"{art_name_display}<br>{art.get('state', 'N/A')}",
+                        key="art_location_map"
+                    )
                 except ValueError:
                     st.warning(f"Map could not be displayed for '{art_name_display}' due to invalid coordinates.")
             else:
                 st.info(f"Location data (latitude/longitude) is not available for '{art_name_display}' to display on the map.")
-            
+
+            # Related: same state first, then same type, straight from the facet index (no frame scan)
+            related_positions = []
+            for facet in ('state', 'type'):
+                for pos in art_facets.positions(facet, str(art.get(facet)))[:2 * ART_FORMS_RELATED_COUNT + 1]:
+                    if pos != selected_position and pos not in related_positions:
+                        related_positions.append(pos)
+            related_positions = related_positions[:ART_FORMS_RELATED_COUNT]
+            if related_positions:
+                st.markdown("### Related Art Forms")
+                related_cols = st.columns(ART_FORMS_RELATED_COUNT)
+                for col, pos in zip(related_cols, related_positions):
+                    related = art_forms_df.iloc[pos]
+                    with col:
+                        st.markdown(responsive_img(related['image_url'], related['name'], role="card", css_class="art-card-image"), unsafe_allow_html=True)
+                        st.button(f"{related['name']} ({related['type']} • {related['state']})", key=f"related_{related['art_id']}",
+                                  on_click=open_art_form, args=(related['art_id'],), use_container_width=True)
+
             st.markdown("</div>", unsafe_allow_html=True)
-        elif selected_art_name: 
-            st.warning(f"Details for '{selected_art_name}' could not be found in the current dataset.")
-    elif selected_art_name:
-        st.warning(f"Art forms data is not available. Cannot display details for '{selected_art_name}'.")
\ No newline at end of file
+        elif selected_art_id:
+            st.warning(f"Details for art form '{selected_art_id}' could not be found in the current dataset.")
+    elif selected_art_id:
+        st.warning(f"Art forms data is not available. Cannot display details for art form '{selected_art_id}'.")
+
+# --- Prefetch ---
+# Warm the other pages' Snowflake queries once per process, after this page has rendered
+warm_query_caches()
@@ -1,9 +1,15 @@
 import streamlit as st
 import pandas as pd
 import folium
-from streamlit_folium import st_folium
 import plotly.express as px
 import plotly.graph_objects as go
+from cultural_canvas.asi_stats import ASI_DATASET_VERSION, load_top_monuments, load_visitor_trends
+from cultural_canvas.data import load_or_fallback, run_query, table_version, warm_query_caches
+from cultural_canvas.festival_calendar import load_festival_rows
+from cultural_canvas.geo import resolve_coordinates
+from cultural_canvas.maps import clustered_marker_layer, marker_payload, render_shared_map
+from cultural_canvas.search import TrigramIndex
+from cultural_canvas.spatial import SpatialIndex, heritage_points
 # from datetime import datetime # Not used in the provided snippet
 # import random # Not used in the provided snippet
 
@@ -15,104 +21,22 @@ st.set_page_config(
     page_icon="🏛️"
 )
 
-# --- Snowflake Connection ---
-def get_snowflake_connection():
-    """Helper function to get Snowflake connection."""
-    return st.connection("snowflake")
-
 # --- Load UNESCO Sites Data from Snowflake ---
 def load_unesco_sites_from_snowflake():
     """Load UNESCO World Heritage Sites data from Snowflake."""
     try:
-        conn = get_snowflake_connection()
-        query = """
-        SELECT
-            NAME AS "Name",
-            CITY AS "City",
-            DISTRICT AS "District",
-            STATE_UT AS "State/UT",
-            DESCRIPTION AS "Short Description",
-            LATITUDE AS "Latitude",
-            LONGITUDE AS "Longitude"
-        FROM UNESCO_INDIA_SITES;
-        """
-        df = conn.query(query, ttl=3600)
+        df = run_query("unesco_sites")
         if "Latitude" in df.columns:
             df["Latitude"] = pd.to_numeric(df["Latitude"], errors='coerce')
         if "Longitude" in df.columns:
             df["Longitude"] = pd.to_numeric(df["Longitude"], errors='coerce')
         df.dropna(subset=["Latitude", "Longitude"], inplace=True)
+        df["Official URL"] = match_site_urls(tuple(df["Name"]))
         return df
     except Exception as e:
         st.error(f"Error loading UNESCO sites from Snowflake: {e}")
         return pd.DataFrame()
 
-# --- Dummy Data Loaders for ASI Visitor Statistics ---
-# !!! IMPORTANT: Replace these with your actual data loading functions !!!
-def load_asi_visitor_trends_data():
-    """
-    Loads dummy data mimicking Table 4.2.1: Visitors to Centrally Protected Ticketed Monuments.
-    Replace this with your actual data source.
-    """
-    data = {
-        'Year': ['1996', '1997', '1998', '1999', '2000', '2001', '2002', '2003', '2004', '2005', '2006', '2007', '2008', '2009', '2010', '2011', '2012', '2013', '2014', '2015', '2016-17*', '2017-18', '2018-19', '2019-20', '2020-21', '2021-22', '2022-23', '2023-24'],
-        'No. of Centrally Protected Ticketed ASI Monuments': [68, 68, 68, 68, 126, 126, 126, 126, 116, 116, 116, 116, 117, 119, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 136, 144, 144, 145],
-        'Domestic Visitors': ['N.A', 'N.A', 'N.A', 'N.A', 'N.A', 'N.A', 17333055, 19551820, 20356940, 21035864, 23815252, 23450419, 28786608, 30804103, 35770242, 40534481, 43259075, 43019998, 45425859, 50988730, 40167938, 48394768, 47316029, 43607075, 13153076, 26046891, 47901021, 53090007],
-        'Foreign Visitors': ['N.A', 'N.A', 'N.A', 'N.A', 'N.A', 'N.A', 837012, 1216615, 1788753, 2122436, 2250502, 2614254, 2679763, 2195382, 2998175, 2948065, 3064778, 2995852, 2792272, 2620228, 2379389, 3397673, 3576837, 2756561, 415859, 116114, 1445363, 2314641],
-        'Total Visitors': [10956764, 15767820, 13317242, 20502547, 19539127, 20364901, 18170067, 20768435, 22145693, 23158300, 26065754, 26064673, 31466371, 32999485, 38768417, 43482546, 46323853, 46015850, 48218131, 53608958, 42547327, 51792441, 50892866, 46363636, 13568935, 26163005, 49346384, 55404648],
-        'Domestic Growth Rate (%)': ['-', '-', '-', '-', '-', '-', '-', 12.80, 4.1, 3.3, 13.2, -1.5, 22.8, 7.0, 16.1, 13.3, 6.7, -0.6, 5.6, 12.2, -21.2, 20.5, -2.2, -7.8, -69.8, 98.0, 83.9, 10.8],
-        'Foreign Growth Rate (%)': ['-', '-', '-', '-', '-', '-', '-', 45.4, 47.0, 18.7, 6.0, 16.2, 2.5, -18.1, 36.6, -1.7, 4.0, -2.2, -6.8, -6.2, -9.2, 42.8, 5.3, -22.9, -84.9, -72.0, 1144.7, 60.1],
-        'Total Growth Rate (%)': ['-', '-', 43.9, -15.5, 54.0, -4.7, -4.2, 10.8, 14.3, 6.6, 4.6, 12.6, 0.0, 20.7, 4.9, 17.5, 12.0, 6.5, -0.7, 4.8, -11.2, -20.6, 25.4, -1.7, -7.0, -70.7, 92.8, 88.6] # Corrected length
-    }
-    df = pd.DataFrame(data)
-    # Convert growth rates to numeric, coercing errors for '-'
-    for col in ['Domestic Growth Rate (%)', 'Foreign Growth Rate (%)', 'Total Growth Rate (%)']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-    # Convert visitor numbers to numeric, coercing errors for 'N.A'
-    for col in ['Domestic Visitors', 'Foreign Visitors', 'Total Visitors', 'No. of Centrally Protected Ticketed ASI Monuments']: # Added last one for potential charting
-        df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce')
-    return df
-
-def load_asi_top_monuments_data():
-    """
-    Loads dummy data mimicking Table 4.2.2: Top 10 ASI Monuments by Visitors FY 2023-24.
-    Replace this with your actual data source.
-    """
-    domestic_data = {
-        'Rank': list(range(1, 11)) + ['Others', 'Total'],
-        'Name of Monument (Domestic)': [
-            'Taj Mahal', 'Sun Temple, Konark', 'Qutub Minar', 'Red Fort', 'Ellora Caves',
-            'Golconda Fort', 'Agra Fort', 'Tomb of Rabia Durani (Bibi ka Maqbara)',
-            'Charminar', 'Shaniwarwada', 'Various Others', 'Grand Total Domestic' # Made generic for dummy
-        ],
-        'No. of Domestic Visitors': [
-            6098876, 3196903, 3123643, 2794083, 1740513, 1608085, 1410397,
-            1295076, 1290074, 1260792, 29271565, 53090007
-        ],
-        '% Share (Domestic)': [
-            11.5, 6.0, 5.9, 5.3, 3.3, 3.0, 2.7, 2.4, 2.4, 2.4, 55.1, 100.0
-        ]
-    }
-    foreign_data = {
-        'Rank': list(range(1, 11)) + ['Others', 'Total'],
-        'Name of Monument (Foreign)': [
-            'Taj Mahal', 'Qutub Minar', 'Agra Fort', "Humayun's Tomb", 'Step Well (Baori) at Abhaneri',
-            'Fatehpur Sikri', 'Itimad-Ud-Daulah Tomb', 'Red Fort', 'Excavated Remains, Sarnath',
-            'Site of Sahet Mahet', 'Various Others', 'Grand Total Foreign' # Made generic for dummy
-        ],
-        'No. of Foreign Visitors': [
-            681339, 220017, 218144, 116904, 96080, 93963, 84326, 84177, 76785, 71120, 571786, 2314641
-        ],
-        '% Share (Foreign)': [
-            29.4, 9.5, 9.4, 5.1, 4.2, 4.1, 3.6, 3.6, 3.3, 3.1, 24.7, 100.0
-        ]
-    }
-    df_domestic = pd.DataFrame(domestic_data)
-    df_foreign = pd.DataFrame(foreign_data)
-    df_domestic['Rank'] = df_domestic['Rank'].astype(str)
-    df_foreign['Rank'] = df_foreign['Rank'].astype(str)
-    return df_domestic, df_foreign
-
 # Dictionary of official URLs for UNESCO sites
 UNESCO_SITE_URLS = {
     "Khajuraho Group of Monuments": "https://www.indiaculture.gov.in/khajuraho-group-monuments",
@@ -154,6 +78,181 @@ UNESCO_SITE_URLS = {
     "Jaipur city, Rajasthan": "https://www.indiaculture.gov.in/jaipur-city-rajasthan"
 }
 
+# --- Fuzzy Site Lookup ---
+UNESCO_TABLES = ("UNESCO_INDIA_SITES",)
+UNESCO_SEARCH_WEIGHTS = {"Name": 1.0, "City": 0.7, "District": 0.6, "State/UT": 0.5}
+UNESCO_SEARCH_LIMIT = 5
+UNESCO_URL_MIN_SIMILARITY = 0.7  # e.g. "Chhatrapati Shival Terminus" still joins, distinct sites sharing "Group of Monuments at" don't
+
+@st.cache_resource(show_spinner=False)
+def load_site_url_index():
+    """Trigram index over the UNESCO_SITE_URLS names."""
+    return list(UNESCO_SITE_URLS.values()), TrigramIndex(pd.DataFrame({"Name": list(UNESCO_SITE_URLS)}), {"Name": 1.0})
+
+@st.cache_data(show_spinner=False)
+def match_site_urls(names):
+    """Official URL for each site name: exact UNESCO_SITE_URLS key first, else the closest key above UNESCO_URL_MIN_SIMILARITY."""
+    urls, url_index = load_site_url_index()
+    matched = []
+    for name in names:
+        if name in UNESCO_SITE_URLS:
+            matched.append(UNESCO_SITE_URLS[name])
+            continue
+        best = url_index.best_match(name, UNESCO_URL_MIN_SIMILARITY)
+        matched.append(urls[best] if best is not None else None)
+    return matched
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_unesco_search_index(version, _sites_df):
+    """Trigram index over site name, city, district and state."""
+    return TrigramIndex(_sites_df, UNESCO_SEARCH_WEIGHTS)
+
+# --- UNESCO Map Layer (built once per data version) ---
+def unesco_popup_html(name, city, state, description, official_url):
+    """Popup card for one UNESCO site marker."""
+    return f"""<div style="width: 250px; padding: 10px;"><h3 style="margin: 0 0 10px 0; color: #2c3e50; font-size: 16px;">{name}</h3><div style="margin-bottom: 10px;"><span style="background-color: #f8f9fa; padding: 3px 8px; border-radius: 4px; font-size: 12px; color: #666;">{city} • {state}</span></div><p style="margin: 0 0 10px 0; font-size: 13px; color: #555; line-height: 1.4;">{description}</p><div style="margin-bottom: 10px;"><span class="badge badge-unesco">UNESCO World Heritage Site</span></div>{f'<a href="{official_url}" target="_blank" style="display: inline-block; background-color: #3498db; color: white; padding: 5px 10px; text-decoration: none; border-radius: 4px; font-size: 12px;">View Full Details</a>' if official_url else ''}</div>"""
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_unesco_map(version, _sites_df):
+    """Folium map with the clustered UNESCO marker layer; popups are rendered once per version, not per rerun."""
+    sites = _sites_df.fillna({"City": "N/A", "State/UT": "N/A", "Short Description": "No description available."})
+    popups = [
+        unesco_popup_html(name, city, state, description, official_url)
+        for name, city, state, description, official_url in zip(sites["Name"], sites["City"], sites["State/UT"], sites["Short Description"], sites["Official URL"])
+    ]
+    payload = marker_payload(sites["Latitude"], sites["Longitude"], popups, sites["Name"])
+    m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles="cartodbpositron", control_scale=True)
+    clustered_marker_layer(payload, name="UNESCO World Heritage Sites").add_to(m)
+    return m
+
+UNESCO_MAP_RETURNED_OBJECTS = ["last_object_clicked_tooltip", "last_object_clicked_count"]  # marker clicks only; pan/zoom never reach the server
+
+@st.fragment
+def render_unesco_map(version, sites_df):
+    """UNESCO map in its own fragment; a marker click selects the site and reruns the page for the details panel."""
+    map_state = render_shared_map(
+        load_unesco_map(version, sites_df),
+        width=1200, height=550, key="unesco_map_from_sf_v2",
+        returned_objects=UNESCO_MAP_RETURNED_OBJECTS,
+    ) or {}
+    clicked_site = map_state.get("last_object_clicked_tooltip")
+    click_count = map_state.get("last_object_clicked_count")
+    # The component keeps returning the last click, so only a new click (count changed) selects a site
+    if clicked_site and click_count != st.session_state.get("unesco_map_click_count"):
+        st.session_state.unesco_map_click_count = click_count
+        if clicked_site != st.session_state.get("selected_site"):
+            st.session_state.selected_site = clicked_site
+            st.rerun()  # full rerun: the details panel lives outside the fragment
+
+def apply_site_search(sites_df, site_search_index):
+    """Select the best-ranked site for the search box (runs only when the search text changes)."""
+    search_site_name = st.session_state.unesco_site_search_input_v2
+    if not search_site_name:
+        return
+    positions, _ = site_search_index.search(search_site_name, limit=1)
+    if len(positions):
+        st.session_state.selected_site = sites_df.iloc[positions[0]]['Name']
+    else:
+        st.session_state.pop('selected_site', None) # Clear selection if search yields no results
+
+def select_site(name):
+    """on_click callback for the nearby-site buttons."""
+    st.session_state.selected_site = name
+
+# --- Nearby Heritage Index (built once per data version) ---
+HERITAGE_TABLES = ("UNESCO_INDIA_SITES", "CRAFT_IMAGE", "FESTIVALS_FINAL")
+UNESCO_KIND, CRAFT_KIND, FESTIVAL_KIND = "UNESCO site", "Craft", "Festival"
+NEARBY_RADIUS_KM = 50
+NEARBY_LIMIT = 5
+
+def unesco_points(sites_df):
+    return heritage_points(UNESCO_KIND, sites_df["Name"], sites_df["State/UT"], sites_df["Latitude"], sites_df["Longitude"])
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_heritage_index(version, _sites_df):
+    """UNESCO sites, crafts (district level) and festivals (state level) as one point frame, with a SpatialIndex over it.
+
+    Crafts and festivals are read in here, so a rerun that hits the cache reads no table.
+    Raises when either can't be read, so a partial index is never kept for the version.
+    """
+    crafts = run_query("crafts")
+    festivals = load_festival_rows(version)
+    craft_latitudes, craft_longitudes = resolve_coordinates(crafts["CRAFT_STATE_SF"], crafts["CRAFT_DISTRICT_SF"], crafts["CRAFT_VILLAGE_SF"])
+    festival_latitudes, festival_longitudes = resolve_coordinates(festivals["STATE"])
+    points = pd.concat([
+        unesco_points(_sites_df),
+        heritage_points(CRAFT_KIND, crafts["CRAFT_NAME_SF"], crafts["CRAFT_STATE_SF"], craft_latitudes, craft_longitudes),
+        heritage_points(FESTIVAL_KIND, festivals["FESTIVAL_NAME"], festivals["STATE"], festival_latitudes, festival_longitudes),
+    ], ignore_index=True)
+    return points, SpatialIndex(points["latitude"], points["longitude"])
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_unesco_heritage_index(version, _sites_df):
+    """The UNESCO sites alone, served while load_heritage_index() fails."""
+    points = unesco_points(_sites_df)
+    return points, SpatialIndex(points["latitude"], points["longitude"])
+
+def nearby_heritage(points_df, heritage_index, lat, lon, radius_km, exclude_site=None):
+    """Distinct points within `radius_km` of (lat, lon), nearest first, with a distance_km column."""
+    positions, distances = heritage_index.within_radius(lat, lon, radius_km)
+    nearby_df = points_df.iloc[positions].assign(distance_km=distances)
+    nearby_df = nearby_df[~((nearby_df["kind"] == UNESCO_KIND) & (nearby_df["name"] == exclude_site))]
+    return nearby_df.drop_duplicates(["kind", "name"]) # rows are sorted by distance, so the nearest occurrence stays
+
+# --- UNESCO Statistics (computed once per data version) ---
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_unesco_stats(version, _sites_df):
+    """At-a-glance totals, sites per state and the state distribution figure, shared by all sessions."""
+    stats = {"total_sites": len(_sites_df), "states_represented": 0, "state_counts": None, "state_figure": None}
+    if 'State/UT' not in _sites_df.columns or _sites_df['State/UT'].empty:
+        return stats
+    state_counts = _sites_df['State/UT'].value_counts().rename_axis('State/UT').reset_index(name='Number of Sites')
+    fig_state_distribution = px.bar(
+        state_counts,
+        x='State/UT',
+        y='Number of Sites',
+        color='Number of Sites',
+        color_continuous_scale=px.colors.sequential.Teal,
+        labels={'Number of Sites': 'Count', 'State/UT': 'State or Union Territory'}
+    )
+    fig_state_distribution.update_layout(
+        xaxis_title=None, # Cleaner look if states are many
+        yaxis_title="Number of Sites",
+        showlegend=False,
+        height=350 # Adjust height as needed
+    )
+    stats.update(states_represented=len(state_counts), state_counts=state_counts, state_figure=fig_state_distribution)
+    return stats
+
+@st.cache_resource(show_spinner=False)
+def load_asi_figures(dataset_version):
+    """Visitor trend and top monument figures for the bundled ASI dataset (None where there is nothing to chart)."""
+    figures = {"visitor_trends": None, "top_domestic": None, "top_foreign": None}
+    visitor_trends_df = load_visitor_trends()
+    # Years before 2002 have no domestic/foreign split; rows are already ordered by Start Year
+    trends_chart_df = visitor_trends_df[visitor_trends_df['Start Year'] >= 2002].dropna(subset=['Domestic Visitors', 'Foreign Visitors', 'Total Visitors'])
+    if not trends_chart_df.empty:
+        fig_visitor_trends = go.Figure()
+        fig_visitor_trends.add_trace(go.Scatter(x=trends_chart_df['Year'], y=trends_chart_df['Domestic Visitors'], mode='lines+markers', name='Domestic Visitors'))
+        fig_visitor_trends.add_trace(go.Scatter(x=trends_chart_df['Year'], y=trends_chart_df['Foreign Visitors'], mode='lines+markers', name='Foreign Visitors'))
+        fig_visitor_trends.add_trace(go.Scatter(x=trends_chart_df['Year'], y=trends_chart_df['Total Visitors'], mode='lines+markers', name='Total Visitors', line=dict(dash='dot', color='green')))
+        fig_visitor_trends.update_layout(title='Domestic, Foreign, and Total Visitors (ASI Monuments)',
+                                         xaxis_title='Year', yaxis_title='Number of Visitors (Illustrative)', height=450,
+                                         legend_title_text='Visitor Type')
+        figures["visitor_trends"] = fig_visitor_trends
+
+    for audience, top_df in load_top_monuments().items():
+        chart_df = top_df[~top_df['Summary Row']].head(10) # 'Others' and 'Total' rows are left out of the chart
+        if chart_df.empty:
+            continue
+        fig_top = px.bar(chart_df,
+                         x='Visitors', y='Monument', orientation='h',
+                         title=f'Top {audience} Visitor Sites', text='Visitors')
+        fig_top.update_layout(yaxis={'categoryorder':'total ascending'}, height=400, margin=dict(l=200, r=20, t=50, b=20))
+        fig_top.update_traces(texttemplate='%{text:,.0f}', textposition='outside') # Format number
+        figures[f"top_{audience.lower()}"] = fig_top
+    return figures
+
 # --- CSS Styling ---
 st.markdown("""
 <style>
@@ -209,6 +308,10 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- Load UNESCO Data ---
+# Versions are taken once per rerun and before the rows: run_query caches rows per table
+# version, so the per-version resources below are never built from rows older than their key
+unesco_version = table_version(UNESCO_TABLES)
+heritage_version = table_version(HERITAGE_TABLES)
 sites_df = load_unesco_sites_from_snowflake()
 
 # --- Create Map (UNESCO Sites) ---
@@ -216,42 +319,29 @@ sites_df = load_unesco_sites_from_snowflake()
 if sites_df.empty:
     st.warning("Could not load UNESCO site data for the map. Please check the connection or data source.")
 else:
-    m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles="cartodbpositron", control_scale=True)
-    def create_custom_icon():
-        return """<div style="background-color: #3498db; width: 12px; height: 12px; border-radius: 50%; border: 2px solid white; box-shadow: 0 0 4px rgba(0,0,0,0.3); position: relative;"><div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); width: 4px; height: 4px; background-color: white; border-radius: 50%;"></div></div>"""
-    for _, site_row in sites_df.iterrows():
-        icon_html = create_custom_icon()
-        site_name_from_df = site_row.get("Name", "Unknown Site")
-        official_url = UNESCO_SITE_URLS.get(site_name_from_df) # Match against the 'Name' column from DataFrame
-        popup_html = f"""<div style="width: 250px; padding: 10px;"><h3 style="margin: 0 0 10px 0; color: #2c3e50; font-size: 16px;">{site_name_from_df}</h3><div style="margin-bottom: 10px;"><span style="background-color: #f8f9fa; padding: 3px 8px; border-radius: 4px; font-size: 12px; color: #666;">{site_row.get("City", "N/A")} • {site_row.get("State/UT", "N/A")}</span></div><p style="margin: 0 0 10px 0; font-size: 13px; color: #555; line-height: 1.4;">{site_row.get("Short Description", "No description available.")}</p><div style="margin-bottom: 10px;"><span class="badge badge-unesco">UNESCO World Heritage Site</span></div>{f'<a href="{official_url}" target="_blank" style="display: inline-block; background-color: #3498db; color: white; padding: 5px 10px; text-decoration: none; border-radius: 4px; font-size: 12px;">View Full Details</a>' if official_url else ''}</div>"""
-        icon = folium.DivIcon(html=icon_html, icon_size=(12, 12), icon_anchor=(6, 6))
-        try:
-            lat = float(site_row["Latitude"]); lon = float(site_row["Longitude"])
-            folium.Marker([lat, lon], popup=folium.Popup(popup_html, max_width=300), tooltip=site_name_from_df, icon=icon).add_to(m)
-        except (ValueError, TypeError):
-            st.warning(f"Skipping UNESCO site '{site_name_from_df}' due to invalid coordinates.")
-    st_folium(m, width=1200, height=550, key="unesco_map_from_sf_v2")
+    render_unesco_map(unesco_version, sites_df)
 st.markdown('</div>', unsafe_allow_html=True)
 
 # --- Handle UNESCO site search (Placed after map) ---
 if not sites_df.empty:
+    site_search_index = load_unesco_search_index(unesco_version, sites_df)
     search_site_name = st.text_input(
         "Search for a UNESCO World Heritage Site by name:", "",
         key="unesco_site_search_input_v2",
-        help="Type part of the UNESCO site name to see details below."
+        help="Type a site name, city, district or state (spelling mistakes are fine) to see details below.",
+        on_change=apply_site_search, args=(sites_df, site_search_index)
     )
     if search_site_name:
-        matching_sites = sites_df[sites_df['Name'].str.contains(search_site_name, case=False, na=False)]
-        if not matching_sites.empty:
-            st.session_state.selected_site = matching_sites.iloc[0]['Name']
-            # Consider if rerun is needed or if UI updates implicitly:
-            # st.rerun()
-        elif st.session_state.get('selected_site'): # Clear selection if search yields no results
-            del st.session_state.selected_site
-            # st.rerun() # Optionally rerun to clear details
-        else: # Only show warning if no match and nothing was previously selected or search is active
-            if search_site_name: # Avoid warning on initial empty search
-                 st.warning(f"No UNESCO sites found matching '{search_site_name}'")
+        candidate_positions, _ = site_search_index.search(search_site_name, limit=UNESCO_SEARCH_LIMIT)
+        if not len(candidate_positions):
+            st.warning(f"No UNESCO sites found matching '{search_site_name}'")
+        elif len(candidate_positions) > 1:
+            st.caption("Matching sites:")
+            candidate_cols = st.columns(len(candidate_positions))
+            for candidate_col, candidate_name in zip(candidate_cols, sites_df['Name'].iloc[candidate_positions]):
+                with candidate_col:
+                    st.button(candidate_name, key=f"site_candidate_{candidate_name}", on_click=select_site, args=(candidate_name,),
+                              disabled=candidate_name == st.session_state.get('selected_site'))
 
 
 # --- UNESCO Site Details ---
@@ -267,6 +357,8 @@ if 'selected_site' in st.session_state and st.session_state.selected_site:
             # st.markdown(f'<div class="site-subtitle">{site_detail.get("City", "N/A")} • {site_detail.get("State/UT", "N/A")}</div>', unsafe_allow_html=True)
             st.markdown('<span class="badge badge-unesco">UNESCO World Heritage Site</span>', unsafe_allow_html=True)
             st.markdown(f'<div class="site-description">{site_detail.get("Short Description", "No description available.")}</div>', unsafe_allow_html=True)
+            if site_detail.get("Official URL"):
+                st.link_button("View Full Details", site_detail["Official URL"])
 
             st.subheader("Location Details")
             col1_loc, col2_loc, col3_loc = st.columns(3)
@@ -274,6 +366,47 @@ if 'selected_site' in st.session_state and st.session_state.selected_site:
             with col2_loc: st.markdown(f"""<div class="stats-card"><h4>District</h4><p>{site_detail.get('District', "N/A")}</p></div>""", unsafe_allow_html=True)
             with col3_loc: st.markdown(f"""<div class="stats-card"><h4>Coordinates</h4><p>Latitude: {site_detail.get('Latitude', "N/A")}<br>Longitude: {site_detail.get('Longitude', "N/A")}</p></div>""", unsafe_allow_html=True)
 
+            # --- Nearby Heritage ---
+            st.subheader("Nearby Heritage")
+            radius_km = st.slider("Search radius (km)", 10, 200, NEARBY_RADIUS_KM, step=10, key="nearby_radius_km")
+            (points_df, heritage_index), heritage_error = load_or_fallback(
+                "heritage_index",
+                lambda: load_heritage_index(heritage_version, sites_df),
+                lambda: load_unesco_heritage_index(heritage_version, sites_df),
+            )
+            if heritage_error is not None:
+                st.warning(f"Nearby crafts and festivals are unavailable: {heritage_error}")
+            nearby_df = nearby_heritage(points_df, heritage_index, site_detail['Latitude'], site_detail['Longitude'], radius_km, exclude_site=site_name_detail)
+            col_near_sites, col_near_crafts, col_near_festivals = st.columns(3)
+            with col_near_sites:
+                st.markdown("##### 🏛️ UNESCO Sites")
+                near_sites = nearby_df[nearby_df['kind'] == UNESCO_KIND]
+                for near_site in near_sites.head(NEARBY_LIMIT).itertuples(index=False):
+                    st.button(f"{near_site.name} ({near_site.distance_km:.0f} km)", key=f"nearby_site_{near_site.name}",
+                              on_click=select_site, args=(near_site.name,))
+                if near_sites.empty:
+                    st.caption(f"No other UNESCO sites within {radius_km} km.")
+            with col_near_crafts:
+                st.markdown("##### 🎨 Crafts")
+                near_crafts = nearby_df[nearby_df['kind'] == CRAFT_KIND]
+                for near_craft in near_crafts.head(NEARBY_LIMIT).itertuples(index=False):
+                    st.markdown(f"- {near_craft.name} · {near_craft.state} ({near_craft.distance_km:.0f} km)")
+                if len(near_crafts) > NEARBY_LIMIT:
+                    st.caption(f"and {len(near_crafts) - NEARBY_LIMIT} more crafts within {radius_km} km.")
+                elif near_crafts.empty:
+                    st.caption(f"No crafts recorded within {radius_km} km.")
+            with col_near_festivals:
+                st.markdown("##### 🎊 Festivals")
+                near_festivals = nearby_df[nearby_df['kind'] == FESTIVAL_KIND]
+                for near_festival in near_festivals.head(NEARBY_LIMIT).itertuples(index=False):
+                    st.markdown(f"- {near_festival.name} · {near_festival.state}")
+                if len(near_festivals) > NEARBY_LIMIT:
+                    st.caption(f"and {len(near_festivals) - NEARBY_LIMIT} more festivals.")
+                elif near_festivals.empty:
+                    st.caption("No festivals listed for this region.")
+                else:
+                    st.caption("Festivals are located by state.")
+
             # st.subheader("Coordinates")
             # st.markdown(f"""<div class="stats-card"><p>Latitude: {site_detail.get('Latitude', "N/A")}<br>Longitude: {site_detail.get('Longitude', "N/A")}</p></div>""", unsafe_allow_html=True)
 
@@ -297,35 +430,18 @@ if not sites_df.empty:
     # st.subheader("📊 UNESCO World Heritage Sites: At a Glance")
     st.markdown("Overview of the listed UNESCO sites in India from the loaded data.")
 
+    unesco_stats = load_unesco_stats(unesco_version, sites_df)
     col_stats1, col_stats2 = st.columns([1,2])
 
     with col_stats1:
-        total_sites = sites_df.shape[0]
-        st.metric(label="Total UNESCO Sites Loaded", value=total_sites)
-        if 'State/UT' in sites_df.columns and not sites_df['State/UT'].empty:
-             st.metric(label="States/UTs Represented", value=sites_df['State/UT'].nunique())
+        st.metric(label="Total UNESCO Sites Loaded", value=unesco_stats["total_sites"])
+        if unesco_stats["states_represented"]:
+             st.metric(label="States/UTs Represented", value=unesco_stats["states_represented"])
 
     with col_stats2:
         st.markdown("##### UNESCO Sites per State/UT")
-        if 'State/UT' in sites_df.columns and not sites_df['State/UT'].empty:
-            state_counts = sites_df['State/UT'].value_counts().reset_index()
-            state_counts.columns = ['State/UT', 'Number of Sites']
-            
-            fig_state_distribution = px.bar(
-                state_counts,
-                x='State/UT',
-                y='Number of Sites',
-                color='Number of Sites',
-                color_continuous_scale=px.colors.sequential.Teal,
-                labels={'Number of Sites': 'Count', 'State/UT': 'State or Union Territory'}
-            )
-            fig_state_distribution.update_layout(
-                xaxis_title=None, # Cleaner look if states are many
-                yaxis_title="Number of Sites",
-                showlegend=False,
-                height=350 # Adjust height as needed
-            )
-            st.plotly_chart(fig_state_distribution, use_container_width=True)
+        if unesco_stats["state_figure"] is not None:
+            st.plotly_chart(unesco_stats["state_figure"], use_container_width=True)
         else:
             st.warning("Column 'State/UT' for UNESCO sites not found or is empty in the data for state distribution chart.")
 
@@ -348,45 +464,26 @@ st.markdown('<div class="insight-box"> <h4>🇮🇳 Visitor Statistics: Centrall
 # st.subheader("🇮🇳 Visitor Statistics: Centrally Protected Ticketed ASI Monuments")
 st.caption("Data presented below is based on information from the Archaeological Survey of India (ASI). Illustrative data is used here; please replace with actual figures from your data source.")
 
-# Load ASI Data (using dummy functions)
-# !!! REPLACE THESE WITH YOUR ACTUAL DATA LOADING !!!
-asi_visitor_trends_df = load_asi_visitor_trends_data()
-asi_top_domestic_df, asi_top_foreign_df = load_asi_top_monuments_data()
+# Load ASI Data (typed tables bundled as Parquet, see cultural_canvas/asi_stats.py)
+asi_visitor_trends_df = load_visitor_trends()
+asi_top_monuments = load_top_monuments()
+asi_top_domestic_df, asi_top_foreign_df = asi_top_monuments["Domestic"], asi_top_monuments["Foreign"]
+asi_figures = load_asi_figures(ASI_DATASET_VERSION)
 
 # Section 1: Visitor Trends (Table 4.2.1 like)
 st.markdown("#### Annual Visitor Trends to ASI Monuments")
 if not asi_visitor_trends_df.empty:
     with st.expander("View Detailed Visitor Trends Table (Illustrative Data)", expanded=False):
-        st.dataframe(asi_visitor_trends_df, use_container_width=True)
+        st.dataframe(asi_visitor_trends_df.drop(columns=['Start Year']), use_container_width=True)
         st.caption("*Source: Archaeological Survey of India (ASI) - Using illustrative data.*")
 
     st.markdown("##### Visitor Numbers Over Time (Illustrative)")
-    # Filter years for charting to avoid clutter if too many 'N.A' or very old data
-    # Attempt to convert 'Year' to a numeric start year for filtering and sorting
-    try:
-        trends_chart_df = asi_visitor_trends_df.copy()
-        trends_chart_df['SortableYear'] = trends_chart_df['Year'].astype(str).str.extract(r'(\d{4})').astype(int)
-        trends_chart_df = trends_chart_df[trends_chart_df['SortableYear'] >= 2002] # Example filter
-        trends_chart_df.dropna(subset=['Domestic Visitors', 'Foreign Visitors', 'Total Visitors'], inplace=True)
-        trends_chart_df.sort_values('SortableYear', inplace=True)
-    except Exception as e:
-        st.warning(f"Could not prepare data for trends chart: {e}")
-        trends_chart_df = pd.DataFrame() # Empty df if prep fails
-
-
-    if not trends_chart_df.empty:
-        fig_visitor_trends = go.Figure()
-        fig_visitor_trends.add_trace(go.Scatter(x=trends_chart_df['Year'], y=trends_chart_df['Domestic Visitors'], mode='lines+markers', name='Domestic Visitors'))
-        fig_visitor_trends.add_trace(go.Scatter(x=trends_chart_df['Year'], y=trends_chart_df['Foreign Visitors'], mode='lines+markers', name='Foreign Visitors'))
-        fig_visitor_trends.add_trace(go.Scatter(x=trends_chart_df['Year'], y=trends_chart_df['Total Visitors'], mode='lines+markers', name='Total Visitors', line=dict(dash='dot', color='green')))
-        fig_visitor_trends.update_layout(title='Domestic, Foreign, and Total Visitors (ASI Monuments)',
-                                         xaxis_title='Year', yaxis_title='Number of Visitors (Illustrative)', height=450,
-                                         legend_title_text='Visitor Type')
-        st.plotly_chart(fig_visitor_trends, use_container_width=True)
+    if asi_figures["visitor_trends"] is not None:
+        st.plotly_chart(asi_figures["visitor_trends"], use_container_width=True)
     else:
         st.info("Not enough valid data for the ASI visitor trends chart after filtering.")
 else:
-    st.warning("ASI visitor trend data could not be loaded (currently using dummy data placeholders).")
+    st.warning("ASI visitor trend data could not be loaded (data/asi_visitor_trends_*.parquet is missing).")
 
 st.markdown("---")
 # Section 2: Top 10 Monuments (Table 4.2.2 like)
@@ -396,35 +493,21 @@ if not asi_top_domestic_df.empty and not asi_top_foreign_df.empty:
     col_top_dom, col_top_for = st.columns(2)
     with col_top_dom:
         st.markdown("##### Top by Domestic Visitors (Illustrative)")
-        st.dataframe(asi_top_domestic_df.set_index('Rank'), use_container_width=True)
+        st.dataframe(asi_top_domestic_df.drop(columns=['Audience', 'Summary Row']).set_index('Rank'), use_container_width=True)
         st.caption("*Source: ASI - Illustrative data.*")
 
-        # Bar chart for top domestic (excluding 'Others' and 'Total' for cleaner chart)
-        chart_df_dom = asi_top_domestic_df[~asi_top_domestic_df['Rank'].isin(['Others', 'Total'])].head(10)
-        if not chart_df_dom.empty:
-            fig_dom = px.bar(chart_df_dom,
-                             x='No. of Domestic Visitors', y='Name of Monument (Domestic)', orientation='h',
-                             title='Top Domestic Visitor Sites', text='No. of Domestic Visitors')
-            fig_dom.update_layout(yaxis={'categoryorder':'total ascending'}, height=400, margin=dict(l=200, r=20, t=50, b=20))
-            fig_dom.update_traces(texttemplate='%{text:,.0f}', textposition='outside') # Format number
-            st.plotly_chart(fig_dom, use_container_width=True)
+        if asi_figures["top_domestic"] is not None:
+            st.plotly_chart(asi_figures["top_domestic"], use_container_width=True)
 
     with col_top_for:
         st.markdown("##### Top by Foreign Visitors (Illustrative)")
-        st.dataframe(asi_top_foreign_df.set_index('Rank'), use_container_width=True)
+        st.dataframe(asi_top_foreign_df.drop(columns=['Audience', 'Summary Row']).set_index('Rank'), use_container_width=True)
         st.caption("*Source: ASI - Illustrative data.*")
 
-        # Bar chart for top foreign
-        chart_df_for = asi_top_foreign_df[~asi_top_foreign_df['Rank'].isin(['Others', 'Total'])].head(10)
-        if not chart_df_for.empty:
-            fig_for = px.bar(chart_df_for,
-                             x='No. of Foreign Visitors', y='Name of Monument (Foreign)', orientation='h',
-                             title='Top Foreign Visitor Sites', text='No. of Foreign Visitors')
-            fig_for.update_layout(yaxis={'categoryorder':'total ascending'}, height=400, margin=dict(l=200, r=20, t=50, b=20))
-            fig_for.update_traces(texttemplate='%{text:,.0f}', textposition='outside') # Format number
-            st.plotly_chart(fig_for, use_container_width=True)
+        if asi_figures["top_foreign"] is not None:
+            st.plotly_chart(asi_figures["top_foreign"], use_container_width=True)
 else:
-    st.warning("ASI top monuments data could not be loaded (currently using dummy data placeholders).")
+    st.warning("ASI top monuments data could not be loaded (data/asi_top_monuments_*.parquet is missing).")
 
 
 # --- Footer ---
@@ -436,4 +519,8 @@ st.markdown(
         <p>UNESCO Site data sourced via Snowflake. ASI Visitor statistics are illustrative and should be replaced with actual data from ASI.</p>
     </div>
     """, unsafe_allow_html=True
-)
\ No newline at end of file
+)
+
+# --- Prefetch ---
+# Warm the other pages' Snowflake queries once per process, after this page has rendered
+warm_query_caches()
@@ -1,5 +1,12 @@
+import calendar
 import streamlit as st
 import pandas as pd
+import numpy as np
+import plotly.express as px
+from cultural_canvas.data import bind_list, run_query, table_version, warm_query_caches
+from cultural_canvas.festival_calendar import load_festival_month_index
+from cultural_canvas.images import responsive_img
+from cultural_canvas.search import SearchIndex, highlight
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -8,50 +15,169 @@ st.set_page_config(
     initial_sidebar_state="auto",
     page_icon="🎉"
 )
-def get_snowflake_connection():
-    return st.connection("snowflake")
+
+# --- Configuration ---
+FESTIVALS_PAGE_SIZE = 10 # cards rendered per page (five rows of two)
+FESTIVAL_TABLES = ("FESTIVALS_FINAL",)
+MONTH_LABELS = list(calendar.month_abbr)[1:]
+FESTIVAL_SEARCH_WEIGHTS = {"FESTIVAL_NAME": 4.0, "STATE": 2.0, "TIME_OF_YEAR": 1.5}
+
 # --- Function to fetch festivals from Snowflake ---
 def get_festivals_from_snowflake():
-    """Fetch festival data from Snowflake FESTIVALS_FINAL table."""
+    """Fetch the festival catalog (state, name, time of year) from Snowflake FESTIVALS_FINAL table."""
     try:
-        conn = get_snowflake_connection()  # Ensure this is defined elsewhere
-        query = """
-        SELECT
-            "STATE",
-            "FESTIVAL_NAME",
-            "TIME_OF_YEAR",
-            "SHORT_DESCRIPTION",
-            "IMAGE_URL"
-        FROM
-            "CULTURE_HERITAGE"."PUBLIC"."FESTIVALS_FINAL"
-        WHERE "FESTIVAL_NAME" IS NOT NULL; -- Added this line to filter out NULL festival names
-        """
-        df = conn.query(query, ttl=3600)
+        df = run_query("festival_catalog")
         return df
     except Exception as e:
         st.error(f"Error fetching festivals from Snowflake: {e}")
         return pd.DataFrame()
 
+def get_festival_cards(page_df):
+    """`page_df` with SHORT_DESCRIPTION and IMAGE_URL fetched for just these festivals (cached per name set, LRU)."""
+    names = sorted(set(page_df["FESTIVAL_NAME"]))
+    if not names:
+        return page_df.assign(SHORT_DESCRIPTION="", IMAGE_URL=None)
+    try:
+        placeholders, params = bind_list(names, prefix="name")
+        cards = run_query("festival_cards", params=params, placeholders=placeholders)
+    except Exception as e:
+        st.error(f"Error fetching festival details from Snowflake: {e}")
+        cards = pd.DataFrame(columns=["STATE", "FESTIVAL_NAME", "SHORT_DESCRIPTION", "IMAGE_URL"])
+    cards = cards.drop_duplicates(["STATE", "FESTIVAL_NAME"])
+    return page_df.merge(cards, on=["STATE", "FESTIVAL_NAME"], how="left").fillna({"SHORT_DESCRIPTION": ""})
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_festival_search_index(version, _festival_index):
+    """Token index over the festival rows, built once per data version."""
+    return SearchIndex(_festival_index.rows, FESTIVAL_SEARCH_WEIGHTS)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_festival_heatmap(version, _festival_index):
+    """States x months heatmap of festival counts, built once per data version."""
+    month_counts = _festival_index.month_counts()
+    if not month_counts:
+        return None
+    counts_df = pd.DataFrame.from_dict(month_counts, orient="index", columns=MONTH_LABELS)
+    fig_heatmap = px.imshow(
+        counts_df, color_continuous_scale="YlOrRd", aspect="auto",
+        labels={"x": "Month", "y": "State", "color": "Festivals"}
+    )
+    fig_heatmap.update_layout(height=max(300, 22 * len(counts_df)), margin=dict(l=20, r=20, t=20, b=20))
+    return fig_heatmap
+
 # --- Load data from Snowflake ---
+# The version is taken before the rows: run_query caches rows per table version, so the
+# month and search indexes kept for a version are never built from rows older than it
+festival_version = table_version(FESTIVAL_TABLES)
 df = get_festivals_from_snowflake()
 
+# --- CSS Styling ---
+st.markdown("""
+<style>
+.festival-card-image { width: 100%; max-height: 320px; object-fit: cover; border-radius: 8px; margin: 0.5rem 0 1rem 0; }
+</style>
+""", unsafe_allow_html=True)
+
 # --- Page Content ---
 st.title("🌟 Discover Indian Festivals")
 st.subheader("Explore vibrant local celebrations from every corner of India")
 
+# --- Filters (month/state index lookups and keyword search) ---
+# Counts for each selector honour the other selector and the search box, whose values
+# are read from session state because those widgets render later in the script.
+selected_month, selected_state, search_term = None, None, ""
+if not df.empty:
+    festival_index = load_festival_month_index(festival_version, df)
+    festival_search_index = load_festival_search_index(festival_version, festival_index)
+    search_term = st.session_state.get("festival_search_input", "")
+    search_positions = festival_search_index.search(search_term) if search_term else None # best match first
+    search_mask = None
+    if search_positions is not None:
+        search_mask = np.zeros(len(festival_index), dtype=bool)
+        search_mask[search_positions] = True
+
+    filter_cols = st.columns(3)
+    with filter_cols[0]:
+        month_totals = festival_index.month_totals(state=st.session_state.get("festival_state_filter"), within=search_mask)
+        selected_month = st.selectbox("Month", [None] + list(range(1, 13)), key="festival_month_filter",
+                                      format_func=lambda month: "All Months" if month is None else f"{calendar.month_name[month]} ({month_totals[month - 1]:,})")
+    with filter_cols[1]:
+        state_totals = festival_index.state_totals(month=selected_month, within=search_mask)
+        selected_state = st.selectbox("State", [None] + festival_index.states, key="festival_state_filter",
+                                      format_func=lambda state: "All States" if state is None else f"{state} ({state_totals[state]:,})",
+                                      help="Nationwide festivals are listed under every state.")
+    with filter_cols[2]:
+        search_term = st.text_input("Search Festivals", key="festival_search_input", placeholder="e.g. harvest, chariot, Bihu")
+
+    # Month and state masks are ANDed; rows keep table order, or search rank when there is a search term
+    filter_mask = festival_index.mask(selected_month, selected_state)
+    if search_positions is not None:
+        filtered_positions = search_positions[filter_mask[search_positions]]
+    else:
+        filtered_positions = np.flatnonzero(filter_mask)
+    df = festival_index.rows.iloc[filtered_positions]
+
+    with st.expander("📅 Festival Calendar by State and Month", expanded=False):
+        fig_heatmap = load_festival_heatmap(festival_version, festival_index)
+        if fig_heatmap is not None:
+            st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.caption("Months are read from each festival's time of year; lunar festivals are placed in the month their lunar month mostly starts in.")
+
+# --- Pagination ---
+# The cursor goes back to the first page whenever the filters change
+filter_signature = (selected_month, selected_state, search_term)
+if st.session_state.get('festivals_filter_signature') != filter_signature:
+    st.session_state.festivals_filter_signature = filter_signature
+    st.session_state.festivals_page = 0
+
+total_festivals = len(df)
+num_pages = max(1, -(-total_festivals // FESTIVALS_PAGE_SIZE))
+current_page = min(st.session_state.get('festivals_page', 0), num_pages - 1)
+page_start = current_page * FESTIVALS_PAGE_SIZE
+page_df = df.iloc[page_start:page_start + FESTIVALS_PAGE_SIZE] # only this slice is rendered, and only its details are fetched
+
+def prev_page_action():
+    st.session_state.festivals_page = max(0, current_page - 1)
+
+def next_page_action():
+    st.session_state.festivals_page = min(num_pages - 1, current_page + 1)
+
 # --- Festival Cards Layout ---
 if not df.empty:
+    st.caption(f"Showing {page_start + 1:,}–{page_start + len(page_df):,} of {total_festivals:,} festivals")
     col1, col2 = st.columns(2)
 
-    for i, row in df.iterrows():
+    for i, row in enumerate(get_festival_cards(page_df).itertuples(index=False)):
         with (col1 if i % 2 == 0 else col2):
-            with st.container():
-                st.markdown(f"### {row['FESTIVAL_NAME']}")
-                st.markdown(f"**State:** {row['STATE']}")
-                st.markdown(f"**Time of Year:** {row['TIME_OF_YEAR']}")
-                st.markdown(row['SHORT_DESCRIPTION'])
-                if pd.notna(row['IMAGE_URL']):
-                    st.image(row['IMAGE_URL'], use_container_width=True)
-                st.markdown("---")
+            # One markdown block per card; the image is a lazy-loaded <img>, fetched only when scrolled into view
+            name_html = highlight(str(row.FESTIVAL_NAME), SearchIndex.match_spans(search_term, str(row.FESTIVAL_NAME)))
+            description_html = highlight(str(row.SHORT_DESCRIPTION), SearchIndex.match_spans(search_term, str(row.SHORT_DESCRIPTION)))
+            image_html = responsive_img(row.IMAGE_URL, row.FESTIVAL_NAME, role="card", css_class="festival-card-image") if pd.notna(row.IMAGE_URL) and row.IMAGE_URL else ""
+            st.markdown(f"""
+### {name_html}
+**State:** {row.STATE}
+
+**Time of Year:** {row.TIME_OF_YEAR}
+
+{description_html}
+
+{image_html}
+
+---""", unsafe_allow_html=True)
+
+    if num_pages > 1:
+        pager_cols = st.columns([1, 2, 1])
+        with pager_cols[0]:
+            st.button("← Previous", on_click=prev_page_action, disabled=current_page == 0, key="festivals_prev_page", use_container_width=True)
+        with pager_cols[1]:
+            st.markdown(f"<div style='text-align: center;'>Page {current_page + 1} of {num_pages:,}</div>", unsafe_allow_html=True)
+        with pager_cols[2]:
+            st.button("Next →", on_click=next_page_action, disabled=current_page >= num_pages - 1, key="festivals_next_page", use_container_width=True)
+elif selected_month is not None or selected_state is not None or search_term:
+    st.info("No festivals match these filters. Try another month, state or keyword.")
 else:
     st.warning("No festival data available.")
+
+# --- Prefetch ---
+# Warm the other pages' Snowflake queries once per process, after this page has rendered
+warm_query_caches()
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import random
+from cultural_canvas.data import warm_query_caches
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -641,5 +642,7 @@ with col2:
         <li><a href="https://rtsindia.org">Responsible Tourism Society of India</a></li>
     </ul>
 """, unsafe_allow_html=True)
-    
 
+# --- Prefetch ---
+# Warm the other pages' Snowflake queries once per process, after this page has rendered
+warm_query_caches()
@@ -2,8 +2,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import random
-from datetime import datetime
+from snowflake.connector.errors import Error as SnowflakeError
+from cultural_canvas.data import load_or_fallback, table_version, warm_query_caches
+from cultural_canvas.government_impact import IMPACT_SEED, IMPACT_TABLES, load_impact_table, objective_funding, simulated_impact_tables
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -13,149 +14,29 @@ st.set_page_config(
     page_icon="📊"
 )
 
-# --- Simulated Database Functions ---
-def get_government_funding():
-    """Fetch government funding data (simulated)"""
-    states = [
-        'Andhra Pradesh', 'Assam', 'Bihar', 'Chhattisgarh', 'Gujarat',
-        'Haryana', 'Himachal Pradesh', 'Jharkhand', 'Karnataka', 'Kerala',
-        'Madhya Pradesh', 'Maharashtra', 'Odisha', 'Punjab', 'Rajasthan',
-        'Tamil Nadu', 'Telangana', 'Uttar Pradesh', 'Uttarakhand', 'West Bengal'
-    ]
-    
-    schemes = [
-        'Swadesh Darshan Scheme',
-        'PRASAD (Pilgrimage Rejuvenation and Spiritual Augmentation Drive)',
-        'Museum Grant Scheme',
-        'Cultural Function Grant Scheme',
-        'National Mission on Cultural Mapping',
-        'Tribal Art Development Scheme',
-        'Heritage City Development and Augmentation Yojana (HRIDAY)',
-        'National Handicraft Development Program',
-        'Preservation and Development of Cultural Heritage of Himalayas',
-        'Scheme for Safeguarding the Intangible Cultural Heritage'
-    ]
-    
-    objectives = [
-        'Preservation', 'Promotion', 'Infrastructure', 'Education',
-        'Documentation', 'Digitization', 'Skill Development', 'Research'
-    ]
-    
-    years = list(range(2018, 2024))
-    
-    data = []
-    for state in states:
-        # Each state gets 3-5 schemes
-        state_schemes = random.sample(schemes, random.randint(3, 5))
-        
-        for scheme in state_schemes:
-            # Each scheme has 1-3 objectives
-            scheme_objectives = random.sample(objectives, random.randint(1, 3))
-            
-            for year in years:
-                # Generate random funding amount (in lakhs)
-                funding = random.randint(50, 1000)
-                
-                # Generate random utilization percentage
-                utilization = random.randint(60, 100)
-                
-                # Generate random number of beneficiaries
-                beneficiaries = random.randint(500, 10000)
-                
-                data.append({
-                    'state': state,
-                    'scheme': scheme,
-                    'objective': ', '.join(scheme_objectives),
-                    'year': year,
-                    'funding_lakhs': funding,
-                    'utilization_percentage': utilization,
-                    'beneficiaries': beneficiaries
-                })
-    
-    return pd.DataFrame(data)
-
-def get_artisan_registrations():
-    """Fetch artisan registration data (simulated)"""
-    states = [
-        'Andhra Pradesh', 'Assam', 'Bihar', 'Chhattisgarh', 'Gujarat',
-        'Haryana', 'Himachal Pradesh', 'Jharkhand', 'Karnataka', 'Kerala',
-        'Madhya Pradesh', 'Maharashtra', 'Odisha', 'Punjab', 'Rajasthan',
-        'Tamil Nadu', 'Telangana', 'Uttar Pradesh', 'Uttarakhand', 'West Bengal'
-    ]
-    
-    years = list(range(2018, 2024))
-    
-    data = []
-    for state in states:
-        # Base number of artisans for each state
-        base_artisans = random.randint(1000, 5000)
-        
-        for year in years:
-            # Growth factor (increasing over years)
-            growth_factor = 1 + (year - 2018) * 0.05
-            
-            # Calculate number of artisans with some randomness
-            artisans = int(base_artisans * growth_factor * random.uniform(0.9, 1.1))
-            
-            # Calculate percentage of women artisans
-            women_percentage = random.randint(30, 60)
-            
-            # Calculate percentage with digital presence
-            digital_percentage = min(80, 20 + (year - 2018) * 10)  # Increasing digital presence over years
-            
-            data.append({
-                'state': state,
-                'year': year,
-                'registered_artisans': artisans,
-                'women_percentage': women_percentage,
-                'digital_percentage': digital_percentage
-            })
-    
-    return pd.DataFrame(data)
-
-def get_tourism_impact():
-    """Fetch tourism impact data (simulated)"""
-    states = [
-        'Andhra Pradesh', 'Assam', 'Bihar', 'Chhattisgarh', 'Gujarat',
-        'Haryana', 'Himachal Pradesh', 'Jharkhand', 'Karnataka', 'Kerala',
-        'Madhya Pradesh', 'Maharashtra', 'Odisha', 'Punjab', 'Rajasthan',
-        'Tamil Nadu', 'Telangana', 'Uttar Pradesh', 'Uttarakhand', 'West Bengal'
-    ]
-    
-    years = list(range(2018, 2024))
-    
-    data = []
-    for state in states:
-        # Base values for each state
-        base_revenue = random.randint(500, 5000)  # in crores
-        base_employment = random.randint(10000, 100000)
-        base_tourists = random.randint(500000, 5000000)
-        
-        for year in years:
-            # Growth factor (increasing over years, with dip in 2020-2021 for COVID)
-            if year in [2020, 2021]:
-                growth_factor = 0.6  # COVID impact
-            else:
-                growth_factor = 1 + (year - 2018) * 0.08
-            
-            # Calculate values with some randomness
-            revenue = int(base_revenue * growth_factor * random.uniform(0.9, 1.1))
-            employment = int(base_employment * growth_factor * random.uniform(0.9, 1.1))
-            tourists = int(base_tourists * growth_factor * random.uniform(0.9, 1.1))
-            
-            # Calculate cultural tourism percentage
-            cultural_percentage = random.randint(30, 70)
-            
-            data.append({
-                'state': state,
-                'year': year,
-                'tourism_revenue_crores': revenue,
-                'tourism_employment': employment,
-                'tourist_arrivals': tourists,
-                'cultural_tourism_percentage': cultural_percentage
-            })
-    
-    return pd.DataFrame(data)
+# --- Data Configuration ---
+IMPACT_DATA_TABLES = tuple(IMPACT_TABLES.values())  # a change to any of them rebuilds the shared tables
+
+# max_entries=1: one set of tables per process, shared read-only by all sessions
+@st.cache_resource(max_entries=1, show_spinner="Loading impact data...")
+def load_impact_data(version):
+    """{name: frame} for the dashboard tables plus 'objective_funding', and whether any table is simulated.
+
+    Raises (and so caches nothing) when Snowflake can't be read or a table's columns don't match.
+    """
+    tables, simulated = {}, False
+    for name in IMPACT_TABLES:
+        tables[name], table_simulated = load_impact_table(name)
+        simulated = simulated or table_simulated
+    tables["objective_funding"] = objective_funding(tables["government_funding"])
+    return tables, simulated
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_simulated_impact_data(seed):
+    """Every table simulated, for reruns where load_impact_data() fails; depends only on the seed."""
+    tables = simulated_impact_tables(seed)
+    tables["objective_funding"] = objective_funding(tables["government_funding"])
+    return tables, True
 
 # --- CSS Styling ---
 st.markdown("""
@@ -314,10 +195,23 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# --- Load Data ---
-funding_df = get_government_funding()
-artisan_df = get_artisan_registrations()
-tourism_df = get_tourism_impact()
+# --- Load Data (shared across sessions; treat as read-only) ---
+# The version is taken before the rows: run_query caches rows per table version. While Snowflake
+# can't be read, the simulated tables are served for FALLBACK_RETRY_INTERVAL before it is retried.
+(impact_tables, impact_simulated), impact_error = load_or_fallback(
+    "government_impact",
+    lambda: load_impact_data(table_version(IMPACT_DATA_TABLES)),
+    lambda: load_simulated_impact_data(IMPACT_SEED),
+    errors=(SnowflakeError, ValueError),
+)
+if impact_error is not None:
+    st.warning(f"Impact data could not be read from Snowflake, so all figures below are simulated: {impact_error}")
+funding_df = impact_tables["government_funding"]
+artisan_df = impact_tables["artisan_registrations"]
+tourism_df = impact_tables["tourism_impact"]
+objective_funding_df = impact_tables["objective_funding"]
+if impact_simulated:
+    st.caption(f"Figures not yet available from Snowflake are simulated (fixed seed {IMPACT_SEED}), so they stay the same between visits.")
 
 # --- Filters ---
 # st.markdown('<div class="filter-section">', unsafe_allow_html=True)
@@ -346,24 +240,23 @@ with col3:
 # st.markdown('</div>', unsafe_allow_html=True)
 
 # --- Filter Data ---
-filtered_funding = funding_df.copy()
-filtered_artisan = artisan_df.copy()
-filtered_tourism = tourism_df.copy()
-
-# Apply year filter to all datasets
-filtered_funding = filtered_funding[filtered_funding['year'] == selected_year]
-filtered_artisan = filtered_artisan[filtered_artisan['year'] == selected_year]
-filtered_tourism = filtered_tourism[filtered_tourism['year'] == selected_year]
+# Filters only slice the shared tables; derived columns are added to copies further down
+filtered_funding = funding_df[funding_df['year'] == selected_year]
+filtered_objectives = objective_funding_df[objective_funding_df['year'] == selected_year]
+filtered_artisan = artisan_df[artisan_df['year'] == selected_year]
+filtered_tourism = tourism_df[tourism_df['year'] == selected_year]
 
 # Apply state filter if not "All States"
 if selected_state != "All States":
     filtered_funding = filtered_funding[filtered_funding['state'] == selected_state]
+    filtered_objectives = filtered_objectives[filtered_objectives['state'] == selected_state]
     filtered_artisan = filtered_artisan[filtered_artisan['state'] == selected_state]
     filtered_tourism = filtered_tourism[filtered_tourism['state'] == selected_state]
 
 # Apply scheme filter if not "All Schemes"
 if selected_scheme != "All Schemes":
     filtered_funding = filtered_funding[filtered_funding['scheme'] == selected_scheme]
+    filtered_objectives = filtered_objectives[filtered_objectives['scheme'] == selected_scheme]
 
 # --- KPI Section ---
 st.markdown('<div class="insight-box"> <h4>Key Performance Indicators</h4></div>', unsafe_allow_html=True)
@@ -514,24 +407,12 @@ with col1:
         st.plotly_chart(fig, use_container_width=True)
 
 with col2:
-    # Objective-wise funding allocation
-    # First, split the comma-separated objectives into separate rows
-    objectives_expanded = []
-    for _, row in filtered_funding.iterrows():
-        for objective in row['objective'].split(', '):
-            objectives_expanded.append({
-                'state': row['state'],
-                'scheme': row['scheme'],
-                'objective': objective.strip(),
-                'funding_lakhs': row['funding_lakhs'] / len(row['objective'].split(', '))  # Divide funding equally among objectives
-            })
-    
-    objectives_df = pd.DataFrame(objectives_expanded)
-    objective_funding = objectives_df.groupby('objective')['funding_lakhs'].sum().reset_index()
-    objective_funding = objective_funding.sort_values('funding_lakhs', ascending=False)
+    # Objective-wise funding allocation (each row's funding split equally among its objectives)
+    objective_totals = filtered_objectives.groupby('objective')['funding_lakhs'].sum().reset_index()
+    objective_totals = objective_totals.sort_values('funding_lakhs', ascending=False)
     
     fig = px.pie(
-        objective_funding,
+        objective_totals,
         values='funding_lakhs',
         names='objective',
         title='Funding Allocation by Objective',
@@ -606,7 +487,7 @@ st.markdown('<div class="insight-box"> <h4>Key Insights on Funding Allocation</h
 # Generate insights based on the data
 top_funded_state = state_funding.iloc[0]['state'] if 'state_funding' in locals() else filtered_funding['state'].iloc[0]
 top_funded_scheme = scheme_funding.iloc[0]['scheme'] if 'scheme_funding' in locals() else filtered_funding['scheme'].iloc[0]
-top_objective = objective_funding.iloc[0]['objective']
+top_objective = objective_totals.iloc[0]['objective']
 highest_utilization_scheme = scheme_utilization.iloc[0]['scheme']
 lowest_utilization_scheme = scheme_utilization.iloc[-1]['scheme']
 highest_utilization_percentage = scheme_utilization.iloc[0]['utilization_percentage']
@@ -1015,4 +896,8 @@ st.markdown("""
     <p>Data sourced from public records including <a href="https://data.gov.in" target="_blank">data.gov.in</a>, Ministry of Culture, and Ministry of Tourism.</p>
     <p>Last updated: May 2023</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# --- Prefetch ---
+# Warm the other pages' Snowflake queries once per process, after this page has rendered
+warm_query_caches()
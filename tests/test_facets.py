@@ -0,0 +1,48 @@
+"""Tests for facet masks and counts (cultural_canvas.facets)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from cultural_canvas.facets import FacetIndex
+
+
+@pytest.fixture
+def facets():
+    return FacetIndex(pd.DataFrame({
+        "state": ["Kerala", "Bihar", " Kerala ", "N/A", None],
+        "type": ["Dance", "Craft", "Craft", "Dance", "Craft"],
+    }), ["state", "type", "district"])
+
+
+def test_values_are_sorted_without_missing_markers(facets):
+    assert facets.values("state") == ["Bihar", "Kerala"]
+    assert facets.values("type") == ["Craft", "Dance"]
+    assert facets.values("district") == []
+
+def test_mask(facets):
+    assert facets.mask("state", "Kerala").tolist() == [True, False, True, False, False]
+
+def test_mask_for_no_or_unknown_value_keeps_every_row(facets):
+    assert facets.mask("state", None).all()
+    assert facets.mask("state", "Goa").all()
+
+def test_positions(facets):
+    assert facets.positions("type", "Craft").tolist() == [1, 2, 4]
+    assert facets.positions("state", "Goa").tolist() == []
+
+def test_select_ands_masks_and_ignores_none(facets):
+    assert facets.select({"state": "Kerala", "type": "Craft"}).tolist() == [False, False, True, False, False]
+    assert facets.select({"state": None, "type": "Dance"}).tolist() == [True, False, False, True, False]
+
+def test_select_within_leaves_the_mask_unchanged(facets):
+    within = np.array([True, True, False, True, True])
+    assert facets.select({"type": "Dance"}, within=within).tolist() == [True, False, False, True, False]
+    assert within.tolist() == [True, True, False, True, True]
+
+def test_counts(facets):
+    assert facets.counts("type") == {"Craft": 3, "Dance": 2}
+    assert facets.counts("state") == {"Bihar": 1, "Kerala": 2}
+
+def test_counts_within_other_selection(facets):
+    assert facets.counts("type", within=facets.select({"state": "Kerala"})) == {"Craft": 1, "Dance": 1}
+    assert facets.counts("district") == {}
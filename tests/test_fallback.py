@@ -0,0 +1,54 @@
+"""Tests for load_or_fallback(), which keeps a failed load on its fallback for a while (cultural_canvas.data.client)."""
+import pytest
+
+from cultural_canvas.data import client
+from cultural_canvas.data.client import FALLBACK_RETRY_INTERVAL, load_or_fallback
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(client.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(client, "_failed_loads", {})
+    return clock
+
+def loader(calls, fail):
+    def load():
+        calls.append("load")
+        if fail[0]:
+            raise ConnectionError("down")
+        return "live"
+    return load
+
+
+def test_success_returns_the_load(now):
+    assert load_or_fallback("t", lambda: "live", lambda: "fallback") == ("live", None)
+
+def test_failure_serves_the_fallback_without_retrying(now):
+    calls, fail = [], [True]
+    result, error = load_or_fallback("t", loader(calls, fail), lambda: "fallback")
+    assert result == "fallback" and isinstance(error, ConnectionError)
+    fail[0] = False
+    now[0] += FALLBACK_RETRY_INTERVAL - 1
+    assert load_or_fallback("t", loader(calls, fail), lambda: "fallback")[0] == "fallback"
+    assert calls == ["load"]
+
+def test_failure_is_retried_after_the_interval(now):
+    calls, fail = [], [True]
+    load_or_fallback("t", loader(calls, fail), lambda: "fallback")
+    fail[0] = False
+    now[0] += FALLBACK_RETRY_INTERVAL
+    assert load_or_fallback("t", loader(calls, fail), lambda: "fallback") == ("live", None)
+    assert load_or_fallback("t", loader(calls, fail), lambda: "fallback") == ("live", None)
+    assert calls == ["load", "load", "load"]
+
+def test_failures_are_tracked_per_name(now):
+    calls = []
+    load_or_fallback("a", loader(calls, [True]), lambda: "fallback")
+    assert load_or_fallback("b", loader(calls, [False]), lambda: "fallback") == ("live", None)
+
+def test_other_errors_propagate(now):
+    def load():
+        raise KeyError("bug")
+    with pytest.raises(KeyError):
+        load_or_fallback("t", load, lambda: "fallback", errors=(ConnectionError,))
@@ -0,0 +1,82 @@
+"""Tests for festival date resolution, TIME_OF_YEAR parsing and row loading (cultural_canvas.festival_calendar)."""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from cultural_canvas import festival_calendar
+from cultural_canvas.data import client
+from cultural_canvas.festival_calendar import FESTIVAL_INDEX_YEARS, LUNAR_FESTIVAL_DATES, parse_time_of_year, resolve_dates
+
+
+def test_lunar_dates_cover_the_index_window():
+    years = range(date.today().year, date.today().year + FESTIVAL_INDEX_YEARS)
+    missing = {name: [year for year in years if year not in dates] for name, dates in LUNAR_FESTIVAL_DATES.items()}
+    assert not {name: gaps for name, gaps in missing.items() if gaps}, "extend LUNAR_FESTIVAL_DATES"
+
+def test_lunar_festival_uses_table_date():
+    year = min(LUNAR_FESTIVAL_DATES["Diwali"])
+    assert resolve_dates("Diwali", [year], month=1, day=1) == [(date(year, *LUNAR_FESTIVAL_DATES["Diwali"][year]), False)]
+
+def test_lunar_alias_uses_table_date():
+    year = min(LUNAR_FESTIVAL_DATES["Holi"])
+    assert resolve_dates("Braj Holi", [year]) == [(date(year, *LUNAR_FESTIVAL_DATES["Holi"][year]), False)]
+
+def test_lunar_year_missing_from_table_falls_back_to_month():
+    year = max(LUNAR_FESTIVAL_DATES["Holi"]) + 1
+    assert resolve_dates("Holi", [year], month=3, day=25) == [(date(year, 3, 1), True)]
+
+def test_lunar_year_missing_from_table_without_month_is_dropped():
+    assert resolve_dates("Holi", [max(LUNAR_FESTIVAL_DATES["Holi"]) + 1]) == []
+
+def test_fixed_date_festival():
+    assert resolve_dates("Republic Day", [2026, 2027], month=1, day=26) == [(date(2026, 1, 26), False), (date(2027, 1, 26), False)]
+
+def test_month_only_festival_is_approximate():
+    assert resolve_dates("Hornbill Festival", [2026], month=12) == [(date(2026, 12, 1), True)]
+
+def test_leap_day_skipped_outside_leap_years():
+    assert resolve_dates("Leap Fair", [2027, 2028], month=2, day=29) == [(date(2028, 2, 29), False)]
+
+
+def mask_of(*months):
+    return sum(1 << (month - 1) for month in months)
+
+@pytest.mark.parametrize("text, expected", [
+    ("June-July", (6, 7, mask_of(6, 7), False)),
+    ("August – September", (8, 9, mask_of(8, 9), False)),
+    ("April (Bohag Bihu)", (4, 4, mask_of(4), False)),
+    ("January and April", (1, 4, mask_of(1, 4), False)),
+    ("November-February", (11, 2, mask_of(11, 12, 1, 2), False)),
+    ("Mid-March to late April", (3, 4, mask_of(3, 4), False)),
+    ("Sept/Oct", (9, 10, mask_of(9, 10), False)),
+    ("Chaitra to Vaishakh", (3, 4, mask_of(3, 4), True)),
+    ("Kartik Purnima (October-November)", (10, 11, mask_of(10, 11), True)),
+    ("Winter", (12, 2, mask_of(12, 1, 2), False)),
+    ("Monsoon season", (7, 9, mask_of(7, 8, 9), False)),
+    ("May", (5, 5, mask_of(5), False)),
+    ("april-may", (4, 5, mask_of(4, 5), False)),
+    ("Usually March, but may fall in April", (3, 4, mask_of(3, 4), False)),
+    ("Dates may vary", (None, None, 0, False)),
+    ("Every 12 years", (None, None, 0, False)),
+    ("", (None, None, 0, False)),
+    (None, (None, None, 0, False)),
+])
+def test_parse_time_of_year(text, expected):
+    assert parse_time_of_year(text) == expected
+
+
+def test_failed_festival_query_falls_back_to_bundled_names_without_caching(monkeypatch):
+    def failing(name):
+        raise ConnectionError("down")
+    monkeypatch.setattr(festival_calendar, "run_query", failing)
+    monkeypatch.setattr(client, "_failed_loads", {})
+    version = "FESTIVALS_FINAL@test-failure"
+    with pytest.raises(ConnectionError):
+        festival_calendar.load_festival_rows(version)
+    index = festival_calendar.get_festival_index(version, 2026, ())
+    assert len(index) and index.states == []  # bundled names only: no states or exact dates
+
+    rows = pd.DataFrame({"STATE": ["Kerala"], "FESTIVAL_NAME": ["Onam"], "TIME_OF_YEAR": ["August-September"], "SHORT_DESCRIPTION": [""], "IMAGE_URL": [""]})
+    monkeypatch.setattr(festival_calendar, "run_query", lambda name: rows)
+    assert festival_calendar.load_festival_rows(version)["FESTIVAL_NAME"].tolist() == ["Onam"]
@@ -0,0 +1,35 @@
+"""Tests for the district gazetteer and the coordinate store built from it (cultural_canvas.geo)."""
+import sqlite3
+
+import numpy as np
+import pytest
+
+from cultural_canvas.geo import STATE_CENTROIDS, _gazetteer_districts, build_coordinate_store, normalize_place, resolve_place
+from cultural_canvas.spatial import haversine_km
+
+
+def test_gazetteer_districts_lie_in_their_state():
+    states = {normalize_place(state): centroid for state, centroid in STATE_CENTROIDS.items()}
+    rows = _gazetteer_districts()
+    assert len({(state, district) for state, district, _, _ in rows}) == len(rows)
+    for state, district, lat, lon in rows:
+        assert state in states, district
+        # Loose bound: the Maharashtra centroid sits near Mumbai, ~770 km from Gondia
+        assert haversine_km(*states[state], np.array([lat]), np.array([lon]))[0] < 800, (state, district)
+
+def test_committed_store_resolves_districts():
+    assert resolve_place("Bihar", "Madhubani") == pytest.approx((26.35, 86.07))
+    assert resolve_place("Bihar", "Nowhere") == STATE_CENTROIDS["Bihar"]
+    # Same district name, different states
+    assert resolve_place("Karnataka", "Bijapur") != resolve_place("Chhattisgarh", "Bijapur")
+
+def test_rebuild_keeps_geocoder_hits(tmp_path):
+    db_path = tmp_path / "coordinates.sqlite"
+    build_coordinate_store(db_path, geocode=False)
+    with sqlite3.connect(db_path) as db:
+        db.execute("UPDATE places SET latitude = 1.0, longitude = 2.0, source = 'geocoder' WHERE state = 'bihar' AND district = 'patna'")
+        db.execute("UPDATE places SET latitude = NULL, longitude = NULL, source = 'geocoder' WHERE state = 'bihar' AND district = 'gaya'")
+    build_coordinate_store(db_path, geocode=False)
+    with sqlite3.connect(db_path) as db:
+        rows = dict(db.execute("SELECT district, source FROM places WHERE state = 'bihar' AND district IN ('patna', 'gaya')").fetchall())
+    assert rows == {"patna": "geocoder", "gaya": "gazetteer"}
@@ -0,0 +1,29 @@
+"""Tests for the image derivative resolver (cultural_canvas.images)."""
+import pytest
+
+from cultural_canvas.images import REPO_IMAGE_URL_PREFIX, image_src, load_manifest, responsive_img
+
+MANIFEST = load_manifest()
+pytestmark = pytest.mark.skipif(not MANIFEST, reason="static/img/manifest.json has not been built")
+REPO_FILE = next(iter(sorted(MANIFEST)), "")
+
+
+def test_repo_url_resolves_to_derivative():
+    assert image_src(REPO_IMAGE_URL_PREFIX + REPO_FILE).startswith("app/static/img/")
+
+def test_repo_relative_name_resolves_to_derivative():
+    assert image_src(REPO_FILE) == image_src(REPO_IMAGE_URL_PREFIX + REPO_FILE)
+
+@pytest.mark.parametrize("url", [
+    f"https://example.org/images/{REPO_FILE}",
+    f"https://raw.githubusercontent.com/someone/else/main/{REPO_FILE}",
+    f"{REPO_IMAGE_URL_PREFIX}nested/{REPO_FILE}",
+    f"/tmp/{REPO_FILE}",
+])
+def test_other_urls_with_same_file_name_are_left_alone(url):
+    assert image_src(url) == url
+    assert f'src="{url}"' in responsive_img(url)
+
+@pytest.mark.parametrize("url", [None, "", 42])
+def test_missing_urls_pass_through(url):
+    assert image_src(url) == url
@@ -0,0 +1,82 @@
+"""Tests for the LRU/TTL result cache used by parameterized queries (cultural_canvas.data.client)."""
+import pandas as pd
+
+from cultural_canvas.data import client
+from cultural_canvas.data.client import ResultCache
+
+
+def counting_fetch(calls, value):
+    def fetch():
+        calls.append(value)
+        return pd.DataFrame({"value": [value]})
+    return fetch
+
+
+def test_hit_returns_cached_copy():
+    cache, calls = ResultCache(max_entries=2, ttl=60), []
+    first = cache.get_or_fetch("a", counting_fetch(calls, 1))
+    first.loc[0, "value"] = 99  # callers may modify their copy
+    second = cache.get_or_fetch("a", counting_fetch(calls, 1))
+    assert calls == [1]
+    assert second["value"].tolist() == [1]
+
+def test_least_recently_used_entry_is_evicted():
+    cache, calls = ResultCache(max_entries=2, ttl=60), []
+    cache.get_or_fetch("a", counting_fetch(calls, "a"))
+    cache.get_or_fetch("b", counting_fetch(calls, "b"))
+    cache.get_or_fetch("a", counting_fetch(calls, "a"))  # "b" is now least recently used
+    cache.get_or_fetch("c", counting_fetch(calls, "c"))
+    assert len(cache) == 2
+    cache.get_or_fetch("a", counting_fetch(calls, "a"))
+    cache.get_or_fetch("b", counting_fetch(calls, "b"))
+    assert calls == ["a", "b", "c", "b"]
+
+def test_expired_entry_is_fetched_again(monkeypatch):
+    cache, calls = ResultCache(max_entries=2, ttl=10), []
+    now = [1000.0]
+    monkeypatch.setattr(client.time, "monotonic", lambda: now[0])
+    cache.get_or_fetch("a", counting_fetch(calls, 1))
+    now[0] += 5
+    cache.get_or_fetch("a", counting_fetch(calls, 1))
+    now[0] += 10
+    cache.get_or_fetch("a", counting_fetch(calls, 2))
+    assert calls == [1, 2]
+
+def test_errors_are_not_cached():
+    cache, calls = ResultCache(max_entries=2, ttl=60), []
+    def failing():
+        raise ConnectionError("down")
+    try:
+        cache.get_or_fetch("a", failing)
+    except ConnectionError:
+        pass
+    cache.get_or_fetch("a", counting_fetch(calls, 1))
+    assert calls == [1]
+
+
+def test_table_backed_query_is_refetched_when_its_table_changes(monkeypatch):
+    last_altered = {"UNESCO_INDIA_SITES": "2024-01-01", "CRAFT_IMAGE": "2024-01-01"}
+    fetches = []
+
+    class FakeConnection:
+        def query(self, sql, params=None, ttl=None, show_spinner=False):
+            return pd.DataFrame({"TABLE_NAME": list(last_altered), "LAST_ALTERED": list(last_altered.values())})
+
+    def fake_fetch(sql, params):
+        fetches.append(sql)
+        return pd.DataFrame({"fetch": [len(fetches)]})
+
+    monkeypatch.setattr(client, "get_connection", lambda: FakeConnection())
+    monkeypatch.setattr(client, "_fetch_pandas", fake_fetch)
+    monkeypatch.setattr(client, "_result_caches", {})
+
+    assert client.run_query("unesco_sites")["fetch"].tolist() == [1]
+    last_altered["CRAFT_IMAGE"] = "2024-02-01"  # another table: same version, still cached
+    assert client.run_query("unesco_sites")["fetch"].tolist() == [1]
+    last_altered["UNESCO_INDIA_SITES"] = "2024-02-01"
+    assert client.table_version(("UNESCO_INDIA_SITES",)) == "UNESCO_INDIA_SITES@2024-02-01"
+    assert client.run_query("unesco_sites")["fetch"].tolist() == [2]
+
+def test_unknown_tables_have_the_unknown_version(monkeypatch):
+    monkeypatch.setattr(client, "run_query", lambda name: pd.DataFrame({"TABLE_NAME": ["A"], "LAST_ALTERED": ["t"]}))
+    assert client.table_version(("MISSING",)) == client.UNKNOWN_TABLE_VERSION
@@ -0,0 +1,107 @@
+"""Tests for the catalog search indexes and highlighting (cultural_canvas.search)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from cultural_canvas.search import SearchIndex, TrigramIndex, highlight, trigrams
+
+WEIGHTS = {"name": 4.0, "state": 2.0, "description": 1.0}
+
+
+@pytest.fixture
+def index():
+    return SearchIndex(pd.DataFrame({
+        "name": ["Kathak", "Kathakali", "Madhubani", "Kerala Mural"],
+        "state": ["Uttar Pradesh", "Kerala", "Bihar", "Kerala"],
+        "description": ["Classical story dance", "Dance drama", "Folk painting, also seen in Kerala", None],
+    }), WEIGHTS)
+
+
+# --- Prefix search and ranking ---
+def test_exact_token_outranks_prefix_match(index):
+    assert index.search("kathak").tolist() == [0, 1]
+
+def test_prefix_ties_keep_catalog_order(index):
+    assert index.search("kath").tolist() == [0, 1]
+
+def test_terms_are_anded_and_scores_summed(index):
+    assert index.search("kathak dance").tolist() == [0, 1]
+    assert index.search("kerala dance").tolist() == [1]
+
+def test_rows_ranked_by_field_weights(index):
+    # name + state (6), state (2), description (1)
+    assert index.search("Kerala").tolist() == [3, 1, 2]
+
+def test_search_is_case_and_punctuation_insensitive(index):
+    assert index.search("  KATHAKALI! ").tolist() == [1]
+
+def test_no_match(index):
+    assert index.search("odissi").tolist() == []
+
+def test_empty_query_returns_every_row(index):
+    assert index.search("").tolist() == [0, 1, 2, 3]
+
+def test_limit(index):
+    assert index.search("kath", limit=1).tolist() == [0]
+
+def test_missing_field_is_ignored():
+    index = SearchIndex(pd.DataFrame({"name": ["Kathak"]}), WEIGHTS)
+    assert index.search("kathak").tolist() == [0]
+
+
+# --- Highlighting ---
+def test_match_spans_cover_prefix_matches():
+    assert SearchIndex.match_spans("kath", "Kathak and Kathakali") == [(0, 6), (11, 20)]
+
+def test_match_spans_for_several_terms():
+    assert SearchIndex.match_spans("dance folk", "Folk dance") == [(0, 4), (5, 10)]
+
+def test_match_spans_without_terms_or_text():
+    assert SearchIndex.match_spans("", "Kathak") == []
+    assert SearchIndex.match_spans("kathak", None) == []
+
+def test_highlight_wraps_spans():
+    text = "Kathak and Kathakali"
+    assert highlight(text, SearchIndex.match_spans("kath", text)) == "<mark>Kathak</mark> and <mark>Kathakali</mark>"
+
+def test_highlight_tag_and_no_spans():
+    assert highlight("Kathak dance", [(7, 12)], tag="b") == "Kathak <b>dance</b>"
+    assert highlight("Kathak dance", []) == "Kathak dance"
+
+
+# --- Trigram similarity ---
+@pytest.fixture
+def sites():
+    return TrigramIndex(pd.DataFrame({
+        "Name": ["Taj Mahal", "Hampi", "Konark Sun Temple"],
+        "City": ["Agra", "Hampi", "Konark"],
+    }), {"Name": 1.0, "City": 0.5})
+
+def test_trigrams_pad_words():
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+    assert trigrams(None) == set()
+
+def test_exact_name_scores_full_weight(sites):
+    positions, scores = sites.search("Hampi")
+    assert positions[0] == 1
+    assert scores[0] == pytest.approx(1.0)
+
+def test_misspelled_name_still_matches(sites):
+    assert sites.search("Taj Mahl")[0][0] == 0
+
+def test_partial_name_matches(sites):
+    assert sites.search("konark")[0][0] == 2
+
+def test_weaker_field_scores_at_most_its_weight(sites):
+    assert sites.scores("Agra")[0] == pytest.approx(0.5)
+
+def test_unrelated_query_returns_nothing(sites):
+    positions, scores = sites.search("Qutub Minar")
+    assert len(positions) == len(scores) == 0
+
+def test_best_match(sites):
+    assert sites.best_match("Konark Sun Temple", 0.5) == 2
+    assert sites.best_match("Qutub Minar", 0.5) is None
+
+def test_empty_query_scores_zero(sites):
+    assert np.array_equal(sites.scores(""), np.zeros(3))
@@ -0,0 +1,55 @@
+"""Tests for the grid spatial index and radius queries (cultural_canvas.spatial)."""
+import numpy as np
+import pytest
+
+from cultural_canvas.spatial import HERITAGE_POINT_COLUMNS, KM_PER_DEGREE_LAT, SpatialIndex, haversine_km, heritage_points
+
+# Taj Mahal, Agra Fort, Fatehpur Sikri, Red Fort (Delhi), Hampi, and a point without coordinates
+LATITUDES = [27.1751, 27.1795, 27.0945, 28.6562, 15.3350, np.nan]
+LONGITUDES = [78.0421, 78.0211, 77.6679, 77.2410, 76.4600, 78.0]
+
+
+@pytest.fixture
+def index():
+    return SpatialIndex(LATITUDES, LONGITUDES)
+
+
+def test_haversine_one_degree_along_the_equator():
+    assert haversine_km(0.0, 0.0, np.array([0.0]), np.array([1.0]))[0] == pytest.approx(KM_PER_DEGREE_LAT, rel=1e-4)
+
+def test_within_radius_nearest_first(index):
+    positions, distances = index.within_radius(27.1751, 78.0421, 50)
+    assert positions.tolist() == [0, 1, 2]
+    assert distances[0] == 0
+    assert list(distances) == sorted(distances)
+    assert distances[-1] <= 50
+
+def test_larger_radius_reaches_further(index):
+    assert index.within_radius(27.1751, 78.0421, 250)[0].tolist() == [0, 1, 2, 3]
+
+def test_limit(index):
+    assert index.within_radius(27.1751, 78.0421, 250, limit=2)[0].tolist() == [0, 1]
+
+def test_no_points_in_range(index):
+    positions, distances = index.within_radius(8.0, 70.0, 50)
+    assert len(positions) == len(distances) == 0
+
+def test_points_without_coordinates_are_skipped(index):
+    assert len(index) == len(LATITUDES)
+    assert 5 not in index.within_radius(27.1751, 78.0, 20000)[0]
+
+def test_matches_brute_force_across_cells():
+    rng = np.random.default_rng(7)
+    latitudes, longitudes = rng.uniform(8, 35, 2000), rng.uniform(68, 97, 2000)
+    index = SpatialIndex(latitudes, longitudes)
+    for lat, lon, radius_km in [(20.0, 78.0, 10), (27.25, 78.25, 75), (12.9, 77.6, 300), (34.9, 96.9, 120)]:
+        expected = np.flatnonzero(haversine_km(lat, lon, latitudes, longitudes) <= radius_km)
+        assert sorted(index.within_radius(lat, lon, radius_km)[0].tolist()) == expected.tolist()
+
+def test_heritage_points_layout():
+    points = heritage_points("Craft", [" Pattachitra "], [None], ["20.3"], ["not a number"])
+    assert list(points.columns) == HERITAGE_POINT_COLUMNS
+    assert points.iloc[0]["name"] == "Pattachitra"
+    assert points.iloc[0]["state"] == ""
+    assert points.iloc[0]["latitude"] == pytest.approx(20.3)
+    assert np.isnan(points.iloc[0]["longitude"])